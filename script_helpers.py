@@ -0,0 +1,145 @@
+"""
+테스트 스크립트 공용 헬퍼
+이미지 다운로드 디스크 캐시, 다운로드/테두리 탐지 파이프라인, 결과 JSON 직렬화를 제공합니다.
+"""
+
+import sys
+import os
+import hashlib
+import tempfile
+from pathlib import Path
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+# 경로 설정
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import cv2
+from handlers.image_handler import HTTP_POOL_MAXSIZE, ImageHandler
+
+# 빠른 JSON 직렬화 (선택적)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# 결과 JSON 직렬화 옵션 (기본은 압축 형식, --pretty 지정 시 들여쓰기)
+JSON_DUMP_OPTIONS = {
+    False: {'separators': (',', ':')},
+    True: {'indent': 2},
+}
+
+
+def dump_json_bytes(data, pretty=False):
+    """
+    결과 JSON을 UTF-8 바이트로 직렬화 (orjson이 있으면 사용, 없으면 표준 json)
+    
+    Args:
+        data: 직렬화할 데이터
+        pretty: True면 들여쓰기, False면 압축 형식
+        
+    Returns:
+        bytes: UTF-8 JSON 바이트
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(data, ensure_ascii=False, **JSON_DUMP_OPTIONS[pretty]).encode('utf-8')
+
+
+# 다운로드 이미지 로컬 캐시 디렉터리 (반복 실행 시 재다운로드 생략, --no-cache로 끔)
+IMAGE_CACHE_DIR = Path(__file__).resolve().parent / '.cache'
+
+
+def cached_fetch(handler, url, use_cache=True):
+    """
+    디스크 캐시를 거쳐 이미지 다운로드 (URL SHA-1 해시 → .cache/<해시>.bin)
+    
+    Args:
+        handler: ImageHandler 인스턴스
+        url: 이미지 URL
+        use_cache: False면 캐시를 읽거나 쓰지 않고 항상 새로 다운로드
+        
+    Returns:
+        bytes: 이미지 바이트
+    """
+    if not use_cache:
+        return handler.fetch_image_from_url(url)
+    
+    cache_path = IMAGE_CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.bin"
+    if cache_path.exists():
+        return cache_path.read_bytes()
+    
+    image_bytes = handler.fetch_image_from_url(url)
+    
+    # 같은 URL을 동시에 받는 경우를 대비해 임시 파일에 쓴 뒤 교체
+    IMAGE_CACHE_DIR.mkdir(exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=IMAGE_CACHE_DIR, delete=False) as tmp:
+        tmp.write(image_bytes)
+    os.replace(tmp.name, cache_path)
+    return image_bytes
+
+
+# 동시 이미지 다운로드 워커 수
+# (ImageHandler 세션의 커넥션 풀보다 많으면 keep-alive 연결이 버려지므로 풀 크기 이내로 제한)
+FETCH_MAX_WORKERS = min(16, HTTP_POOL_MAXSIZE)
+
+
+# 프로세스 풀 작업자마다 하나씩 만들어 재사용하는 ImageHandler
+_worker_handler = None
+
+
+def _init_detect_worker():
+    """
+    프로세스 풀 작업자 초기화
+    
+    프로세스 수만큼 이미 코어를 나눠 쓰므로 OpenCV 내부 스레드 풀은 1개로 고정해
+    코어 과다 할당(oversubscription)을 막고, SIMD 최적화 경로는 켜 둡니다.
+    """
+    cv2.setUseOptimized(True)
+    cv2.setNumThreads(1)
+
+
+def _detect(image_bytes):
+    """
+    프로세스 풀 작업: OpenCV 테두리 탐지 (CPU 작업이므로 GIL 없이 코어별 병렬 실행)
+    
+    Args:
+        image_bytes: 이미지 바이트
+        
+    Returns:
+        Tuple[bool, str, float]: (테두리 존재 여부, 상세 분석, 신뢰도)
+    """
+    global _worker_handler
+    if _worker_handler is None:
+        _worker_handler = ImageHandler()
+    return _worker_handler.detect_border_opencv(image_bytes)
+
+
+def fetch_and_detect(handler, urls, detect_executor, use_cache=True):
+    """
+    다운로드와 테두리 탐지를 파이프라인으로 실행
+    
+    다운로드 스레드가 이미지 하나를 받는 즉시 탐지 작업을 프로세스 풀에 제출하므로
+    다음 이미지를 받는 동안 앞 이미지의 탐지가 진행됩니다 (네트워크/CPU 작업 중첩).
+    동시 다운로드 수는 FETCH_MAX_WORKERS로 제한됩니다.
+    
+    Args:
+        handler: ImageHandler 인스턴스 (모든 다운로드 스레드가 세션 하나를 공유)
+        urls: 이미지 URL 리스트
+        detect_executor: 탐지 작업을 실행할 ProcessPoolExecutor
+        use_cache: 로컬 디스크 캐시 사용 여부
+        
+    Yields:
+        Tuple: URL 순서대로 (이미지 바이트 또는 다운로드 예외, 탐지 Future 또는 None)
+    """
+    def fetch(url):
+        try:
+            image_bytes = cached_fetch(handler, url, use_cache)
+        except Exception as e:
+            return e, None
+        return image_bytes, detect_executor.submit(_detect, image_bytes)
+    
+    with ThreadPoolExecutor(max_workers=FETCH_MAX_WORKERS) as fetcher:
+        yield from fetcher.map(fetch, urls)
@@ -0,0 +1 @@
+# Product image inspection package
@@ -7,6 +7,7 @@ import json
 import logging
 from typing import Dict, Any, Optional
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError, BotoCoreError
 
 try:
@@ -23,12 +24,54 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Bedrock Runtime 클라이언트 커넥션 풀 크기
+BEDROCK_MAX_POOL_CONNECTIONS = 32
+
+# 검수 전용 시스템 프롬프트
+INSPECTION_SYSTEM_PROMPT = """당신은 상품 이미지 검수 전문가입니다. 
+image_reader 도구를 사용하여 이미지를 분석하고, 제공된 검수 기준에 따라 정확한 판정을 내리세요.
+반드시 지정된 출력 형식을 준수해야 합니다."""
+
+
+def create_bedrock_client(aws_region: str, aws_access_key_id: Optional[str] = None,
+                          aws_secret_access_key: Optional[str] = None):
+    """
+    Bedrock Runtime 클라이언트 생성
+    
+    여러 StrandsAgent가 하나의 클라이언트를 공유하면 커넥션 풀과
+    keep-alive 연결을 함께 재사용할 수 있습니다.
+    
+    Args:
+        aws_region: AWS 리전
+        aws_access_key_id: AWS Access Key ID (선택적)
+        aws_secret_access_key: AWS Secret Access Key (선택적)
+        
+    Returns:
+        Bedrock Runtime 클라이언트
+    """
+    session_kwargs = {'region_name': aws_region}
+    if aws_access_key_id and aws_secret_access_key:
+        session_kwargs.update({
+            'aws_access_key_id': aws_access_key_id,
+            'aws_secret_access_key': aws_secret_access_key
+        })
+    
+    session = boto3.Session(**session_kwargs)
+    return session.client(
+        'bedrock-runtime',
+        config=Config(
+            max_pool_connections=BEDROCK_MAX_POOL_CONNECTIONS,
+            retries={'max_attempts': 2}
+        )
+    )
+
 
 class StrandsAgent:
     """AWS Strands Agent를 사용한 Bedrock 통합 클래스"""
     
     def __init__(self, aws_region: str, model_id: str, aws_access_key_id: Optional[str] = None, 
-                 aws_secret_access_key: Optional[str] = None, temperature: float = 0.0):
+                 aws_secret_access_key: Optional[str] = None, temperature: float = 0.0,
+                 client=None):
         """
         StrandsAgent 초기화
         
@@ -38,6 +81,7 @@ class StrandsAgent:
             aws_access_key_id: AWS Access Key ID (선택적)
             aws_secret_access_key: AWS Secret Access Key (선택적)
             temperature: 모델 온도 설정 (기본값: 0.0 - 일관된 검수 결과)
+            client: 공유할 Bedrock Runtime 클라이언트 (없으면 초기화 시 생성)
         """
         self.aws_region = aws_region
         self.model_id = model_id
@@ -46,7 +90,8 @@ class StrandsAgent:
         self.temperature = temperature
         self.agent = None
         self.bedrock_model = None
-        self.bedrock_client = None  # Fallback용
+        self.bedrock_client = client  # Fallback용
+        self._shared_client = client
         self.is_initialized = False
     
     def initialize_agent(self) -> None:
@@ -69,14 +114,15 @@ class StrandsAgent:
                 os.environ['AWS_SECRET_ACCESS_KEY'] = self.aws_secret_access_key
                 os.environ['AWS_DEFAULT_REGION'] = self.aws_region
             
-            # Bedrock Runtime 클라이언트 초기화 (dual image request용)
-            import boto3
-            self.bedrock_runtime = boto3.client(
-                'bedrock-runtime',
-                region_name=self.aws_region,
-                aws_access_key_id=self.aws_access_key_id,
-                aws_secret_access_key=self.aws_secret_access_key
-            )
+            # Bedrock Runtime 클라이언트 초기화 (dual image request 및 fallback 공용)
+            if self._shared_client is None:
+                self._shared_client = create_bedrock_client(
+                    self.aws_region,
+                    self.aws_access_key_id,
+                    self.aws_secret_access_key
+                )
+            self.bedrock_runtime = self._shared_client
+            self.bedrock_client = self._shared_client
             
             # BedrockModel 생성
             self.bedrock_model = BedrockModel(
@@ -84,28 +130,8 @@ class StrandsAgent:
                 temperature=self.temperature
             )
             
-            # 검수 전용 시스템 프롬프트
-            inspection_system_prompt = """당신은 상품 이미지 검수 전문가입니다. 
-image_reader 도구를 사용하여 이미지를 분석하고, 제공된 검수 기준에 따라 정확한 판정을 내리세요.
-반드시 지정된 출력 형식을 준수해야 합니다."""
-            
-            # Strands Agent 생성 (image_reader 도구 포함)
-            self.agent = Agent(
-                system_prompt=inspection_system_prompt,
-                tools=[image_reader],
-                model=self.bedrock_model
-            )
-            
-            # Fallback용 Bedrock 클라이언트도 생성
-            session_kwargs = {'region_name': self.aws_region}
-            if self.aws_access_key_id and self.aws_secret_access_key:
-                session_kwargs.update({
-                    'aws_access_key_id': self.aws_access_key_id,
-                    'aws_secret_access_key': self.aws_secret_access_key
-                })
-            
-            session = boto3.Session(**session_kwargs)
-            self.bedrock_client = session.client('bedrock-runtime')
+            # Strands Agent 생성 (설정 검증용, 검수 요청은 요청마다 새 Agent 사용)
+            self.agent = self._create_agent()
             
             # 자격 증명 검증
             if not self.validate_credentials():
@@ -128,6 +154,23 @@ image_reader 도구를 사용하여 이미지를 분석하고, 제공된 검수
         except Exception as e:
             raise ValueError(f"Strands Agent 초기화 실패: {str(e)}")
     
+    def _create_agent(self):
+        """
+        대화 기록이 비어 있는 Strands Agent 생성 (image_reader 도구 포함)
+        
+        Agent는 호출할 때마다 대화 기록(agent.messages)이 쌓이므로, 여러 스레드/세션이
+        하나의 Agent를 공유하면 다른 이미지의 대화 문맥이 섞입니다. 검수 요청마다
+        새 Agent를 만들고 BedrockModel(스레드 간 공유 가능한 boto3 클라이언트 보유)만 공유합니다.
+        
+        Returns:
+            Agent: 새 Strands Agent
+        """
+        return Agent(
+            system_prompt=INSPECTION_SYSTEM_PROMPT,
+            tools=[image_reader],
+            model=self.bedrock_model
+        )
+    
     def validate_credentials(self) -> bool:
         """
         AWS 자격 증명 유효성 검증
@@ -190,9 +233,9 @@ image_reader 도구를 사용하여 이미지를 분석하고, 제공된 검수
                     temp_image_path = temp_file.name
                 
                 try:
-                    # Strands Agent로 이미지 분석 요청
+                    # Strands Agent로 이미지 분석 요청 (요청마다 새 Agent → 동시 호출 간 대화 기록 분리)
                     message = f"이미지 파일: {temp_image_path}\n\n{prompt}"
-                    response = self.agent(message)
+                    response = self._create_agent()(message)
                     
                     # 응답을 표준 형식으로 변환
                     result = {
@@ -439,6 +482,32 @@ image_reader 도구를 사용하여 이미지를 분석하고, 제공된 검수
         response_body = json.loads(response['body'].read())
         return response_body['output']['message']['content'][0]['text']
     
+    def ping(self) -> bool:
+        """
+        1토큰 요청으로 Bedrock 연결을 미리 열어 둡니다 (워밍업).
+        
+        첫 검수 요청이 TCP/TLS 핸드셰이크 비용을 부담하지 않도록
+        초기화 직후 호출합니다. 실패해도 검수에는 영향이 없습니다.
+        
+        Returns:
+            bool: 워밍업 요청 성공 여부
+        """
+        if not self.bedrock_client:
+            return False
+        
+        try:
+            self.bedrock_client.converse(
+                modelId=self.model_id,
+                messages=[{"role": "user", "content": [{"text": "ping"}]}],
+                inferenceConfig={"maxTokens": 1, "temperature": 0.0}
+            )
+            logger.info(f"Bedrock 연결 워밍업 완료: {self.model_id}")
+            return True
+            
+        except Exception as e:
+            logger.warning(f"Bedrock 연결 워밍업 실패 ({self.model_id}): {str(e)}")
+            return False
+    
     def test_connection(self) -> Dict[str, Any]:
         """
         Bedrock 연결 테스트를 수행합니다.
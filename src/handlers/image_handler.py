@@ -10,11 +10,61 @@ from typing import Dict, Optional, Tuple
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ProtocolError, ReadTimeoutError, SSLError
 from PIL import Image
 import cv2
 import numpy as np
 
 
+# HTTP 커넥션 풀 설정 (호스트별 풀 개수, 풀당 최대 커넥션 수)
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 64
+# TCP/TLS 연결 수립 타임아웃 (초), 읽기 타임아웃은 ImageHandler.timeout 사용
+HTTP_CONNECT_TIMEOUT = 3
+# Content-Length 기반으로 본문 버퍼를 미리 할당할 최대 크기 (바이트)
+# 이보다 크다고 응답하면 선언된 크기를 믿지 않고 일반 스트리밍으로 읽음
+PREALLOCATE_MAX_BYTES = 32 * 1024 * 1024
+
+
+# 테두리 색상 범위 (OpenCV HSV 하한, 상한)
+BORDER_COLOR_RANGES = {
+    'blue1': [(90, 30, 30), (130, 255, 255)],  # 파란색 범위 확장
+    'blue2': [(100, 50, 50), (140, 255, 255)], # 진한 파란색
+    'cyan': [(75, 30, 30), (105, 255, 255)],   # 청록색 범위 확장
+    'red1': [(0, 50, 50), (10, 255, 255)],     # 빨간색
+    'red2': [(170, 50, 50), (180, 255, 255)],  # 빨간색2
+    'green': [(35, 50, 50), (85, 255, 255)],   # 녹색
+    'yellow': [(15, 50, 50), (45, 255, 255)],  # 노란색
+    'magenta': [(125, 50, 50), (175, 255, 255)], # 보라색
+    'orange': [(5, 50, 50), (25, 255, 255)]    # 주황색
+}
+
+
+def _build_color_luts() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    색상 범위 판정용 룩업 테이블 생성
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]:
+            (H/S/V 채널별 값 → 해당 색상 비트마스크 (3, 256),
+             비트마스크 코드 → 색상별 포함 여부 (2^색상수, 색상수))
+    """
+    levels = np.arange(256)
+    luts = np.zeros((3, 256), dtype=np.uint16)
+    for bit, (lower, upper) in enumerate(BORDER_COLOR_RANGES.values()):
+        for channel in range(3):
+            inside = (levels >= lower[channel]) & (levels <= upper[channel])
+            luts[channel, inside] |= 1 << bit
+    
+    codes = np.arange(1 << len(BORDER_COLOR_RANGES))
+    code_bits = (codes[:, None] >> np.arange(len(BORDER_COLOR_RANGES))) & 1
+    return luts, code_bits
+
+
+_COLOR_LUTS, _COLOR_CODE_BITS = _build_color_luts()
+
+
 class ImageHandler:
     """이미지 URL에서 이미지를 페치하고 처리하는 핸들러 클래스"""
     
@@ -30,6 +80,11 @@ class ImageHandler:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        
+        # 동시 다운로드 시에도 커넥션(TLS 세션)을 재사용하도록 풀 크기 확장
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     def validate_image_url(self, url: str) -> bool:
         """
@@ -69,15 +124,16 @@ class ImageHandler:
         except Exception:
             return False
     
-    def fetch_image_from_url(self, url: str) -> bytes:
+    def fetch_image_from_url(self, url: str, verify: bool = True) -> bytes:
         """
         URL에서 이미지를 페치합니다.
         
         Args:
             url: 이미지 URL
+            verify: PIL로 이미지 유효성 검증 여부 (호출자가 직접 디코딩하는 경우 False)
             
         Returns:
-            bytes: 이미지 바이트 데이터
+            bytes: 이미지 바이트 데이터 (Content-Length가 있으면 bytearray)
             
         Raises:
             ValueError: URL이 유효하지 않은 경우
@@ -88,7 +144,9 @@ class ImageHandler:
             raise ValueError(f"유효하지 않은 이미지 URL입니다: {url}")
         
         try:
-            response = self.session.get(url, timeout=self.timeout, stream=True)
+            response = self.session.get(
+                url, timeout=(min(HTTP_CONNECT_TIMEOUT, self.timeout), self.timeout), stream=True
+            )
             response.raise_for_status()
             
             # Content-Type 확인
@@ -97,18 +155,19 @@ class ImageHandler:
                 raise ValueError(f"응답이 이미지가 아닙니다. Content-Type: {content_type}")
             
             # 이미지 데이터 읽기
-            image_data = response.content
+            image_data = self._read_body(response)
             
             # 이미지 데이터가 비어있는지 확인
             if not image_data:
                 raise ValueError("이미지 데이터가 비어있습니다")
             
             # PIL로 이미지 유효성 검증
-            try:
-                with Image.open(io.BytesIO(image_data)) as img:
-                    img.verify()
-            except Exception as e:
-                raise ValueError(f"유효하지 않은 이미지 데이터입니다: {str(e)}")
+            if verify:
+                try:
+                    with Image.open(io.BytesIO(image_data)) as img:
+                        img.verify()
+                except Exception as e:
+                    raise ValueError(f"유효하지 않은 이미지 데이터입니다: {str(e)}")
             
             return image_data
             
@@ -117,17 +176,69 @@ class ImageHandler:
         except requests.exceptions.ConnectionError:
             raise requests.RequestException(f"이미지 다운로드 연결 오류: {url}")
         except requests.exceptions.HTTPError as e:
-            status_code = getattr(e.response, 'status_code', 'Unknown') if e.response else 'Unknown'
-            raise requests.RequestException(f"HTTP 오류 ({status_code}): {url}")
+            # 4xx 응답은 falsy이므로 None 여부로 판단
+            status_code = getattr(e.response, 'status_code', 'Unknown') if e.response is not None else 'Unknown'
+            raise requests.RequestException(f"HTTP 오류 ({status_code}): {url}", response=e.response)
         except requests.exceptions.RequestException as e:
             raise requests.RequestException(f"이미지 다운로드 실패: {str(e)}")
     
-    def convert_image_to_base64(self, image_bytes: bytes) -> str:
+    @staticmethod
+    def _read_body(response: requests.Response) -> bytes:
+        """
+        스트리밍 응답 본문 읽기
+        
+        Content-Length가 PREALLOCATE_MAX_BYTES 이하이고 전송 인코딩(압축)이 없으면
+        그 크기의 bytearray를 미리 잡고 소켓에서 바로 채워 청크별 bytes 생성과
+        최종 join 복사를 생략합니다. raw 소켓을 직접 읽으므로 urllib3 예외는
+        response.content와 같이 requests 예외로 변환합니다.
+        
+        Args:
+            response: stream=True로 받은 응답
+            
+        Returns:
+            bytes: 본문 바이트 (미리 할당한 경우 bytearray)
+            
+        Raises:
+            requests.exceptions.ReadTimeout: 본문 읽기 시간 초과
+            requests.exceptions.ConnectionError: 본문 수신 중 연결 오류
+        """
+        content_length = response.headers.get('content-length')
+        if (not content_length or not content_length.isdigit()
+                or int(content_length) > PREALLOCATE_MAX_BYTES
+                or response.headers.get('content-encoding')):
+            return response.content
+        
+        buffer = bytearray(int(content_length))
+        view = memoryview(buffer)
+        offset = 0
+        try:
+            while offset < len(buffer):
+                read = response.raw.readinto(view[offset:])
+                if not read:
+                    break
+                offset += read
+        except ReadTimeoutError as e:
+            raise requests.exceptions.ReadTimeout(e, response=response)
+        except SSLError as e:
+            raise requests.exceptions.SSLError(e, response=response)
+        except ProtocolError as e:
+            raise requests.exceptions.ConnectionError(e, response=response)
+        finally:
+            view.release()
+        
+        # 서버가 Content-Length보다 적게 보낸 경우 받은 만큼만 남김 (복사 없이 축소)
+        if offset < len(buffer):
+            del buffer[offset:]
+        return buffer
+    
+    def convert_image_to_base64(self, image_bytes: bytes, verify: bool = True) -> str:
         """
         이미지 바이트 데이터를 Base64 문자열로 변환합니다.
         
         Args:
             image_bytes: 이미지 바이트 데이터
+            verify: 인코딩 전 이미지 유효성 재검증 여부
+                    (이미 디코딩으로 검증된 경우 False로 PIL 재파싱 생략)
             
         Returns:
             str: Base64 인코딩된 이미지 문자열
@@ -140,16 +251,26 @@ class ImageHandler:
         
         try:
             # 이미지 유효성 재검증
-            with Image.open(io.BytesIO(image_bytes)) as img:
-                img.verify()
+            if verify:
+                with Image.open(io.BytesIO(image_bytes)) as img:
+                    img.verify()
             
             # Base64 인코딩
-            base64_string = base64.b64encode(image_bytes).decode('utf-8')
-            return base64_string
+            return self._encode_base64(image_bytes)
             
         except Exception as e:
             raise ValueError(f"이미지를 Base64로 변환하는 중 오류 발생: {str(e)}")
     
+    @staticmethod
+    def _encode_base64(image_bytes) -> str:
+        """
+        바이트 버퍼를 Base64 문자열로 인코딩
+        
+        memoryview로 넘겨 bytearray 등 버퍼 객체도 복사 없이 인코딩하고,
+        결과는 ASCII 범위이므로 UTF-8 대신 더 빠른 ASCII로 디코딩합니다.
+        """
+        return base64.b64encode(memoryview(image_bytes)).decode('ascii')
+    
     def get_image_info(self, image_bytes: bytes) -> Dict[str, any]:
         """
         이미지 바이트 데이터에서 정보를 추출합니다.
@@ -168,26 +289,131 @@ class ImageHandler:
         
         try:
             with Image.open(io.BytesIO(image_bytes)) as img:
-                info = {
-                    'width': img.width,
-                    'height': img.height,
-                    'format': img.format,
-                    'mode': img.mode,
-                    'size_bytes': len(image_bytes),
-                    'has_transparency': img.mode in ('RGBA', 'LA') or 'transparency' in img.info
-                }
+                return self._describe_image(img, len(image_bytes))
                 
-                # EXIF 데이터가 있는 경우 추가
-                if hasattr(img, '_getexif') and img._getexif():
-                    info['has_exif'] = True
-                else:
-                    info['has_exif'] = False
-                
-                return info
+        except Exception as e:
+            raise ValueError(f"이미지 정보 추출 중 오류 발생: {str(e)}")
+    
+    def get_image_size(self, image_bytes: bytes) -> Dict[str, any]:
+        """
+        이미지 크기와 형식만 빠르게 추출합니다 (EXIF/투명도 등은 확인하지 않음).
+        
+        JPEG는 SOF 마커 헤더를 직접 읽고, 그 외 형식은 PIL로 헤더만 읽습니다.
+        어느 경우에도 픽셀 디코딩은 하지 않습니다.
+        
+        Args:
+            image_bytes: 이미지 바이트 데이터
+            
+        Returns:
+            Dict: 이미지 정보 (width, height, format)
+            
+        Raises:
+            ValueError: 이미지 데이터가 유효하지 않은 경우
+        """
+        if not image_bytes:
+            raise ValueError("이미지 데이터가 비어있습니다")
+        
+        size = self._jpeg_size(image_bytes)
+        if size is not None:
+            return {'width': size[0], 'height': size[1], 'format': 'JPEG'}
+        
+        try:
+            with Image.open(io.BytesIO(image_bytes)) as img:
+                return {'width': img.width, 'height': img.height, 'format': img.format}
                 
         except Exception as e:
             raise ValueError(f"이미지 정보 추출 중 오류 발생: {str(e)}")
     
+    @classmethod
+    def _jpeg_size(cls, image_bytes: bytes) -> Optional[Tuple[int, int]]:
+        """
+        JPEG SOF 세그먼트에서 (너비, 높이) 읽기
+        
+        Args:
+            image_bytes: 이미지 바이트 데이터
+            
+        Returns:
+            Tuple[int, int]: (너비, 높이), JPEG가 아니거나 SOF를 찾지 못하면 None
+        """
+        header = cls._jpeg_sof_header(image_bytes)
+        if header is None:
+            return None
+        width, height, _ = header
+        # 높이 0은 DNL 마커로 정의되는 경우이므로 PIL에 맡김
+        return (width, height) if width and height else None
+    
+    @staticmethod
+    def _jpeg_sof_header(image_bytes: bytes) -> Optional[Tuple[int, int, int]]:
+        """
+        JPEG 마커 스트림을 순회해 SOF 세그먼트에서 (너비, 높이, 색 성분 수) 읽기
+        
+        Args:
+            image_bytes: 이미지 바이트 데이터
+            
+        Returns:
+            Tuple[int, int, int]: (너비, 높이, 성분 수), JPEG가 아니거나 SOF를 찾지 못하면 None
+        """
+        if image_bytes[:2] != b'\xff\xd8':
+            return None
+        
+        i, end = 2, len(image_bytes)
+        while i + 10 <= end:
+            if image_bytes[i] != 0xFF:
+                return None
+            marker = image_bytes[i + 1]
+            
+            # 마커 앞 채움 바이트(0xFF)
+            if marker == 0xFF:
+                i += 1
+                continue
+            
+            # SOF0~SOF15 (DHT/JPG/DAC 제외): 길이(2) + 정밀도(1) + 높이(2) + 너비(2) + 성분 수(1)
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                height = int.from_bytes(image_bytes[i + 5:i + 7], 'big')
+                width = int.from_bytes(image_bytes[i + 7:i + 9], 'big')
+                return width, height, image_bytes[i + 9]
+            
+            # 길이 필드가 없는 단독 마커 (TEM, RST0~7)
+            if marker == 0x01 or 0xD0 <= marker <= 0xD7:
+                i += 2
+                continue
+            
+            # 스캔 시작/이미지 끝까지 SOF가 없으면 중단
+            if marker in (0xD9, 0xDA):
+                return None
+            
+            i += 2 + int.from_bytes(image_bytes[i + 2:i + 4], 'big')
+        
+        return None
+    
+    def _describe_image(self, img: Image.Image, size_bytes: int) -> Dict[str, any]:
+        """
+        열린 PIL 이미지에서 정보 딕셔너리 생성
+        
+        Args:
+            img: PIL 이미지 (헤더만 읽힌 상태여도 됨)
+            size_bytes: 원본 바이트 크기
+            
+        Returns:
+            Dict: 이미지 정보 (크기, 형식, 모드 등)
+        """
+        info = {
+            'width': img.width,
+            'height': img.height,
+            'format': img.format,
+            'mode': img.mode,
+            'size_bytes': size_bytes,
+            'has_transparency': img.mode in ('RGBA', 'LA') or 'transparency' in img.info
+        }
+        
+        # EXIF 데이터가 있는 경우 추가
+        if hasattr(img, '_getexif') and img._getexif():
+            info['has_exif'] = True
+        else:
+            info['has_exif'] = False
+        
+        return info
+    
     def fetch_and_process_image(self, url: str) -> Dict[str, any]:
         """
         URL에서 이미지를 페치하고 모든 처리를 수행하는 편의 메서드
@@ -202,23 +428,133 @@ class ImageHandler:
             ValueError: URL이나 이미지가 유효하지 않은 경우
             requests.RequestException: HTTP 요청 실패
         """
-        # 이미지 페치
-        image_bytes = self.fetch_image_from_url(url)
+        return self.fetch_decode_encode(url)
+    
+    def fetch_decode_encode(self, url: str, decode_array: bool = False) -> Dict[str, any]:
+        """
+        이미지 다운로드, 디코딩, base64 인코딩을 한 번에 수행
+        
+        다운로드한 바이트 버퍼 하나로 PIL 헤더 디코딩(형식/크기 확인)과
+        base64 인코딩을 각각 한 번만 수행합니다.
+        
+        Args:
+            url: 이미지 URL
+            decode_array: OpenCV BGR 배열 디코딩 여부 (테두리 탐지에서 재사용)
+            
+        Returns:
+            Dict: {'url', 'base64', 'info', 'raw_bytes'} (+ decode_array이면 'ndarray')
+            
+        Raises:
+            ValueError: URL이나 이미지가 유효하지 않은 경우
+            requests.RequestException: HTTP 요청 실패
+        """
+        image_data = self.fetch_raw(url, decode_array=decode_array)
         
         # Base64 변환
-        base64_string = self.convert_image_to_base64(image_bytes)
+        image_data['base64'] = self._encode_base64(image_data['raw_bytes'])
+        
+        return image_data
+    
+    def fetch_raw(self, url: str, decode_array: bool = False) -> Dict[str, any]:
+        """
+        이미지 다운로드 및 디코딩 (base64 인코딩 제외)
+        
+        base64는 Bedrock 호출 직전에 convert_image_to_base64(raw_bytes, verify=False)로
+        만들면 되므로, 모델 호출 없이 끝나는 경로는 인코딩 비용을 치르지 않습니다.
+        
+        Args:
+            url: 이미지 URL
+            decode_array: OpenCV BGR 배열 디코딩 여부 (테두리 탐지에서 재사용)
+            
+        Returns:
+            Dict: {'url', 'info', 'raw_bytes'} (+ decode_array이면 'ndarray')
+            
+        Raises:
+            ValueError: URL이나 이미지가 유효하지 않은 경우
+            requests.RequestException: HTTP 요청 실패
+        """
+        # 이미지 페치 (유효성은 아래 디코딩에서 확인)
+        image_bytes = self.fetch_image_from_url(url, verify=False)
         
         # 이미지 정보 추출
-        image_info = self.get_image_info(image_bytes)
+        try:
+            with Image.open(io.BytesIO(image_bytes)) as img:
+                image_info = self._describe_image(img, len(image_bytes))
+        except Exception as e:
+            raise ValueError(f"유효하지 않은 이미지 데이터입니다: {str(e)}")
         
-        return {
+        image_data = {
             'url': url,
-            'base64': base64_string,
             'info': image_info,
             'raw_bytes': image_bytes
         }
+        
+        # 전체 픽셀 디코딩은 한 번만 수행하여 테두리 탐지와 공유
+        if decode_array:
+            image_data['ndarray'] = self._decode_bgr(image_bytes)
+        
+        return image_data
 
-    def detect_border_opencv(self, image_bytes: bytes, center_mask_ratio: float = 0.95) -> Tuple[bool, str, float]:
+    @classmethod
+    def _decode_bgr(cls, image_bytes: bytes) -> np.ndarray:
+        """
+        이미지 바이트를 OpenCV BGR 배열로 디코딩
+        
+        PIL과 같이 EXIF 회전은 적용하지 않으며, OpenCV가 지원하지 않는 형식(GIF 등)은
+        PIL로 디코딩합니다. 4성분(CMYK/YCCK, Adobe) JPEG는 OpenCV와 PIL의 색 변환
+        결과가 달라 테두리 판정이 바뀔 수 있으므로 기존과 같이 PIL로 변환합니다.
+        """
+        header = cls._jpeg_sof_header(image_bytes)
+        img_bgr = None
+        if header is None or header[2] != 4:
+            img_bgr = cv2.imdecode(
+                np.frombuffer(image_bytes, np.uint8),
+                cv2.IMREAD_COLOR | cv2.IMREAD_IGNORE_ORIENTATION
+            )
+        if img_bgr is None:
+            pil_image = Image.open(io.BytesIO(image_bytes)).convert('RGB')
+            img_bgr = cv2.cvtColor(np.asarray(pil_image), cv2.COLOR_RGB2BGR)
+        return img_bgr
+
+    @staticmethod
+    def _border_band_regions(height: int, width: int, thickness: int,
+                             center_box: Tuple[int, int, int, int]) -> list:
+        """
+        가장자리 띠를 겹치지 않는 상단/하단/좌측/우측 영역으로 분할
+        
+        Args:
+            height: 이미지 높이
+            width: 이미지 너비
+            thickness: 띠 두께 (픽셀)
+            center_box: 제외할 중앙 영역 (y, x, 높이, 너비)
+            
+        Returns:
+            list: [((행 slice, 열 slice), 중앙 영역 밖이면 True인 bool 배열), ...]
+        """
+        top_end = min(thickness, height)
+        bottom_start = max(height - thickness, top_end)
+        left_end = min(thickness, width)
+        right_start = max(width - thickness, left_end)
+        
+        bands = [
+            (slice(0, top_end), slice(0, width)),                   # 상단
+            (slice(bottom_start, height), slice(0, width)),         # 하단
+            (slice(top_end, bottom_start), slice(0, left_end)),     # 좌측
+            (slice(top_end, bottom_start), slice(right_start, width)),  # 우측
+        ]
+        
+        center_y, center_x, center_height, center_width = center_box
+        regions = []
+        for rows, cols in bands:
+            ys = np.arange(rows.start, rows.stop)[:, None]
+            xs = np.arange(cols.start, cols.stop)[None, :]
+            inside_center = ((ys >= center_y) & (ys < center_y + center_height)
+                             & (xs >= center_x) & (xs < center_x + center_width))
+            regions.append(((rows, cols), ~inside_center))
+        return regions
+
+    def detect_border_opencv(self, image_bytes: bytes, center_mask_ratio: float = 0.95,
+                             image_array: Optional[np.ndarray] = None) -> Tuple[bool, str, float]:
         """
         OpenCV를 사용한 테두리 탐지 (극단적 마스킹 적용)
 
@@ -226,22 +562,17 @@ class ImageHandler:
             image_bytes: 이미지 바이트 데이터
             center_mask_ratio: 중앙 제외 비율 (기본값: 0.95 = 중앙 95% 제외)
                               제품이 화면을 거의 꽉 채우는 경우 대비
+            image_array: 이미 디코딩된 BGR 배열 (있으면 image_bytes 디코딩 생략)
 
         Returns:
             Tuple[bool, str, float]: (테두리 존재 여부, 상세 분석, 신뢰도)
         """
-        if not image_bytes:
+        if image_array is None and not image_bytes:
             raise ValueError("이미지 데이터가 비어있습니다")
 
         try:
-            # PIL Image를 OpenCV 형식으로 변환
-            pil_image = Image.open(io.BytesIO(image_bytes))
-            if pil_image.mode != 'RGB':
-                pil_image = pil_image.convert('RGB')
-
-            # PIL을 numpy 배열로 변환 후 BGR로 변환 (OpenCV 형식)
-            img_array = np.array(pil_image)
-            img_bgr = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
+            # OpenCV로 바로 디코딩 (CMYK JPEG 등 OpenCV와 결과가 다른 형식만 PIL 사용)
+            img_bgr = image_array if image_array is not None else self._decode_bgr(image_bytes)
 
             height, width = img_bgr.shape[:2]
 
@@ -249,82 +580,68 @@ class ImageHandler:
             # 제품이 화면을 꽉 채워도 순수 배경 테두리만 분석
             border_thickness = max(3, min(width, height) // 40)  # 약 2.5%
 
-            # 가장자리 마스크 생성 (최외곽만)
-            border_mask = np.zeros((height, width), dtype=np.uint8)
-            border_mask[:border_thickness, :] = 255  # 상단
-            border_mask[-border_thickness:, :] = 255  # 하단
-            border_mask[:, :border_thickness] = 255  # 좌측
-            border_mask[:, -border_thickness:] = 255  # 우측
-            
             # 2. 중앙 영역 마스킹 (제품 영역 제외 - 거의 전체)
             # 제품이 화면 꽉 차는 경우 대비하여 중앙 거의 전체 제외
             center_width = int(width * center_mask_ratio)
             center_height = int(height * center_mask_ratio)
             center_x = (width - center_width) // 2
             center_y = (height - center_height) // 2
-            
-            # 중앙 영역을 마스크에서 제거 (0으로 설정)
-            border_mask[center_y:center_y+center_height, center_x:center_x+center_width] = 0
 
-            # 2. HSV 색공간에서 색상 분석
-            hsv = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2HSV)
-
-            # 모든 색상 범위 정의 (유채색 + 무채색)
-            color_ranges = {
-                'blue1': [(90, 30, 30), (130, 255, 255)],  # 파란색 범위 확장
-                'blue2': [(100, 50, 50), (140, 255, 255)], # 진한 파란색
-                'cyan': [(75, 30, 30), (105, 255, 255)],   # 청록색 범위 확장
-                'red1': [(0, 50, 50), (10, 255, 255)],     # 빨간색
-                'red2': [(170, 50, 50), (180, 255, 255)],  # 빨간색2
-                'green': [(35, 50, 50), (85, 255, 255)],   # 녹색
-                'yellow': [(15, 50, 50), (45, 255, 255)],  # 노란색
-                'magenta': [(125, 50, 50), (175, 255, 255)], # 보라색
-                'orange': [(5, 50, 50), (25, 255, 255)]    # 주황색
-            }
+            # 가장자리 띠(최외곽만)를 겹치지 않는 영역들로 나누고 각 영역에서 중앙 영역 제외
+            # (전체 크기 마스크를 만들고 훑는 대신 띠 부분만 슬라이싱)
+            regions = self._border_band_regions(
+                height, width, border_thickness,
+                (center_y, center_x, center_height, center_width)
+            )
 
             # 총 테두리 픽셀 수 계산 (먼저 계산해야 함!)
-            total_border_pixels = np.sum(border_mask > 0)
+            total_border_pixels = sum(int(np.count_nonzero(keep)) for _, keep in regions)
+            if total_border_pixels == 0:
+                return False, "특별한 테두리 패턴 없음", 0.0
 
-            # 무채색 (흰색, 검은색, 회색) 별도 처리
-            gray = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2GRAY)
-
-            # 밝은 테두리 (흰색, 밝은 회색) 탐지
-            white_mask = cv2.inRange(gray, 200, 255)
-            white_border_pixels = np.sum(cv2.bitwise_and(white_mask, border_mask) > 0)
-            white_ratio = white_border_pixels / total_border_pixels if total_border_pixels > 0 else 0
+            # 2. HSV 색공간에서 색상 분석
+            # 전체 이미지가 아닌 테두리 픽셀만 HSV로 변환
+            border_pixels = np.concatenate(
+                [img_bgr[rows, cols][keep] for (rows, cols), keep in regions]
+            ).reshape(-1, 1, 3)
+            hsv = cv2.cvtColor(border_pixels, cv2.COLOR_BGR2HSV).reshape(-1, 3)
 
-            # 어두운 테두리 (검은색, 어두운 회색) 탐지
-            black_mask = cv2.inRange(gray, 0, 50)
-            black_border_pixels = np.sum(cv2.bitwise_and(black_mask, border_mask) > 0)
-            black_ratio = black_border_pixels / total_border_pixels if total_border_pixels > 0 else 0
+            # 모든 색상 범위를 한 번에 판정
+            # 채널별 룩업 테이블로 픽셀마다 해당 색상 비트를 구한 뒤,
+            # 비트 코드 빈도수로 색상별 픽셀 수를 계산 (색상마다 이미지를 다시 훑지 않음)
+            codes = (_COLOR_LUTS[0, hsv[:, 0]]
+                     & _COLOR_LUTS[1, hsv[:, 1]]
+                     & _COLOR_LUTS[2, hsv[:, 2]])
+            color_counts = np.bincount(codes, minlength=_COLOR_CODE_BITS.shape[0]) @ _COLOR_CODE_BITS
 
             detected_colors = []
 
             # 유채색 탐지 (더 엄격한 기준)
-            for color_name, (lower, upper) in color_ranges.items():
-                mask = cv2.inRange(hsv, np.array(lower), np.array(upper))
-                border_color_pixels = np.sum(cv2.bitwise_and(mask, border_mask) > 0)
-
-                if total_border_pixels > 0:
-                    ratio = border_color_pixels / total_border_pixels
-                    # 20% ~ 95% 범위만 테두리로 판단
-                    # - 20% 미만: 너무 적음 (노이즈)
-                    # - 95% 이상: 제품 자체 색상 (테두리 아님)
-                    if 0.20 < ratio < 0.95:
-                        detected_colors.append((color_name, ratio))
-
-            # 무채색 탐지 비활성화 (너무 민감해서 자연 배경도 잡음)
+            for color_name, border_color_pixels in zip(BORDER_COLOR_RANGES, color_counts):
+                ratio = border_color_pixels / total_border_pixels
+                # 20% ~ 95% 범위만 테두리로 판단
+                # - 20% 미만: 너무 적음 (노이즈)
+                # - 95% 이상: 제품 자체 색상 (테두리 아님)
+                if 0.20 < ratio < 0.95:
+                    detected_colors.append((color_name, float(ratio)))
+
+            # 무채색(흰색/검은색) 탐지 비활성화 (너무 민감해서 자연 배경도 잡음)
             # 유채색 테두리만 탐지하도록 함
-            # if white_ratio > 0.95:  # 비활성화
-            #     detected_colors.append(('white', white_ratio))
-            # if black_ratio > 0.95:  # 비활성화
-            #     detected_colors.append(('black', black_ratio))
 
             # 3. 엣지 검출로 강한 경계선 찾기
+            # (Canny는 주변 픽셀이 필요하므로 전체 그레이스케일 이미지에서 한 번만 수행)
             gray = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2GRAY)
             edges = cv2.Canny(gray, 50, 150)
-            border_edges = cv2.bitwise_and(edges, border_mask)
-            edge_ratio = np.sum(border_edges > 0) / total_border_pixels if total_border_pixels > 0 else 0
+            # 띠 영역별로 중앙 제외 마스크(bool → 0/1 uint8 뷰, 복사 없음)와 AND 후 개수 세기
+            # (불리언 인덱싱으로 임시 배열을 만들지 않고 OpenCV SIMD 경로 사용)
+            border_edge_pixels = 0
+            for (rows, cols), keep in regions:
+                band_edges = edges[rows, cols]
+                if band_edges.size:
+                    border_edge_pixels += cv2.countNonZero(
+                        cv2.bitwise_and(band_edges, keep.view(np.uint8))
+                    )
+            edge_ratio = border_edge_pixels / total_border_pixels
 
             # 4. 판정 로직 (색상 + 엣지 조합)
             has_border = False
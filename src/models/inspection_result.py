@@ -8,7 +8,7 @@ from typing import Dict, Any
 import json
 
 
-@dataclass
+@dataclass(slots=True)
 class InspectionResult:
     """
     Represents the result of a product image inspection.
@@ -5,6 +5,7 @@ Prompt version management system
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Optional
+import hashlib
 import json
 
 
@@ -17,6 +18,7 @@ class PromptVersion:
     created_at: datetime
     description: str = ""
     is_active: bool = False
+    prompt_hash: str = ""  # prompt_text 해시 (캐시 식별자)
 
 
 class PromptVersionManager:
@@ -993,7 +995,9 @@ FORMAT:
             prompt_text=prompt_text,
             created_at=datetime.now(),
             description=description,
-            is_active=is_active
+            is_active=is_active,
+            # 호출마다 프롬프트 전체를 해싱하지 않도록 등록 시 한 번만 계산
+            prompt_hash=hashlib.blake2b(prompt_text.encode('utf-8'), digest_size=16).hexdigest()
         )
         
         self.versions[version] = prompt_version
@@ -1021,6 +1025,28 @@ FORMAT:
             return self.versions[self.active_version].prompt_text
         return None
     
+    def get_prompt(self, version: str) -> Optional[str]:
+        """
+        특정 버전의 프롬프트 반환 (활성 버전을 변경하지 않음)
+        
+        여러 검수가 동시에 실행될 때 set_active_version 전역 변경으로 인한
+        프롬프트 경합이 없도록 버전을 명시적으로 지정해 조회합니다.
+        """
+        prompt_version = self.versions.get(version)
+        return prompt_version.prompt_text if prompt_version else None
+    
+    def get_prompt_key(self, version: str) -> str:
+        """
+        캐시 키용 프롬프트 식별자 반환 ('버전@본문해시')
+        
+        버전 문자열만 키로 쓰면 버전을 올리지 않고 프롬프트를 수정했을 때
+        이전 응답이 재사용되므로 프롬프트 본문 해시를 함께 포함합니다.
+        """
+        prompt_version = self.versions.get(version)
+        if prompt_version is None:
+            return version
+        return f"{version}@{prompt_version.prompt_hash}"
+    
     def get_active_version_info(self) -> Optional[PromptVersion]:
         """현재 활성 버전 정보 반환"""
         if self.active_version and self.active_version in self.versions:
@@ -1049,7 +1075,8 @@ FORMAT:
                 'prompt_text': prompt_version.prompt_text,
                 'created_at': prompt_version.created_at.isoformat(),
                 'description': prompt_version.description,
-                'is_active': prompt_version.is_active
+                'is_active': prompt_version.is_active,
+                'prompt_hash': prompt_version.prompt_hash
             }
         
         return json.dumps(data, ensure_ascii=False, indent=2)
@@ -5,17 +5,56 @@ AI 모델의 응답을 파싱하여 구조화된 데이터로 변환합니다.
 
 import re
 import logging
+from functools import lru_cache
 from typing import Tuple, Dict, Any, Optional
 from datetime import datetime
 
 # 데이터 모델 import
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from models.inspection_result import InspectionResult
+from src.models.inspection_result import InspectionResult
 
 logger = logging.getLogger(__name__)
 
+# 파싱 결과 캐시 크기 (동일한 응답 텍스트 재파싱 방지)
+PARSE_CACHE_SIZE = 4096
+
+# Claude 내부 메시지 패턴 (모듈 로드 시 한 번만 컴파일)
+_INTERNAL_MESSAGE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE | re.DOTALL)
+    for pattern in (
+        r"이미지를 분석하기 위해.*?불러오겠습니다\.?",
+        r"먼저 이미지를.*?불러오겠습니다\.?",
+        r"이미지 파일을.*?읽겠습니다\.?",
+        r"Tool #\d+:.*?\n",
+        r"<thinking>.*?</thinking>",
+    )
+)
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# 사유 정리용 패턴
+_LEADING_DASH_PATTERN = re.compile(r'^[-\s]*')
+_TRAILING_DOT_PATTERN = re.compile(r'[.\s]*$')
+_BOOL_WORD_PATTERN = re.compile(r'\b(true|false)\b', re.IGNORECASE)
+
+# 강한 부정 신호들 (정확한 매칭)
+STRONG_NEGATIVE_PATTERNS = (
+    '부적합', '실패했', '위반', '테두리가 있', '문제가 있',
+    'failed', 'violation', 'inappropriate', 'has border'
+)
+
+# 강한 긍정 신호들
+STRONG_POSITIVE_PATTERNS = (
+    '통과', '문제없', '문제가 없', '기준 충족', '깔끔',
+    'clean', 'meets', 'criteria', 'appropriate', 'no border'
+)
+
+# 부정/긍정 신호를 한 번의 스캔으로 찾는 통합 패턴 (부정 신호를 앞에 두어 같은 위치에서 우선 매칭)
+_INFERENCE_PATTERN = re.compile(
+    '|'.join(
+        [f'(?P<neg{i}>{re.escape(p)})' for i, p in enumerate(STRONG_NEGATIVE_PATTERNS)]
+        + [f'(?P<pos{i}>{re.escape(p)})' for i, p in enumerate(STRONG_POSITIVE_PATTERNS)]
+    )
+)
+
 
 class ResultParser:
     """AI 응답 파싱 클래스"""
@@ -23,12 +62,12 @@ class ResultParser:
     def __init__(self):
         """ResultParser 초기화"""
         # 결과 파싱을 위한 정규식 패턴
-        self.result_pattern = re.compile(r'결과\s*:\s*(true|false)', re.IGNORECASE)
-        self.reason_pattern = re.compile(r'사유\s*:\s*(.+?)(?=\n|$)', re.IGNORECASE | re.DOTALL)
+        # (한국어/영어 키워드를 하나의 패턴으로 통합하여 한 번만 스캔)
+        self.result_pattern = re.compile(r'(?:결과|result)\s*:\s*(true|false)', re.IGNORECASE)
+        self.reason_pattern = re.compile(r'(?:사유|reason)\s*:\s*(.+?)(?=\n|$)', re.IGNORECASE | re.DOTALL)
         
-        # 영어 패턴도 지원
-        self.result_pattern_en = re.compile(r'result\s*:\s*(true|false)', re.IGNORECASE)
-        self.reason_pattern_en = re.compile(r'reason\s*:\s*(.+?)(?=\n|$)', re.IGNORECASE | re.DOTALL)
+        # 동일 텍스트에 대한 파싱 결과 캐시
+        self._extract_cached = lru_cache(maxsize=PARSE_CACHE_SIZE)(self._extract_result_and_reason)
     
     def parse_ai_response(self, response: Dict[str, Any], image_url: str = "", 
                          processing_time: float = 0.0, model_id: str = "", 
@@ -80,6 +119,7 @@ class ResultParser:
     def extract_result_and_reason(self, text: str) -> Tuple[bool, str]:
         """
         텍스트에서 결과(true/false)와 사유를 추출합니다.
+        동일한 텍스트는 캐시된 결과를 반환합니다.
         
         Args:
             text: 파싱할 텍스트
@@ -93,43 +133,38 @@ class ResultParser:
         if not text or not isinstance(text, str):
             raise ValueError("유효하지 않은 텍스트입니다")
         
+        return self._extract_cached(text)
+    
+    def _extract_result_and_reason(self, text: str) -> Tuple[bool, str]:
+        """extract_result_and_reason의 실제 파싱 로직 (캐시 미적용)"""
         # 텍스트 정리 및 Claude 내부 메시지 제거
         cleaned_text = text.strip()
         
         # Claude 내부 메시지 패턴 제거
-        internal_messages = [
-            r"이미지를 분석하기 위해.*?불러오겠습니다\.?",
-            r"먼저 이미지를.*?불러오겠습니다\.?",
-            r"이미지 파일을.*?읽겠습니다\.?",
-            r"Tool #\d+:.*?\n",
-            r"<thinking>.*?</thinking>",
-        ]
-        
-        for pattern in internal_messages:
-            cleaned_text = re.sub(pattern, "", cleaned_text, flags=re.IGNORECASE | re.DOTALL)
+        for pattern in _INTERNAL_MESSAGE_PATTERNS:
+            cleaned_text = pattern.sub("", cleaned_text)
         
         # 연속된 공백과 줄바꿈 정리
-        cleaned_text = re.sub(r'\s+', ' ', cleaned_text).strip()
+        cleaned_text = _WHITESPACE_PATTERN.sub(' ', cleaned_text).strip()
+        
+        # 대소문자 무시 검색용 소문자 사본 (한 번만 생성하여 하위 메서드에 전달)
+        cleaned_lower = cleaned_text.lower()
         
-        # 결과 추출 (한국어 우선, 영어 fallback)
+        # 결과 추출 (한국어/영어 중 먼저 나오는 항목)
         result_match = self.result_pattern.search(cleaned_text)
-        if not result_match:
-            result_match = self.result_pattern_en.search(cleaned_text)
         
         if not result_match:
             # 패턴이 없는 경우 대안적 방법 시도
-            result = self._extract_result_alternative(cleaned_text)
+            result = self._extract_result_alternative(cleaned_text, cleaned_lower)
             if result is None:
                 # 스마트 파싱: AI 응답 내용을 분석해서 결과 추정
-                result = self._smart_result_inference(cleaned_text)
+                result = self._smart_result_inference(cleaned_text, cleaned_lower)
         else:
             result_str = result_match.group(1).lower()
             result = result_str == 'true'
         
-        # 사유 추출 (한국어 우선, 영어 fallback)
+        # 사유 추출 (한국어/영어 중 먼저 나오는 항목)
         reason_match = self.reason_pattern.search(cleaned_text)
-        if not reason_match:
-            reason_match = self.reason_pattern_en.search(cleaned_text)
         
         if not reason_match:
             # 패턴이 없는 경우 대안적 방법 시도
@@ -175,6 +210,18 @@ class ResultParser:
         Returns:
             str: 추출된 텍스트
         """
+        # 빠른 경로: Anthropic 응답 형식 (content[0]이 text 항목)
+        try:
+            item = response['content'][0]
+            if item['type'] == 'text':
+                return item['text']
+        except (KeyError, TypeError, IndexError):
+            pass
+        
+        return self._extract_text_slow(response)
+    
+    def _extract_text_slow(self, response: Dict[str, Any]) -> str:
+        """_extract_text_from_response의 일반 경로 (모든 응답 형식 처리)"""
         # 문자열인 경우
         if isinstance(response, str):
             return response
@@ -201,17 +248,19 @@ class ResultParser:
         # 기타 타입은 문자열로 변환
         return str(response)
     
-    def _extract_result_alternative(self, text: str) -> Optional[bool]:
+    def _extract_result_alternative(self, text: str, text_lower: Optional[str] = None) -> Optional[bool]:
         """
         대안적 방법으로 결과를 추출합니다.
         
         Args:
             text: 파싱할 텍스트
+            text_lower: 소문자로 변환된 text (없으면 내부에서 생성)
             
         Returns:
             Optional[bool]: 추출된 결과, 실패시 None
         """
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         
         # true/false 단어 직접 검색 (명확한 경우만)
         if 'true' in text_lower and 'false' not in text_lower:
@@ -243,8 +292,7 @@ class ResultParser:
                     return line
         
         # 전체 텍스트에서 결과 부분 제거 후 나머지 반환
-        result_removed = re.sub(r'결과\s*:\s*(true|false)', '', text, flags=re.IGNORECASE)
-        result_removed = re.sub(r'result\s*:\s*(true|false)', '', result_removed, flags=re.IGNORECASE)
+        result_removed = self.result_pattern.sub('', text)
         
         cleaned = result_removed.strip()
         if cleaned and len(cleaned) > 5:  # 최소 길이 체크 완화
@@ -253,42 +301,29 @@ class ResultParser:
         # 마지막 수단: 전체 텍스트 반환
         return text[:200] if text else "AI 응답을 파싱할 수 없습니다"
     
-    def _smart_result_inference(self, text: str) -> bool:
+    def _smart_result_inference(self, text: str, text_lower: Optional[str] = None) -> bool:
         """
         AI 응답 내용을 분석해서 결과를 추정합니다.
         
         Args:
             text: 분석할 텍스트
+            text_lower: 소문자로 변환된 text (없으면 내부에서 생성)
             
         Returns:
             bool: 추정된 결과
         """
-        text_lower = text.lower()
-        
-        # 강한 부정 신호들 (정확한 매칭)
-        strong_negative_patterns = [
-            '부적합', '실패했', '위반', '테두리가 있', '문제가 있',
-            'failed', 'violation', 'inappropriate', 'has border'
-        ]
-        
-        # 강한 긍정 신호들
-        strong_positive_patterns = [
-            '통과', '문제없', '문제가 없', '기준 충족', '깔끔',
-            'clean', 'meets', 'criteria', 'appropriate', 'no border'
-        ]
-        
-        # 강한 부정 신호 체크 (정확한 매칭)
-        for neg in strong_negative_patterns:
-            if neg in text_lower:
-                return False
+        if text_lower is None:
+            text_lower = text.lower()
         
-        # 강한 긍정 신호 체크
-        for pos in strong_positive_patterns:
-            if pos in text_lower:
-                return True
+        # 부정/긍정 신호를 한 번에 스캔 - 부정 신호가 하나라도 있으면 False 우선
+        has_positive = False
+        for match in _INFERENCE_PATTERN.finditer(text_lower):
+            if match.lastgroup.startswith('neg'):
+                return False
+            has_positive = True
         
-        # 둘 다 없으면 보수적으로 False
-        return False
+        # 긍정 신호만 있으면 True, 둘 다 없으면 보수적으로 False
+        return has_positive
     
     def _clean_reason_text(self, reason: str) -> str:
         """
@@ -307,11 +342,11 @@ class ResultParser:
         cleaned = reason.strip()
         
         # 불필요한 문자 제거
-        cleaned = re.sub(r'^[-\s]*', '', cleaned)  # 앞의 대시나 공백
-        cleaned = re.sub(r'[.\s]*$', '', cleaned)  # 뒤의 점이나 공백
+        cleaned = _LEADING_DASH_PATTERN.sub('', cleaned)  # 앞의 대시나 공백
+        cleaned = _TRAILING_DOT_PATTERN.sub('', cleaned)  # 뒤의 점이나 공백
         
         # 요구사항에 따라 true/false 단어 제거
-        cleaned = re.sub(r'\b(true|false)\b', '', cleaned, flags=re.IGNORECASE)
+        cleaned = _BOOL_WORD_PATTERN.sub('', cleaned)
         cleaned = cleaned.strip()
         
         # 빈 문자열인 경우 기본값 반환
@@ -337,20 +372,18 @@ class ResultParser:
         Returns:
             list[InspectionResult]: 파싱된 결과 리스트
         """
-        results = []
-        
-        for i, response in enumerate(responses):
+        def parse_one(i: int) -> InspectionResult:
+            response = responses[i]
             try:
                 image_url = image_urls[i] if image_urls and i < len(image_urls) else ""
                 processing_time = processing_times[i] if processing_times and i < len(processing_times) else 0.0
                 
-                result = self.parse_ai_response(response, image_url, processing_time)
-                results.append(result)
+                return self.parse_ai_response(response, image_url, processing_time)
                 
             except Exception as e:
                 logger.error(f"배치 파싱 중 오류 (인덱스 {i}): {str(e)}")
                 # 오류 발생시 기본값으로 결과 생성
-                error_result = InspectionResult(
+                return InspectionResult(
                     image_url=image_urls[i] if image_urls and i < len(image_urls) else "",
                     result=False,
                     reason=f"파싱 오류: {str(e)}",
@@ -358,6 +391,6 @@ class ResultParser:
                     processing_time=0.0,
                     raw_response=str(response)
                 )
-                results.append(error_result)
         
-        return results
\ No newline at end of file
+        # 정규식 파싱은 CPU 작업(GIL 보유)이므로 스레드 없이 순서대로 처리
+        return [parse_one(i) for i in range(len(responses))]
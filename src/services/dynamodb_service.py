@@ -5,21 +5,77 @@ DynamoDB service for storing inspection results
 import boto3
 import json
 import logging
-from datetime import datetime
+import queue
+import random
+import threading
+from concurrent.futures import Future, wait
+from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
+from boto3.dynamodb.types import TypeDeserializer
 from botocore.exceptions import ClientError
-import uuid
-import sys
-import os
-from decimal import Decimal
+import secrets
+import math
+import time
+from decimal import Context, Decimal
+from functools import lru_cache
 
-# 절대 import를 위한 경로 설정
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-from models.inspection_result import InspectionResult
+from src.models.inspection_result import InspectionResult
 
 logger = logging.getLogger(__name__)
 
+# BatchWriteItem 한 번에 보낼 수 있는 최대 항목 수
+BATCH_WRITE_SIZE = 25
+# 처리되지 않은 항목(UnprocessedItems) 재시도 횟수
+BATCH_WRITE_MAX_RETRIES = 5
+# 버퍼에 쌓인 항목을 강제로 flush 하기까지의 최대 대기 시간 (초)
+# (단건 저장은 기다리지 않고 이미 쌓인 항목과 함께 바로 저장)
+BATCH_FLUSH_INTERVAL = 0.2
+# 쓰기 용량 초과로 재시도할 오류 코드
+_THROTTLING_ERROR_CODES = ('ProvisionedThroughputExceededException', 'ThrottlingException')
+
+# 처리 시간 Decimal 변환용 정밀도 (마이크로초 단위)
+_TIME_QUANT = Decimal('0.000001')
+_DECIMAL_CTX = Context(prec=20)
+
+# 최근 검수 목록 조회용 GSI (date_bucket 파티션 + timestamp 정렬)
+RECENT_INDEX_NAME = 'by-date'
+DATE_BUCKET_FORMAT = '%Y-%m-%d'
+
+
+def _backoff_delay(attempt: int) -> float:
+    """BatchWriteItem 재시도 대기 시간 (지수 백오프 + 전체 지터)"""
+    return random.uniform(0, 0.05 * (2 ** attempt))
+
+
+def _to_decimal(value: float) -> Decimal:
+    """Float → Decimal 변환 (문자열 변환 없이, NaN/inf는 0으로 처리)"""
+    if not math.isfinite(value):
+        return Decimal(0)
+    return _DECIMAL_CTX.create_decimal_from_float(value).quantize(_TIME_QUANT)
+
+
+# 조회 결과(DynamoDB JSON) → Python 값 변환용
+_DESERIALIZER = TypeDeserializer()
+
+
+@lru_cache(maxsize=4)
+def _get_dynamodb_client(region: str):
+    """
+    리전별 DynamoDB 저수준 클라이언트 반환 (프로세스 내 공유)
+    
+    botocore 서비스 모델 로딩과 커넥션 풀 생성을 서비스 인스턴스마다
+    반복하지 않도록 하나의 클라이언트를 재사용합니다.
+    리소스와 달리 클라이언트는 스레드 간 공유가 안전하므로
+    백그라운드 쓰기 스레드와 Streamlit 요청 스레드가 함께 사용합니다.
+    """
+    session = boto3.session.Session()
+    return session.client('dynamodb', region_name=region)
+
+
+def _deserialize_item(item: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """DynamoDB JSON 형식 항목을 Python 값으로 변환"""
+    return {key: _DESERIALIZER.deserialize(value) for key, value in item.items()}
+
 
 class DynamoDBService:
     """DynamoDB 서비스 클래스"""
@@ -34,16 +90,22 @@ class DynamoDBService:
         """
         self.region = region
         self.table_name = table_name
-        self.dynamodb = boto3.resource('dynamodb', region_name=region)
-        self.table = None
+        self.client = _get_dynamodb_client(region)
+        self.is_initialized = False
+        
+        # 백그라운드 일괄 저장용 큐 (항목, Future)
+        self._write_queue: "queue.Queue[tuple]" = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
         
     def initialize(self) -> bool:
         """DynamoDB 테이블 초기화 및 생성"""
         try:
             # 테이블 존재 확인
-            self.table = self.dynamodb.Table(self.table_name)
-            self.table.load()
+            self.client.describe_table(TableName=self.table_name)
+            self.is_initialized = True
             logger.info(f"DynamoDB 테이블 '{self.table_name}' 연결 성공")
+            self._ensure_writer()
             return True
             
         except ClientError as e:
@@ -57,7 +119,7 @@ class DynamoDBService:
     def _create_table(self) -> bool:
         """DynamoDB 테이블 생성"""
         try:
-            table = self.dynamodb.create_table(
+            self.client.create_table(
                 TableName=self.table_name,
                 KeySchema=[
                     {
@@ -69,14 +131,36 @@ class DynamoDBService:
                     {
                         'AttributeName': 'inspection_id',
                         'AttributeType': 'S'
+                    },
+                    {
+                        'AttributeName': 'date_bucket',
+                        'AttributeType': 'S'
+                    },
+                    {
+                        'AttributeName': 'timestamp',
+                        'AttributeType': 'S'
+                    }
+                ],
+                GlobalSecondaryIndexes=[
+                    {
+                        'IndexName': RECENT_INDEX_NAME,
+                        'KeySchema': [
+                            {'AttributeName': 'date_bucket', 'KeyType': 'HASH'},
+                            {'AttributeName': 'timestamp', 'KeyType': 'RANGE'}
+                        ],
+                        'Projection': {
+                            'ProjectionType': 'INCLUDE',
+                            'NonKeyAttributes': ['image_url', 'result', 'model_id']
+                        }
                     }
                 ],
                 BillingMode='PAY_PER_REQUEST'  # On-demand 요금제
             )
             
             # 테이블 생성 완료 대기
-            table.wait_until_exists()
-            self.table = table
+            self.client.get_waiter('table_exists').wait(TableName=self.table_name)
+            self.is_initialized = True
+            self._ensure_writer()
             
             logger.info(f"DynamoDB 테이블 '{self.table_name}' 생성 완료")
             return True
@@ -89,51 +173,25 @@ class DynamoDBService:
         """
         검수 결과를 DynamoDB에 저장
         
+        백그라운드 쓰기 스레드에 항목을 넘기고 저장이 끝날 때까지 기다립니다.
+        단건 저장은 BATCH_FLUSH_INTERVAL 동안 다른 항목을 모으지 않고 바로 저장합니다.
+        
         Args:
             result: 저장할 검수 결과
             
         Returns:
             str: 저장된 항목의 ID, 실패시 None
         """
+        if not self.is_initialized:
+            logger.error("DynamoDB 테이블이 초기화되지 않았습니다")
+            return None
+        
+        future = self._enqueue_item(self._build_item(result), flush_now=True)
+        
         try:
-            logger.info(f"DynamoDB 저장 시작: {result.image_url}")
-            
-            # 테이블 상태 확인
-            if not self.table:
-                logger.error("DynamoDB 테이블이 초기화되지 않았습니다")
-                return None
-            
-            # 고유 ID 생성
-            inspection_id = str(uuid.uuid4())
-            logger.info(f"생성된 검수 ID: {inspection_id}")
-            
-            # DynamoDB 항목 생성
-            item = {
-                'inspection_id': inspection_id,
-                'image_url': result.image_url,
-                'result': result.result,
-                'reason': result.reason,
-                'processing_time': Decimal(str(result.processing_time)),  # Float → Decimal 변환
-                'model_id': result.model_id,
-                'prompt_version': result.prompt_version,  # 프롬프트 버전 추가
-                'timestamp': result.timestamp.isoformat(),
-                'raw_response': result.raw_response,
-                'created_at': datetime.now().isoformat()
-            }
-            
-            logger.info(f"저장할 항목: {item}")
-            
-            # DynamoDB에 저장
-            response = self.table.put_item(Item=item)
-            logger.info(f"DynamoDB 응답: {response}")
-            
-            # 저장 확인
-            if response.get('ResponseMetadata', {}).get('HTTPStatusCode') == 200:
-                logger.info(f"검수 결과 저장 완료: {inspection_id}")
-                return inspection_id
-            else:
-                logger.error(f"DynamoDB 저장 실패: {response}")
-                return None
+            inspection_id = future.result()
+            logger.info(f"검수 결과 저장 완료: {inspection_id}")
+            return inspection_id
             
         except ClientError as e:
             logger.error(f"DynamoDB ClientError: {e.response['Error']['Code']} - {e.response['Error']['Message']}")
@@ -142,6 +200,166 @@ class DynamoDBService:
             logger.error(f"DynamoDB 저장 실패: {str(e)}")
             return None
     
+    def submit_inspection_result(self, result: InspectionResult) -> Optional[Future]:
+        """
+        검수 결과를 백그라운드 저장 큐에 추가 (대기하지 않음)
+        
+        Args:
+            result: 저장할 검수 결과
+            
+        Returns:
+            Future: 저장 완료 시 검수 ID를 반환하는 Future, 테이블 미초기화 시 None
+        """
+        if not self.is_initialized:
+            logger.error("DynamoDB 테이블이 초기화되지 않았습니다")
+            return None
+        
+        return self._enqueue_item(self._build_item(result))
+    
+    def _build_item(self, result: InspectionResult) -> Dict[str, Dict[str, Any]]:
+        """
+        검수 결과를 DynamoDB JSON(AttributeValue) 형식 항목으로 변환
+        
+        항목 구조가 고정되어 있으므로 중간 dict나 타입별 직렬화 없이
+        필드를 바로 AttributeValue로 채웁니다.
+        """
+        return {
+            'inspection_id': {'S': secrets.token_hex(16)},
+            'image_url': {'S': result.image_url},
+            'result': {'BOOL': result.result},
+            'reason': {'S': result.reason},
+            'processing_time': {'N': str(_to_decimal(result.processing_time))},  # Float → Decimal 변환
+            'model_id': {'S': result.model_id},
+            'prompt_version': {'S': result.prompt_version},  # 프롬프트 버전 추가
+            'timestamp': {'S': result.timestamp.isoformat()},
+            'date_bucket': {'S': result.timestamp.strftime(DATE_BUCKET_FORMAT)},  # 최근 목록 GSI 파티션
+            'raw_response': {'S': result.raw_response},
+            'created_at': {'S': datetime.now().isoformat()}
+        }
+    
+    def _ensure_writer(self) -> None:
+        """백그라운드 쓰기 스레드 시작 (최초 1회)"""
+        with self._writer_lock:
+            if self._writer_thread is None or not self._writer_thread.is_alive():
+                self._writer_thread = threading.Thread(
+                    target=self._writer_loop, name="dynamodb-writer", daemon=True
+                )
+                self._writer_thread.start()
+    
+    def _enqueue_item(self, item: Dict[str, Any], flush_now: bool = False) -> Future:
+        """
+        항목을 저장 큐에 추가하고 검수 ID를 반환할 Future 반환
+        
+        Args:
+            item: 저장할 DynamoDB JSON 형식 항목
+            flush_now: True면 BATCH_FLUSH_INTERVAL 대기 없이 바로 저장
+        """
+        self._ensure_writer()
+        future: Future = Future()
+        self._write_queue.put((item, future, flush_now))
+        return future
+    
+    def _writer_loop(self) -> None:
+        """
+        큐에서 최대 BATCH_WRITE_SIZE개 또는 BATCH_FLUSH_INTERVAL초 동안 항목을 모아
+        BatchWriteItem 한 번으로 저장하고 Future를 완료합니다.
+        바로 저장할 항목(flush_now)이 들어오면 이미 쌓인 항목만 모아 즉시 저장합니다.
+        """
+        while True:
+            batch = [self._write_queue.get()]
+            flush_now = batch[0][2]
+            deadline = time.monotonic() + BATCH_FLUSH_INTERVAL
+            
+            while len(batch) < BATCH_WRITE_SIZE:
+                remaining = 0 if flush_now else deadline - time.monotonic()
+                try:
+                    if remaining <= 0:
+                        entry = self._write_queue.get_nowait()
+                    else:
+                        entry = self._write_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(entry)
+                flush_now = flush_now or entry[2]
+            
+            try:
+                unprocessed_ids = self._write_items([item for item, _, _ in batch])
+                
+                # 재시도 후에도 남은 항목만 실패 처리 (나머지는 저장 완료)
+                for item, future, _ in batch:
+                    inspection_id = item['inspection_id']['S']
+                    if inspection_id in unprocessed_ids:
+                        future.set_exception(ClientError(
+                            {'Error': {'Code': 'UnprocessedItems',
+                                       'Message': f"재시도 후에도 저장되지 않았습니다: {inspection_id}"}},
+                            'BatchWriteItem'
+                        ))
+                    else:
+                        future.set_result(inspection_id)
+                
+                if unprocessed_ids:
+                    logger.error(f"백그라운드 일괄 저장 일부 실패: {len(unprocessed_ids)}/{len(batch)}개 항목")
+                else:
+                    logger.info(f"백그라운드 일괄 저장 완료: {len(batch)}개 항목")
+                
+            except Exception as e:
+                logger.error(f"백그라운드 일괄 저장 실패: {str(e)}")
+                for _, future, _ in batch:
+                    future.set_exception(e)
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+    
+    def _write_items(self, items: List[Dict[str, Any]]) -> set:
+        """
+        저수준 클라이언트 BatchWriteItem으로 항목 저장 (25개 단위)
+        
+        Table.batch_writer()와 같이 UnprocessedItems를 자동 재시도하되,
+        지수 백오프(지터 포함)를 두고 끝내 남은 항목만 골라 반환합니다.
+        
+        Args:
+            items: 저장할 DynamoDB JSON 형식 항목 리스트
+            
+        Returns:
+            set: 재시도 후에도 저장하지 못한 항목의 inspection_id 집합
+            
+        Raises:
+            ClientError: 쓰기 용량 초과가 재시도 후에도 계속되거나 그 밖의 오류가 난 경우
+        """
+        unprocessed_ids = set()
+        
+        for start in range(0, len(items), BATCH_WRITE_SIZE):
+            request_items = {
+                self.table_name: [
+                    {'PutRequest': {'Item': item}}
+                    for item in items[start:start + BATCH_WRITE_SIZE]
+                ]
+            }
+            
+            for attempt in range(BATCH_WRITE_MAX_RETRIES + 1):
+                try:
+                    response = self.client.batch_write_item(RequestItems=request_items)
+                except ClientError as e:
+                    # 쓰기 용량 초과는 전체 요청을 백오프 후 재시도
+                    if (e.response['Error']['Code'] not in _THROTTLING_ERROR_CODES
+                            or attempt == BATCH_WRITE_MAX_RETRIES):
+                        raise
+                    time.sleep(_backoff_delay(attempt))
+                    continue
+                
+                request_items = response.get('UnprocessedItems') or {}
+                if not request_items:
+                    break
+                # 처리되지 않은 항목은 지수 백오프 후 재시도
+                time.sleep(_backoff_delay(attempt))
+            else:
+                unprocessed_ids.update(
+                    request['PutRequest']['Item']['inspection_id']['S']
+                    for request in request_items.get(self.table_name, [])
+                )
+        
+        return unprocessed_ids
+    
     def save_batch_results(self, results: List[Dict[str, Any]]) -> List[str]:
         """
         일괄 검수 결과를 DynamoDB에 저장
@@ -152,36 +370,43 @@ class DynamoDBService:
         Returns:
             List[str]: 저장된 항목들의 ID 리스트
         """
-        saved_ids = []
+        items = []
         
-        try:
-            with self.table.batch_writer() as batch:
-                for result in results:
-                    if result.get('success', False):
-                        inspection_id = str(uuid.uuid4())
-                        
-                        item = {
-                            'inspection_id': inspection_id,
-                            'image_url': result['url'],
-                            'result': result['result'],
-                            'reason': result['reason'],
-                            'processing_time': Decimal(str(result['processing_time'])),  # Float → Decimal 변환
-                            'model_id': result.get('model_id', ''),
-                            'prompt_version': result.get('prompt_version', ''),  # 프롬프트 버전 추가
-                            'timestamp': datetime.now().isoformat(),
-                            'created_at': datetime.now().isoformat(),
-                            'batch_processing': True
-                        }
-                        
-                        batch.put_item(Item=item)
-                        saved_ids.append(inspection_id)
-            
-            logger.info(f"일괄 검수 결과 저장 완료: {len(saved_ids)}개 항목")
-            return saved_ids
-            
-        except ClientError as e:
-            logger.error(f"일괄 저장 실패: {str(e)}")
-            return saved_ids
+        # 일괄 저장 항목은 같은 저장 시각을 공유
+        now = datetime.now()
+        timestamp = now.isoformat()
+        date_bucket = now.strftime(DATE_BUCKET_FORMAT)
+        
+        for result in results:
+            if result.get('success', False):
+                items.append({
+                    'inspection_id': {'S': secrets.token_hex(16)},
+                    'image_url': {'S': result['url']},
+                    'result': {'BOOL': result['result']},
+                    'reason': {'S': result['reason']},
+                    'processing_time': {'N': str(_to_decimal(result['processing_time']))},  # Float → Decimal 변환
+                    'model_id': {'S': result.get('model_id', '')},
+                    'prompt_version': {'S': result.get('prompt_version', '')},  # 프롬프트 버전 추가
+                    'timestamp': {'S': timestamp},
+                    'date_bucket': {'S': date_bucket},  # 최근 목록 GSI 파티션
+                    'created_at': {'S': timestamp},
+                    'batch_processing': {'BOOL': True}
+                })
+        
+        if not items:
+            return []
+        
+        # 백그라운드 쓰기 스레드에 모두 넘긴 뒤 완료 대기
+        futures = [self._enqueue_item(item) for item in items]
+        wait(futures)
+        
+        saved_ids = [future.result() for future in futures if future.exception() is None]
+        failed = len(futures) - len(saved_ids)
+        if failed:
+            logger.error(f"일괄 저장 실패: {failed}개 항목")
+        
+        logger.info(f"일괄 검수 결과 저장 완료: {len(saved_ids)}개 항목")
+        return saved_ids
     
     def get_inspection_result(self, inspection_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -194,11 +419,13 @@ class DynamoDBService:
             Dict: 검수 결과, 없으면 None
         """
         try:
-            response = self.table.get_item(
-                Key={'inspection_id': inspection_id}
+            response = self.client.get_item(
+                TableName=self.table_name,
+                Key={'inspection_id': {'S': inspection_id}}
             )
             
-            return response.get('Item')
+            item = response.get('Item')
+            return _deserialize_item(item) if item else None
             
         except ClientError as e:
             logger.error(f"검수 결과 조회 실패: {str(e)}")
@@ -208,10 +435,11 @@ class DynamoDBService:
         """DynamoDB 연결 및 테이블 상태 테스트"""
         try:
             # 테이블 정보 조회 (올바른 메서드명)
-            table_info = self.table.meta.client.describe_table(TableName=self.table_name)
+            table_info = self.client.describe_table(TableName=self.table_name)
             
             # 간단한 항목 개수 조회
-            response = self.table.scan(
+            response = self.client.scan(
+                TableName=self.table_name,
                 Select='COUNT'
             )
             
@@ -231,28 +459,90 @@ class DynamoDBService:
                 'region': self.region
             }
     
-    def list_recent_inspections(self, limit: int = 50) -> List[Dict[str, Any]]:
+    def list_recent_inspections(self, limit: int = 50, lookback_days: int = 7) -> List[Dict[str, Any]]:
         """
         최근 검수 결과 목록 조회
         
+        날짜별 GSI(by-date)를 최신 날짜부터 역순으로 Query 하여
+        테이블 전체를 Scan 하지 않고 최신 항목만 읽습니다.
+        GSI 프로젝션은 INCLUDE(image_url, result, model_id)에 키 속성
+        (inspection_id, date_bucket, timestamp)이 더해진 형태이므로,
+        반환 항목에는 이 속성만 들어 있습니다 (reason, raw_response 등은
+        get_inspection_result로 조회).
+        
+        GSI에서 limit개를 채우지 못하면 date_bucket이 없는 기존 항목과
+        lookback_days보다 오래된 항목을 Scan 한 페이지(Limit=limit)로 보충합니다.
+        테이블 전체를 읽지 않으므로 보충 항목이 가장 최근 항목이라는 보장은 없습니다.
+        
         Args:
             limit: 조회할 최대 개수
+            lookback_days: 조회할 최대 일수 (오늘 포함)
             
         Returns:
-            List[Dict]: 검수 결과 리스트
+            List[Dict]: 검수 결과 리스트 (최신순)
         """
+        items: List[Dict[str, Any]] = []
+        today = datetime.now()
+        oldest_bucket = (today - timedelta(days=lookback_days - 1)).strftime(DATE_BUCKET_FORMAT)
+        
         try:
-            response = self.table.scan(
-                Limit=limit,
-                ProjectionExpression='inspection_id, image_url, #result, #timestamp, model_id',
-                ExpressionAttributeNames={
-                    '#result': 'result',
-                    '#timestamp': 'timestamp'
-                }
-            )
+            for days_ago in range(lookback_days):
+                date_bucket = (today - timedelta(days=days_ago)).strftime(DATE_BUCKET_FORMAT)
+                response = self.client.query(
+                    TableName=self.table_name,
+                    IndexName=RECENT_INDEX_NAME,
+                    KeyConditionExpression='date_bucket = :date_bucket',
+                    ExpressionAttributeValues={':date_bucket': {'S': date_bucket}},
+                    ScanIndexForward=False,
+                    Limit=limit - len(items)
+                )
+                items.extend(_deserialize_item(item) for item in response.get('Items', []))
+                
+                if len(items) >= limit:
+                    return items
+            
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ValidationException':
+                # GSI가 없는 기존 테이블은 Scan으로 대체
+                logger.warning(f"'{RECENT_INDEX_NAME}' 인덱스가 없어 Scan으로 조회합니다")
+                return self._scan_recent_inspections(limit)
+            logger.error(f"검수 목록 조회 실패: {str(e)}")
+            return []
+        
+        # GSI에 없는 항목(date_bucket 없는 기존 항목, 조회 기간 이전 항목)으로 보충
+        older_items = self._scan_recent_inspections(limit, before_bucket=oldest_bucket)
+        return items + older_items[:limit - len(items)]
+    
+    def _scan_recent_inspections(self, limit: int, before_bucket: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Scan 기반 최근 목록 조회
+        
+        Args:
+            limit: 조회할 최대 개수
+            before_bucket: 지정하면 date_bucket이 없거나 이 날짜보다 이전인 항목만 반환
+                (FilterExpression은 읽은 뒤 거르므로 결과가 limit보다 적을 수 있음)
+            
+        Returns:
+            List[Dict]: 검수 결과 리스트 (최신순)
+        """
+        scan_kwargs: Dict[str, Any] = {
+            'TableName': self.table_name,
+            'Limit': limit,
+            'ProjectionExpression': 'inspection_id, image_url, #result, #timestamp, model_id',
+            'ExpressionAttributeNames': {
+                '#result': 'result',
+                '#timestamp': 'timestamp'
+            }
+        }
+        if before_bucket is not None:
+            scan_kwargs['FilterExpression'] = 'attribute_not_exists(date_bucket) OR date_bucket < :oldest'
+            scan_kwargs['ExpressionAttributeValues'] = {':oldest': {'S': before_bucket}}
+        
+        try:
+            response = self.client.scan(**scan_kwargs)
             
             # 타임스탬프 기준 정렬
-            items = response.get('Items', [])
+            items = [_deserialize_item(item) for item in response.get('Items', [])]
             items.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
             
             return items
@@ -2,29 +2,52 @@
 Hybrid Inspection Service: Nova Pro + Claude fallback for border detection
 """
 
+import asyncio
 import logging
+import re
 import time
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 import os
 
 # 필요한 모듈들 import
-import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-from agents.strands_agent import StrandsAgent
-from handlers.image_handler import ImageHandler
-from parsers.result_parser import ResultParser
-from models.inspection_result import InspectionResult
-from models.app_config import AppConfig
-from models.prompt_version import PromptVersionManager
+from src.agents.strands_agent import StrandsAgent, create_bedrock_client
+from src.handlers.image_handler import ImageHandler
+from src.parsers.result_parser import ResultParser
+from src.models.inspection_result import InspectionResult
+from src.models.app_config import AppConfig
+from src.models.prompt_version import PromptVersionManager
 
 # DynamoDB 서비스 import
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '.'))
-from dynamodb_service import DynamoDBService
+from src.services.dynamodb_service import DynamoDBService
+from src.services.llm_cache import shared_llm_cache
 
 logger = logging.getLogger(__name__)
 
+# 이 길이 미만의 짧고 불확실/테두리 표현이 없는 true 판정은 Nova Pro 결과를 신뢰
+SHORT_REASON_TRUST_LENGTH = 80
+
+# Nova Pro 결과 신뢰 판단용 키워드 패턴
+_BORDER_RE = re.compile(
+    "테두리|윤곽선|경계선|네모|라인|border|frame|outline|boundary|edge|line",
+    re.IGNORECASE
+)
+_CLEAN_RE = re.compile(
+    "테두리가 전혀 없|border가 전혀 없|완전히 깨끗한|전혀 문제없",
+    re.IGNORECASE
+)
+_UNCERTAIN_RE = re.compile(
+    r"unclear|모호|불확실|\bpossibly\b|\bmay\b|\bmight\b|아마",
+    re.IGNORECASE
+)
+
+# Nova Pro / Claude 모델 호출용 워커 스레드 수
+MODEL_CALL_MAX_WORKERS = 8
+
+# '1'이면 Nova Pro와 Claude를 동시에 호출 (재검수 지연 감소, 대신 모든 이미지에 Claude 비용 발생)
+SPECULATIVE_RECHECK_ENV_VAR = 'HYBRID_SPECULATIVE_RECHECK'
+
 
 class HybridInspectionService:
     """Nova Pro + Claude 하이브리드 검수 서비스"""
@@ -51,9 +74,24 @@ class HybridInspectionService:
         self.result_parser = ResultParser()
         self.prompt_manager = PromptVersionManager()
         self.dynamodb_service = DynamoDBService(config.aws_region)
+        self.llm_cache = shared_llm_cache
         self.is_initialized = False
         
-        # 프롬프트 설정
+        # 재검수를 생략해 Claude 호출을 실제로 아낀 횟수 (임계값 튜닝용, 선행 호출 모드에서는 집계하지 않음)
+        self.recheck_skipped_count = 0
+        
+        # Claude 선행 호출 여부 (기본은 Nova Pro 결과를 본 뒤 필요할 때만 호출)
+        self.speculative_recheck = os.getenv(SPECULATIVE_RECHECK_ENV_VAR) == '1'
+        
+        # 모델 호출 전용 스레드 풀
+        # (asyncio 기본 executor와 달리 asyncio.run 종료 시 버려진 Claude 호출을 기다리지 않음)
+        self._executor = ThreadPoolExecutor(max_workers=MODEL_CALL_MAX_WORKERS)
+        
+        # 프롬프트 설정 (프롬프트 본문과 캐시 키용 식별자는 initialize에서 조회)
+        self._nova_prompt = None
+        self._claude_prompt = None
+        self._nova_prompt_key = None
+        self._claude_prompt_key = None
         self._setup_prompts()
     
     def _setup_prompts(self):
@@ -74,12 +112,20 @@ class HybridInspectionService:
     async def initialize(self) -> bool:
         """서비스 초기화"""
         try:
+            # Nova Pro / Claude가 공유할 Bedrock 클라이언트 (커넥션 풀 재사용)
+            bedrock_client = create_bedrock_client(
+                self.config.aws_region,
+                self.config.aws_access_key_id,
+                self.config.aws_secret_access_key
+            )
+            
             # Nova Pro Agent 초기화
             self.nova_agent = StrandsAgent(
                 aws_region=self.config.aws_region,
                 model_id=self.nova_model_id,
                 aws_access_key_id=self.config.aws_access_key_id,
-                aws_secret_access_key=self.config.aws_secret_access_key
+                aws_secret_access_key=self.config.aws_secret_access_key,
+                client=bedrock_client
             )
             self.nova_agent.initialize_agent()
             
@@ -88,13 +134,26 @@ class HybridInspectionService:
                 aws_region=self.config.aws_region,
                 model_id=self.claude_model_id,
                 aws_access_key_id=self.config.aws_access_key_id,
-                aws_secret_access_key=self.config.aws_secret_access_key
+                aws_secret_access_key=self.config.aws_secret_access_key,
+                client=bedrock_client
             )
             self.claude_agent.initialize_agent()
             
+            # 모델별 프롬프트는 초기화 시 한 번만 조회하여 보관
+            self._nova_prompt = self._get_prompt(self.nova_prompt_version)
+            self._claude_prompt = self._get_prompt(self.claude_prompt_version)
+            self._nova_prompt_key = self.prompt_manager.get_prompt_key(self.nova_prompt_version)
+            self._claude_prompt_key = self.prompt_manager.get_prompt_key(self.claude_prompt_version)
+            
             # DynamoDB 서비스 초기화
             self.dynamodb_service.initialize()
             
+            # 첫 검수 요청의 연결 지연을 없애기 위해 두 모델 연결 워밍업
+            await asyncio.gather(
+                asyncio.to_thread(self.nova_agent.ping),
+                asyncio.to_thread(self.claude_agent.ping)
+            )
+            
             self.is_initialized = True
             logger.info("하이브리드 검수 서비스 초기화 완료")
             return True
@@ -103,10 +162,71 @@ class HybridInspectionService:
             logger.error(f"하이브리드 검수 서비스 초기화 실패: {str(e)}")
             return False
     
+    async def validate_service_health_async(self) -> Dict[str, Any]:
+        """
+        Nova Pro / Claude 연결 상태를 동시에 점검합니다.
+        
+        Returns:
+            Dict: 서비스 상태 정보
+        """
+        health_status = {
+            "service_initialized": self.is_initialized,
+            "timestamp": datetime.now().isoformat(),
+            "components": {}
+        }
+        
+        agents = {"nova_agent": self.nova_agent, "claude_agent": self.claude_agent}
+        
+        async def check(agent: Optional[StrandsAgent]) -> Dict[str, Any]:
+            if agent is None:
+                return {"status": "not_initialized", "details": "Agent가 초기화되지 않았습니다"}
+            agent_test = await asyncio.to_thread(agent.test_connection)
+            return {
+                "status": "healthy" if agent_test.get("success") else "unhealthy",
+                "details": agent_test
+            }
+        
+        try:
+            statuses = await asyncio.gather(*[check(agent) for agent in agents.values()])
+            health_status["components"] = dict(zip(agents.keys(), statuses))
+            
+            all_healthy = all(comp["status"] == "healthy" for comp in statuses)
+            health_status["overall_status"] = "healthy" if all_healthy and self.is_initialized else "unhealthy"
+            
+        except Exception as e:
+            health_status["overall_status"] = "error"
+            health_status["error"] = str(e)
+        
+        return health_status
+    
+    def validate_service_health(self) -> Dict[str, Any]:
+        """validate_service_health_async의 동기 래퍼"""
+        return asyncio.run(self.validate_service_health_async())
+    
     def inspect_image(self, image_url: str) -> InspectionResult:
+        """
+        하이브리드 이미지 검수 (동기 래퍼)
+        
+        Args:
+            image_url: 검수할 이미지 URL
+            
+        Returns:
+            InspectionResult: 검수 결과
+        """
+        return asyncio.run(self.inspect_image_async(image_url))
+    
+    async def inspect_image_async(self, image_url: str) -> InspectionResult:
         """
         하이브리드 이미지 검수
         
+        기본은 Nova Pro로 1차 검수한 뒤 재검수가 필요할 때만 Claude를 호출합니다
+        (재검수 시 지연 시간 = 두 호출 시간의 합, Claude 비용은 재검수 건에만 발생).
+        
+        HYBRID_SPECULATIVE_RECHECK=1이면 Claude를 Nova Pro와 동시에 시작해
+        재검수 지연 시간을 두 호출 시간의 최댓값으로 줄입니다. 이미 실행 중인
+        스레드 호출은 취소할 수 없으므로 Nova Pro 결과를 신뢰하는 경우에도
+        Claude 호출 비용과 모델 호출 워커 점유가 그대로 발생합니다.
+        
         Args:
             image_url: 검수할 이미지 URL
             
@@ -116,37 +236,67 @@ class HybridInspectionService:
         if not self.is_initialized:
             raise RuntimeError("서비스가 초기화되지 않았습니다")
         
-        start_time = time.time()
+        start_time = time.perf_counter()
+        
+        loop = asyncio.get_running_loop()
+        claude_task = None
         
         try:
+            # 이미지는 한 번만 다운로드하여 두 모델이 공유
+            image_base64, media_type = await self._prepare_image_async(image_url)
+            
+            nova_task = loop.run_in_executor(
+                self._executor, self._inspect_with_nova,
+                image_url, image_base64, media_type
+            )
+            if self.speculative_recheck:
+                # Claude 재검수를 미리 시작 (Nova Pro 결과를 신뢰하면 결과만 버림)
+                logger.info(f"1차 검수 시작 (Nova Pro) + 재검수 선행 시작 (Claude): {image_url}")
+                claude_task = loop.run_in_executor(
+                    self._executor, self._inspect_with_claude,
+                    image_url, image_base64, media_type
+                )
+            else:
+                logger.info(f"1차 검수 시작 (Nova Pro): {image_url}")
+            
             # 1단계: Nova Pro로 1차 검수
-            logger.info(f"1차 검수 시작 (Nova Pro): {image_url}")
-            nova_result = self._inspect_with_nova(image_url)
+            nova_result = await nova_task
             
             # 2단계: 재검수 필요성 판단
             needs_recheck = self._needs_claude_recheck(nova_result)
             
             if needs_recheck:
-                # 3단계: Claude로 재검수
-                logger.info(f"재검수 시작 (Claude): {image_url}")
-                claude_result = self._inspect_with_claude(image_url)
+                # 3단계: Claude 재검수 (선행 시작했으면 결과 대기)
+                if claude_task is None:
+                    logger.info(f"재검수 시작 (Claude): {image_url}")
+                    claude_task = loop.run_in_executor(
+                        self._executor, self._inspect_with_claude,
+                        image_url, image_base64, media_type
+                    )
+                else:
+                    logger.info(f"재검수 결과 대기 (Claude): {image_url}")
+                claude_result = await claude_task
                 
                 # 4단계: 최종 결과 결정
-                final_result = self._merge_results(nova_result, claude_result)
-                final_result.reason += f" [하이브리드: Nova→Claude 재검수]"
+                final_result = self._decide_and_merge(nova_result, claude_result)
                 
             else:
-                # Nova Pro 결과 그대로 사용
-                final_result = nova_result
-                final_result.reason += f" [하이브리드: Nova Pro 단독]"
+                # Nova Pro 결과 그대로 사용 (선행 시작한 Claude 호출은 결과만 버려짐)
+                if claude_task is not None:
+                    claude_task.cancel()
+                else:
+                    self.recheck_skipped_count += 1
+                final_result = self._decide_and_merge(nova_result)
             
             # 처리 시간 업데이트
-            final_result.processing_time = time.time() - start_time
+            final_result.processing_time = time.perf_counter() - start_time
             
             logger.info(f"하이브리드 검수 완료: {image_url} -> {final_result.result}")
             return final_result
             
         except Exception as e:
+            if claude_task is not None:
+                claude_task.cancel()
             logger.error(f"하이브리드 검수 실패: {str(e)}")
             # 오류 시 기본 결과 반환
             return InspectionResult(
@@ -154,28 +304,53 @@ class HybridInspectionService:
                 result=False,
                 reason=f"검수 오류: {str(e)}",
                 timestamp=datetime.now(),
-                processing_time=time.time() - start_time,
+                processing_time=time.perf_counter() - start_time,
                 raw_response="",
                 model_id="hybrid-error",
                 prompt_version="error"
             )
     
-    def _inspect_with_nova(self, image_url: str) -> InspectionResult:
-        """Nova Pro로 검수"""
-        # 이미지 다운로드 및 처리
-        image_data = self.image_handler.fetch_and_process_image(image_url)
-        image_base64 = image_data['base64']
-        media_type = image_data['info']['format'].lower()
+    def _get_prompt(self, version: str) -> str:
+        """
+        특정 버전의 프롬프트 반환
         
-        # Nova Pro 프롬프트 가져오기
-        self.prompt_manager.set_active_version(self.nova_prompt_version)
-        nova_prompt = self.prompt_manager.get_active_prompt()
+        Nova Pro와 Claude 검수가 동시에 실행되므로 공유 상태인
+        활성 버전을 바꾸지 않고 버전별 프롬프트를 직접 조회합니다.
+        """
+        prompt = self.prompt_manager.get_prompt(version)
+        if prompt is None:
+            raise ValueError(f"프롬프트 버전을 찾을 수 없습니다: {version}")
+        return prompt
+    
+    def _prepare_image(self, image_url: str) -> Tuple[str, str]:
+        """
+        이미지 다운로드 및 base64 인코딩
         
+        Args:
+            image_url: 이미지 URL
+            
+        Returns:
+            Tuple[str, str]: (base64 이미지, media type)
+        """
+        image_data = self.image_handler.fetch_decode_encode(image_url)
+        media_type = image_data['info']['format'].lower()
+        return image_data['base64'], f"image/{media_type}"
+    
+    async def _prepare_image_async(self, image_url: str) -> Tuple[str, str]:
+        """
+        _prepare_image를 이벤트 루프 밖(스레드)에서 실행
+        
+        HTTP 다운로드, PIL 디코딩, base64 인코딩이 이벤트 루프를 막지 않도록 합니다.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._prepare_image, image_url)
+    
+    def _inspect_with_nova(self, image_url: str, image_base64: str, media_type: str) -> InspectionResult:
+        """Nova Pro로 검수"""
         # Nova Pro로 검수
-        ai_response = self.nova_agent.send_inspection_request(
-            image_base64=image_base64,
-            prompt=nova_prompt,
-            media_type=f"image/{media_type}"
+        ai_response = self._send_cached(
+            self.nova_agent, self.nova_model_id, self._nova_prompt_key,
+            image_base64, self._nova_prompt, media_type
         )
         
         # 결과 파싱
@@ -189,22 +364,12 @@ class HybridInspectionService:
         
         return result
     
-    def _inspect_with_claude(self, image_url: str) -> InspectionResult:
+    def _inspect_with_claude(self, image_url: str, image_base64: str, media_type: str) -> InspectionResult:
         """Claude로 검수"""
-        # 이미지 다운로드 및 처리
-        image_data = self.image_handler.fetch_and_process_image(image_url)
-        image_base64 = image_data['base64']
-        media_type = image_data['info']['format'].lower()
-        
-        # Claude 프롬프트 가져오기
-        self.prompt_manager.set_active_version(self.claude_prompt_version)
-        claude_prompt = self.prompt_manager.get_active_prompt()
-        
         # Claude로 검수
-        ai_response = self.claude_agent.send_inspection_request(
-            image_base64=image_base64,
-            prompt=claude_prompt,
-            media_type=f"image/{media_type}"
+        ai_response = self._send_cached(
+            self.claude_agent, self.claude_model_id, self._claude_prompt_key,
+            image_base64, self._claude_prompt, media_type
         )
         
         # 결과 파싱
@@ -218,6 +383,27 @@ class HybridInspectionService:
         
         return result
     
+    def _send_cached(self, agent: StrandsAgent, model_id: str, prompt_key: str,
+                     image_base64: str, prompt: str, media_type: str) -> Dict[str, Any]:
+        """
+        LLM 응답 캐시를 거쳐 검수 요청 전송
+        
+        동일 이미지 + 프롬프트(버전 + 본문 해시) + 모델 조합은 캐시된 응답을 재사용합니다.
+        temperature가 0보다 크면 응답이 결정적이지 않으므로 캐시하지 않습니다.
+        """
+        def send():
+            return agent.send_inspection_request(
+                image_base64=image_base64,
+                prompt=prompt,
+                media_type=media_type
+            )
+        
+        if agent.temperature > 0:
+            return send()
+        
+        key = self.llm_cache.make_key(image_base64, prompt_key, model_id)
+        return self.llm_cache.get_or_set(key, send)
+    
     def _needs_claude_recheck(self, nova_result: InspectionResult) -> bool:
         """
         Claude 재검수 필요성 판단 (보수적 접근)
@@ -229,23 +415,22 @@ class HybridInspectionService:
         Returns:
             bool: 재검수 필요 여부
         """
-        reason_lower = nova_result.reason.lower()
+        reason = nova_result.reason
         
         # Nova Pro를 신뢰할 수 있는 명확한 경우들 (재검수 불필요)
         trust_nova_conditions = [
             # 1. Nova Pro가 명확하게 테두리를 발견하고 false로 판정한 경우
-            nova_result.result == False and any(keyword in reason_lower for keyword in [
-                # 한글 테두리 키워드
-                "테두리", "윤곽선", "경계선", "네모", "라인",
-                # 영어 테두리 키워드  
-                "border", "frame", "outline", "boundary", "edge", "line"
-            ]),
+            #    (한글/영어 테두리 키워드)
+            nova_result.result == False and _BORDER_RE.search(reason) is not None,
             
             # 2. Nova Pro가 매우 확실한 표현으로 true 판정한 경우 (매우 제한적)
-            nova_result.result == True and any(phrase in reason_lower for phrase in [
-                # 매우 확실한 표현만
-                "테두리가 전혀 없", "border가 전혀 없", "완전히 깨끗한", "전혀 문제없"
-            ])
+            nova_result.result == True and _CLEAN_RE.search(reason) is not None,
+            
+            # 3. 짧고 불확실한 표현이 없는 true 판정
+            #    (테두리를 언급하면 짧더라도 판정과 사유가 어긋날 수 있으므로 제외)
+            nova_result.result == True and len(reason) < SHORT_REASON_TRUST_LENGTH
+            and _UNCERTAIN_RE.search(reason) is None
+            and _BORDER_RE.search(reason) is None
         ]
         
         # Nova Pro를 신뢰할 수 있으면 재검수 불필요
@@ -259,18 +444,26 @@ class HybridInspectionService:
             logger.info(f"Claude 재검수 필요 (보수적 접근): {nova_result.reason[:50]}...")
             return True
     
-    def _merge_results(self, nova_result: InspectionResult, claude_result: InspectionResult) -> InspectionResult:
+    def _decide_and_merge(self, nova_result: InspectionResult,
+                          claude_result: Optional[InspectionResult] = None) -> InspectionResult:
         """
-        Nova Pro와 Claude 결과 병합
+        최종 결과 결정 및 사유 태그 부착
+        
+        Claude 결과가 있으면 Claude 결과를 우선시하고(더 정확한 테두리 탐지),
+        없으면 Nova Pro 결과를 그대로 사용합니다. 사유 조각은 리스트에 모아
+        마지막에 한 번만 결합합니다.
         
         Args:
             nova_result: Nova Pro 결과
-            claude_result: Claude 결과
+            claude_result: Claude 재검수 결과 (재검수를 생략했으면 None)
             
         Returns:
             InspectionResult: 최종 결과
         """
-        # Claude 결과를 우선시 (더 정확한 테두리 탐지)
+        if claude_result is None:
+            nova_result.reason = " ".join((nova_result.reason, "[하이브리드: Nova Pro 단독]"))
+            return nova_result
+        
         final_result = claude_result
         
         # 메타데이터 업데이트
@@ -278,7 +471,12 @@ class HybridInspectionService:
         final_result.prompt_version = f"hybrid({self.nova_prompt_version}→{self.claude_prompt_version})"
         
         # 상세 사유 추가
+        reason_parts = [claude_result.reason]
         if nova_result.result != claude_result.result:
-            final_result.reason += f" [Nova Pro: {nova_result.result}, Claude: {claude_result.result} - Claude 우선 적용]"
+            reason_parts.append(
+                f"[Nova Pro: {nova_result.result}, Claude: {claude_result.result} - Claude 우선 적용]"
+            )
+        reason_parts.append("[하이브리드: Nova→Claude 재검수]")
+        final_result.reason = " ".join(reason_parts)
         
         return final_result
@@ -3,30 +3,53 @@
 전체 검수 워크플로우를 관리합니다.
 """
 
+import asyncio
 import logging
 import time
 from typing import Dict, Any, Optional
 from datetime import datetime
 import os
 
-# 필요한 모듈들 import
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import requests
 
-from agents.strands_agent import StrandsAgent
-from handlers.image_handler import ImageHandler
-from parsers.result_parser import ResultParser
-from models.inspection_result import InspectionResult
-from models.app_config import AppConfig
-from models.prompt_version import PromptVersionManager
+# 필요한 모듈들 import
+from src.agents.strands_agent import StrandsAgent, create_bedrock_client
+from src.handlers.image_handler import ImageHandler
+from src.parsers.result_parser import ResultParser
+from src.models.inspection_result import InspectionResult
+from src.models.app_config import AppConfig
+from src.models.prompt_version import PromptVersionManager
 
 # DynamoDB 서비스 import
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '.'))
-from dynamodb_service import DynamoDBService
+from src.services.dynamodb_service import DynamoDBService
+from src.services.llm_cache import LLMCache, shared_llm_cache
 
 logger = logging.getLogger(__name__)
 
+# 영구 실패(잘못된 URL, 4xx) URL 음성 캐시 크기 및 만료 시간 (초)
+URL_ERROR_CACHE_SIZE = 5000
+URL_ERROR_CACHE_TTL = 300
+
+# 기본 검수 프롬프트 (요구사항에 명시된 프롬프트)
+_DEFAULT_INSPECTION_PROMPT = """당신은 상품 이미지 검수 전문가입니다. 상품 외 배경만 검수합니다. 아래 기준에 따라 이미지를 객관적으로 평가하세요:
+
+1. 상품 외 배경에 네모 테두리 강조(굵은 라인, 색상 박스, 불필요한 윤곽선)가 포함되어 있으면 false 처리한다.
+   브랜드 로고에 있는 네모 테두리는 true 처리한다.
+
+2. 상품 외 배경에 브랜드명 외의 텍스트가 포함되어 있으면 false 처리한다. '백화점 공식', '공식 판매처' 같은 공식적인 텍스트가 있는 경우는 true로 처리한다.
+   - 브랜드 로고, 브랜드명만 있으면 true 처리한다.
+   - 상품에 있는 텍스트는 무시한다.
+   - 브랜드명은 언어(한글/영문), 대소문자, 철자 변형 등을 포함하여 동일한 의미로 인식한다
+
+3. 위 조건 외에는 true 처리한다.
+
+출력은 반드시 아래 형식을 따른다:
+- 결과: true 또는 false
+- 사유: 사유를 간단히 설명 (사유에는 true, false 사용 금지)"""
+
+# 일괄 검수 시 동시에 진행할 최대 검수 요청 수
+BATCH_INSPECTION_CONCURRENCY = 8
+
 
 class InspectionService:
     """이미지 검수 서비스 클래스"""
@@ -44,6 +67,8 @@ class InspectionService:
         self.result_parser = ResultParser()
         self.dynamodb_service = DynamoDBService(config.aws_region)
         self.prompt_manager = PromptVersionManager()
+        self.llm_cache = shared_llm_cache
+        self._url_error_cache = LLMCache(max_size=URL_ERROR_CACHE_SIZE, ttl=URL_ERROR_CACHE_TTL)
         self.is_initialized = False
         
         # 환경 변수에서 프롬프트 버전 확인
@@ -56,7 +81,8 @@ class InspectionService:
                 logger.warning(f"지정된 프롬프트 버전을 찾을 수 없음: {env_prompt_version}, 기본 버전 사용")
         
         # 환경 변수에 INSPECTION_PROMPT가 있으면 커스텀 버전으로 추가 (하위 호환성)
-        env_prompt = self._get_inspection_prompt()
+        self.inspection_prompt = self._get_inspection_prompt()
+        env_prompt = self.inspection_prompt
         if env_prompt and env_prompt.strip():
             # 기존 PROMPT_VERSION이 있으면 그 버전을 덮어쓰기, 없으면 custom 사용
             custom_version = env_prompt_version if env_prompt_version else "custom"
@@ -82,7 +108,12 @@ class InspectionService:
                 model_id=self.config.bedrock_model_id,
                 aws_access_key_id=self.config.aws_access_key_id,
                 aws_secret_access_key=self.config.aws_secret_access_key,
-                temperature=0.0  # 명시적으로 0.0 설정
+                temperature=0.0,  # 명시적으로 0.0 설정
+                client=create_bedrock_client(
+                    self.config.aws_region,
+                    self.config.aws_access_key_id,
+                    self.config.aws_secret_access_key
+                )
             )
             
             self.strands_agent.initialize_agent()
@@ -92,6 +123,9 @@ class InspectionService:
             if not dynamodb_initialized:
                 logger.warning("DynamoDB 초기화 실패 - 저장 기능 비활성화")
             
+            # 첫 검수 요청의 연결 지연을 없애기 위해 Bedrock 연결 워밍업
+            self.strands_agent.ping()
+            
             self.is_initialized = True
             logger.info("InspectionService 초기화 완료")
             
@@ -99,13 +133,15 @@ class InspectionService:
             logger.error(f"InspectionService 초기화 실패: {str(e)}")
             raise ValueError(f"검수 서비스 초기화 실패: {str(e)}")
     
-    def inspect_image(self, image_url: str, save_to_db: bool = False) -> InspectionResult:
+    def inspect_image(self, image_url: str, save_to_db: bool = False,
+                      image_data: Optional[Dict[str, Any]] = None) -> InspectionResult:
         """
         이미지 검수 메인 로직
         이미지 페치 → Agent 호출 → 결과 파싱
         
         Args:
             image_url: 검수할 이미지 URL
+            image_data: 미리 받아 둔 fetch_decode_encode 결과 (있으면 다운로드 생략)
             
         Returns:
             InspectionResult: 검수 결과
@@ -119,26 +155,31 @@ class InspectionService:
         if not image_url or not isinstance(image_url, str):
             raise ValueError("유효한 이미지 URL이 필요합니다.")
         
-        start_time = time.time()
+        start_time = time.perf_counter()
+        
+        # 최근 영구 실패한 URL은 네트워크 요청 없이 바로 오류 반환
+        cached_error = self._url_error_cache.get(image_url)
+        if cached_error is not None:
+            logger.info(f"실패 URL 캐시 적중, 검수 생략: {image_url}")
+            return self._build_error_result(image_url, cached_error, time.perf_counter() - start_time)
         
         try:
             logger.info(f"이미지 검수 시작: {image_url}")
             
             # 1. 이미지 URL 검증
             if not self.image_handler.validate_image_url(image_url):
-                raise ValueError(f"유효하지 않은 이미지 URL입니다: {image_url}")
+                error = f"유효하지 않은 이미지 URL입니다: {image_url}"
+                self._url_error_cache.set(image_url, error)
+                raise ValueError(error)
             
-            # 2. 이미지 페치
-            logger.info("이미지 다운로드 중...")
-            image_bytes = self.image_handler.fetch_image_from_url(image_url)
-            
-            # 3. 이미지를 Base64로 인코딩
-            logger.info("이미지 Base64 인코딩 중...")
-            image_base64 = self.image_handler.convert_image_to_base64(image_bytes)
-            
-            # 4. 이미지 정보 추출 (미디어 타입 등)
-            image_info = self.image_handler.get_image_info(image_bytes)
-            media_type = image_info.get('format', 'png').lower()
+            # 2~4. 이미지 페치 + 정보 추출 + Base64 인코딩 (한 번의 버퍼로 처리)
+            if image_data is None:
+                logger.info("이미지 다운로드 및 인코딩 중...")
+                image_data = self.image_handler.fetch_decode_encode(image_url)
+            image_bytes = image_data['raw_bytes']
+            image_base64 = image_data['base64']
+            image_info = image_data['info']
+            media_type = (image_info.get('format') or 'png').lower()
             media_type = f"image/{media_type}"
             
             # 현재 활성 프롬프트 사용
@@ -153,17 +194,29 @@ class InspectionService:
             if not current_prompt:
                 raise ValueError("활성 프롬프트가 설정되지 않았습니다")
             
-            # 5. Strands Agent를 통해 검수 요청
+            # 5. Strands Agent를 통해 검수 요청 (동일 이미지/프롬프트/모델은 캐시 재사용)
             logger.info("AI 모델에 검수 요청 중...")
-            ai_response = self.strands_agent.send_inspection_request(
-                image_base64=image_base64,
-                prompt=current_prompt,
-                media_type=media_type
-            )
+            
+            def send_request():
+                return self.strands_agent.send_inspection_request(
+                    image_base64=image_base64,
+                    prompt=current_prompt,
+                    media_type=media_type
+                )
+            
+            if self.strands_agent.temperature > 0:
+                ai_response = send_request()
+            else:
+                cache_key = self.llm_cache.make_key(
+                    image_bytes,
+                    self.prompt_manager.get_prompt_key(active_version.version) if active_version else "unknown",
+                    self.config.bedrock_model_id
+                )
+                ai_response = self.llm_cache.get_or_set(cache_key, send_request)
             
             # 6. 응답 파싱
             logger.info("AI 응답 파싱 중...")
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             # 현재 활성 프롬프트 버전 정보 가져오기
             active_version_info = self.prompt_manager.get_active_version_info()
@@ -179,33 +232,60 @@ class InspectionService:
             
             logger.info(f"이미지 검수 완료: {image_url} - 결과: {inspection_result.result}")
             
-            # DynamoDB에 결과 저장 (선택적)
+            # DynamoDB에 결과 저장 (선택적, 백그라운드에서 저장되며 완료를 기다리지 않음)
             if save_to_db:
                 try:
-                    saved_id = self.dynamodb_service.save_inspection_result(inspection_result)
-                    if saved_id:
-                        logger.info(f"검수 결과 DynamoDB 저장 완료: {saved_id}")
-                    else:
+                    future = self.dynamodb_service.submit_inspection_result(inspection_result)
+                    if future is None:
                         logger.warning("DynamoDB 저장 실패")
+                    else:
+                        future.add_done_callback(self._log_save_outcome)
                 except Exception as db_error:
                     logger.error(f"DynamoDB 저장 중 오류: {str(db_error)}")
             
             return inspection_result
             
         except Exception as e:
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             error_message = f"이미지 검수 실패: {str(e)}"
             logger.error(error_message)
             
+            # 4xx 다운로드 실패는 재시도해도 같으므로 음성 캐시에 기록
+            if self._is_permanent_fetch_error(e):
+                self._url_error_cache.set(image_url, str(e))
+            
             # 오류 발생시에도 InspectionResult 객체 반환
-            return InspectionResult(
-                image_url=image_url,
-                result=False,
-                reason=f"검수 중 오류 발생: {str(e)}",
-                timestamp=datetime.now(),
-                processing_time=processing_time,
-                raw_response=f"Error: {str(e)}"
-            )
+            return self._build_error_result(image_url, str(e), processing_time)
+    
+    @staticmethod
+    def _log_save_outcome(future) -> None:
+        """백그라운드 DynamoDB 저장 결과 로그"""
+        if future.exception() is not None:
+            logger.error(f"DynamoDB 저장 중 오류: {str(future.exception())}")
+        else:
+            logger.info(f"검수 결과 DynamoDB 저장 완료: {future.result()}")
+    
+    @staticmethod
+    def _is_permanent_fetch_error(error: Exception) -> bool:
+        """이미지 다운로드가 4xx 응답으로 실패했는지 확인"""
+        response = getattr(error, 'response', None)
+        return (
+            isinstance(error, requests.RequestException)
+            and response is not None
+            and 400 <= response.status_code < 500
+        )
+    
+    @staticmethod
+    def _build_error_result(image_url: str, error: str, processing_time: float) -> InspectionResult:
+        """검수 오류 결과 생성"""
+        return InspectionResult(
+            image_url=image_url,
+            result=False,
+            reason=f"검수 중 오류 발생: {error}",
+            timestamp=datetime.now(),
+            processing_time=processing_time,
+            raw_response=f"Error: {error}"
+        )
     
     def inspect_multiple_images(self, image_urls: list) -> list[InspectionResult]:
         """
@@ -223,26 +303,50 @@ class InspectionService:
         if not image_urls or not isinstance(image_urls, list):
             raise ValueError("유효한 이미지 URL 리스트가 필요합니다.")
         
-        results = []
+        return asyncio.run(self.inspect_multiple_images_async(image_urls))
+    
+    async def inspect_multiple_images_async(self, image_urls: list,
+                                            concurrency: int = BATCH_INSPECTION_CONCURRENCY) -> list[InspectionResult]:
+        """
+        여러 이미지를 동시에 검수합니다.
+        
+        각 검수는 네트워크 대기가 대부분이므로 세마포어로 동시 실행 수를
+        제한하면서 스레드에서 병렬로 실행합니다. 결과는 입력 순서를 유지합니다.
+        
+        Args:
+            image_urls: 검수할 이미지 URL 리스트
+            concurrency: 동시에 실행할 최대 검수 수
+            
+        Returns:
+            list[InspectionResult]: 검수 결과 리스트
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        total = len(image_urls)
         
-        for i, image_url in enumerate(image_urls):
-            try:
-                logger.info(f"일괄 검수 진행 중: {i+1}/{len(image_urls)} - {image_url}")
-                result = self.inspect_image(image_url)
-                results.append(result)
-                
-            except Exception as e:
-                logger.error(f"일괄 검수 중 오류 (URL: {image_url}): {str(e)}")
+        async def inspect_one(i: int, image_url: str) -> InspectionResult:
+            async with semaphore:
+                logger.info(f"일괄 검수 진행 중: {i+1}/{total} - {image_url}")
+                return await asyncio.to_thread(self.inspect_image, image_url)
+        
+        outcomes = await asyncio.gather(
+            *[inspect_one(i, image_url) for i, image_url in enumerate(image_urls)],
+            return_exceptions=True
+        )
+        
+        results = []
+        for image_url, outcome in zip(image_urls, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"일괄 검수 중 오류 (URL: {image_url}): {str(outcome)}")
                 # 오류 발생시에도 결과 추가
-                error_result = InspectionResult(
+                outcome = InspectionResult(
                     image_url=image_url,
                     result=False,
-                    reason=f"일괄 검수 중 오류: {str(e)}",
+                    reason=f"일괄 검수 중 오류: {str(outcome)}",
                     timestamp=datetime.now(),
                     processing_time=0.0,
-                    raw_response=f"Error: {str(e)}"
+                    raw_response=f"Error: {str(outcome)}"
                 )
-                results.append(error_result)
+            results.append(outcome)
         
         logger.info(f"일괄 검수 완료: {len(results)}개 이미지 처리")
         return results
@@ -263,33 +367,22 @@ class InspectionService:
         Returns:
             str: 검수 프롬프트
         """
-        # 설정에서 프롬프트 가져오기 (있는 경우)
-        if hasattr(self.config, 'inspection_prompt') and self.config.inspection_prompt:
-            return self.config.inspection_prompt
-        
-        # 기본 프롬프트 (요구사항에 명시된 프롬프트)
-        default_prompt = """당신은 상품 이미지 검수 전문가입니다. 상품 외 배경만 검수합니다. 아래 기준에 따라 이미지를 객관적으로 평가하세요:
-
-1. 상품 외 배경에 네모 테두리 강조(굵은 라인, 색상 박스, 불필요한 윤곽선)가 포함되어 있으면 false 처리한다.
-   브랜드 로고에 있는 네모 테두리는 true 처리한다.
-
-2. 상품 외 배경에 브랜드명 외의 텍스트가 포함되어 있으면 false 처리한다. '백화점 공식', '공식 판매처' 같은 공식적인 텍스트가 있는 경우는 true로 처리한다.
-   - 브랜드 로고, 브랜드명만 있으면 true 처리한다.
-   - 상품에 있는 텍스트는 무시한다.
-   - 브랜드명은 언어(한글/영문), 대소문자, 철자 변형 등을 포함하여 동일한 의미로 인식한다
-
-3. 위 조건 외에는 true 처리한다.
-
-출력은 반드시 아래 형식을 따른다:
-- 결과: true 또는 false
-- 사유: 사유를 간단히 설명 (사유에는 true, false 사용 금지)"""
-        
-        return default_prompt
+        # 설정에 프롬프트가 있으면 사용, 없으면 기본 프롬프트 (요구사항에 명시된 프롬프트)
+        return getattr(self.config, 'inspection_prompt', None) or _DEFAULT_INSPECTION_PROMPT
     
     def validate_service_health(self) -> Dict[str, Any]:
         """
         서비스 상태를 검증합니다.
         
+        Returns:
+            Dict: 서비스 상태 정보
+        """
+        return asyncio.run(self.validate_service_health_async())
+    
+    async def validate_service_health_async(self) -> Dict[str, Any]:
+        """
+        서비스 상태를 검증합니다. (구성 요소별 점검을 동시에 실행)
+        
         Returns:
             Dict: 서비스 상태 정보
         """
@@ -300,18 +393,12 @@ class InspectionService:
         }
         
         try:
-            # StrandsAgent 상태 확인
-            if self.strands_agent:
-                agent_test = self.strands_agent.test_connection()
-                health_status["components"]["strands_agent"] = {
-                    "status": "healthy" if agent_test.get("success") else "unhealthy",
-                    "details": agent_test
-                }
-            else:
-                health_status["components"]["strands_agent"] = {
-                    "status": "not_initialized",
-                    "details": "StrandsAgent가 초기화되지 않았습니다"
-                }
+            agent_status, parser_status = await asyncio.gather(
+                asyncio.to_thread(self._check_strands_agent),
+                asyncio.to_thread(self._check_result_parser)
+            )
+            
+            health_status["components"]["strands_agent"] = agent_status
             
             # ImageHandler 상태 확인
             health_status["components"]["image_handler"] = {
@@ -319,19 +406,7 @@ class InspectionService:
                 "details": "ImageHandler 정상 작동"
             }
             
-            # ResultParser 상태 확인
-            test_response = "결과: true\n사유: 테스트"
-            try:
-                self.result_parser.validate_response_format(test_response)
-                health_status["components"]["result_parser"] = {
-                    "status": "healthy",
-                    "details": "ResultParser 정상 작동"
-                }
-            except Exception as e:
-                health_status["components"]["result_parser"] = {
-                    "status": "unhealthy",
-                    "details": f"ResultParser 오류: {str(e)}"
-                }
+            health_status["components"]["result_parser"] = parser_status
             
             # 전체 상태 결정
             all_healthy = all(
@@ -346,6 +421,35 @@ class InspectionService:
         
         return health_status
     
+    def _check_strands_agent(self) -> Dict[str, Any]:
+        """StrandsAgent 상태 확인"""
+        if not self.strands_agent:
+            return {
+                "status": "not_initialized",
+                "details": "StrandsAgent가 초기화되지 않았습니다"
+            }
+        
+        agent_test = self.strands_agent.test_connection()
+        return {
+            "status": "healthy" if agent_test.get("success") else "unhealthy",
+            "details": agent_test
+        }
+    
+    def _check_result_parser(self) -> Dict[str, Any]:
+        """ResultParser 상태 확인"""
+        test_response = "결과: true\n사유: 테스트"
+        try:
+            self.result_parser.validate_response_format(test_response)
+            return {
+                "status": "healthy",
+                "details": "ResultParser 정상 작동"
+            }
+        except Exception as e:
+            return {
+                "status": "unhealthy",
+                "details": f"ResultParser 오류: {str(e)}"
+            }
+    
     def get_service_stats(self) -> Dict[str, Any]:
         """
         서비스 통계 정보를 반환합니다.
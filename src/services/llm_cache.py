@@ -0,0 +1,239 @@
+"""
+LLM 응답 캐시 모듈
+동일한 이미지 + 프롬프트 버전 + 모델 조합에 대한 Bedrock 응답을 재사용합니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# 기본 캐시 크기 및 만료 시간 (7일)
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_CACHE_TTL = 7 * 24 * 60 * 60
+
+# 재생(replay) 캐시 설정 - 성능 테스트/CI 전용, 운영 환경에서는 사용하지 않음
+REPLAY_ENV_VAR = 'INSPECTION_REPLAY'
+DEFAULT_REPLAY_CACHE_PATH = '/tmp/strands_cache/responses.sqlite3'
+
+
+def image_digest(image_data: Union[bytes, str]) -> str:
+    """
+    이미지 내용 해시 (blake2b 128비트, MB 미만 버퍼에서 md5/sha256보다 빠름)
+    
+    Args:
+        image_data: 이미지 원본 바이트 또는 base64 문자열
+    
+    Returns:
+        str: 16진수 해시 문자열
+    """
+    if isinstance(image_data, str):
+        image_data = image_data.encode('ascii')
+    return hashlib.blake2b(image_data, digest_size=16).hexdigest()
+
+
+class LLMCache:
+    """정확히 일치하는 입력에 대한 LLM 응답 LRU 캐시 (TTL 지원, 스레드 안전)"""
+    
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE, ttl: float = DEFAULT_CACHE_TTL):
+        """
+        LLMCache 초기화
+        
+        Args:
+            max_size: 최대 캐시 항목 수
+            ttl: 항목 만료 시간 (초)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(image_data: Union[bytes, str], prompt_version: str, model_id: str) -> str:
+        """
+        캐시 키 생성
+        
+        Args:
+            image_data: 이미지 원본 바이트 또는 base64 문자열
+            prompt_version: 프롬프트 식별자 (PromptVersionManager.get_prompt_key, 본문 해시 포함)
+            model_id: 모델 ID
+        
+        Returns:
+            str: '이미지해시:프롬프트식별자:모델ID' 형식의 키
+        """
+        return f"{image_digest(image_data)}:{prompt_version}:{model_id}"
+    
+    def get(self, key: str) -> Optional[Any]:
+        """
+        캐시된 응답 조회
+        
+        Args:
+            key: 캐시 키
+        
+        Returns:
+            캐시된 응답, 없거나 만료되었으면 None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def set(self, key: str, value: Any) -> None:
+        """
+        응답 저장
+        
+        Args:
+            key: 캐시 키
+            value: 저장할 응답
+        """
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def get_or_set(self, key: str, factory: Callable[[], Any]) -> Any:
+        """
+        캐시된 응답을 반환하고, 없으면 factory를 호출해 저장 후 반환
+        
+        Args:
+            key: 캐시 키
+            factory: 캐시 미스 시 응답을 생성하는 함수 (예: Bedrock 호출)
+        
+        Returns:
+            캐시된 응답 또는 새로 생성한 응답
+        """
+        value = self.get(key)
+        if value is not None:
+            logger.info(f"LLM 응답 캐시 적중: {key[:16]}...")
+            return value
+        
+        value = factory()
+        self.set(key, value)
+        return value
+    
+    def clear(self) -> None:
+        """캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def get_stats(self) -> dict:
+        """캐시 통계 반환"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0
+            }
+
+
+class ReplayCache:
+    """
+    Bedrock 응답 디스크 재생 캐시 (sqlite + zlib 압축, 스레드 안전)
+    
+    INSPECTION_REPLAY=1 일 때만 사용하며, 벤치마크/CI에서 같은 이미지와
+    프롬프트 버전에 대해 Bedrock 호출 없이 저장된 응답을 재생합니다.
+    """
+    
+    def __init__(self, path: str = DEFAULT_REPLAY_CACHE_PATH):
+        """
+        ReplayCache 초기화
+        
+        Args:
+            path: sqlite 파일 경로
+        """
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+            )
+    
+    @staticmethod
+    def is_enabled() -> bool:
+        """INSPECTION_REPLAY 환경 변수로 재생 캐시 사용 여부 확인"""
+        return os.getenv(REPLAY_ENV_VAR) == '1'
+    
+    def get(self, key: str) -> Optional[Any]:
+        """
+        저장된 응답 조회
+        
+        Args:
+            key: 캐시 키
+        
+        Returns:
+            저장된 응답, 없으면 None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(zlib.decompress(row[0]))
+    
+    def set(self, key: str, value: Any) -> None:
+        """
+        응답 저장
+        
+        Args:
+            key: 캐시 키
+            value: 저장할 응답 (JSON 직렬화 가능해야 함)
+        """
+        blob = zlib.compress(json.dumps(value, ensure_ascii=False, default=str).encode('utf-8'))
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value) VALUES (?, ?)", (key, blob)
+            )
+    
+    def get_or_set(self, key: str, factory: Callable[[], Any]) -> Any:
+        """
+        저장된 응답을 재생하고, 없으면 factory를 호출해 저장 후 반환
+        
+        Args:
+            key: 캐시 키
+            factory: 캐시 미스 시 응답을 생성하는 함수 (예: Bedrock 호출)
+        
+        Returns:
+            저장된 응답 또는 새로 생성한 응답
+        """
+        value = self.get(key)
+        if value is not None:
+            logger.info(f"재생 캐시 적중: {key[:16]}...")
+            return value
+        
+        value = factory()
+        self.set(key, value)
+        return value
+
+
+# 서비스 인스턴스 간 공유 캐시
+shared_llm_cache = LLMCache()
@@ -2,28 +2,47 @@
 2단계 검수 서비스: 테두리 탐지 + 일반 검수
 """
 
+import dataclasses
 import logging
+import threading
 import time
-from typing import Dict, Any, Optional, List
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 import os
-import sys
 
-# 경로 설정
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-from agents.strands_agent import StrandsAgent
-from handlers.image_handler import ImageHandler
-from parsers.result_parser import ResultParser
-from models.inspection_result import InspectionResult
-from models.app_config import AppConfig
-from models.prompt_version import PromptVersionManager
+# 필요한 모듈들 import
+from src.agents.strands_agent import StrandsAgent
+from src.handlers.image_handler import ImageHandler
+from src.parsers.result_parser import ResultParser
+from src.models.inspection_result import InspectionResult
+from src.models.app_config import AppConfig
+from src.models.prompt_version import PromptVersionManager
 
 # DynamoDB 서비스 import
-from services.dynamodb_service import DynamoDBService
+from src.services.dynamodb_service import DynamoDBService
+from src.services.llm_cache import LLMCache, ReplayCache, image_digest, shared_llm_cache
 
 logger = logging.getLogger(__name__)
 
+# 일괄 검수 동시 실행 워커 수 (다운로드/Bedrock/DynamoDB 대기 시간 중첩)
+BATCH_INSPECTION_MAX_WORKERS = 8
+
+# Bedrock 동시 요청 상한 (요청 한도 보호)
+BEDROCK_MAX_CONCURRENT_REQUESTS = 4
+
+# 일괄 검수 시 이미지 선행 다운로드 워커 수
+PREFETCH_MAX_WORKERS = 4
+
+# 진행 중인 검수 외에 미리 다운로드해 둘 다음 URL 수 (메모리에 올라가는 이미지 수 상한)
+PREFETCH_LOOKAHEAD = 8
+
+# OpenCV 테두리 탐지 결과 캐시 크기
+BORDER_CACHE_SIZE = 1024
+
+# 최종 검수 결과 캐시 크기 (이미지 해시 + 프롬프트 버전)
+RESULT_CACHE_SIZE = 4096
+
 
 class TwoStageInspectionService:
     """2단계 검수 서비스: 1단계 테두리 탐지 + 2단계 일반 검수"""
@@ -36,13 +55,28 @@ class TwoStageInspectionService:
             config: 애플리케이션 설정
         """
         self.config = config
-        self.strands_agent = None
         self.image_handler = ImageHandler()
         self.result_parser = ResultParser()
         self.prompt_manager = PromptVersionManager()
-        self.dynamodb_service = DynamoDBService(config.aws_region)  # DynamoDB 서비스 추가
+        
+        # StrandsAgent / DynamoDB 서비스는 첫 사용 시 생성 (initialize에서 백그라운드 선행 로드)
+        self._strands_agent: Optional[StrandsAgent] = None
+        self._dynamodb_service: Optional[DynamoDBService] = None
+        self._agent_lock = threading.Lock()
+        self._dynamodb_lock = threading.Lock()
+        self._preload_executor = ThreadPoolExecutor(max_workers=2)
+        
+        # 이미지 내용 해시 기반 캐시 (테두리 탐지 결과 / Bedrock 응답)
+        self._border_cache = LLMCache(max_size=BORDER_CACHE_SIZE)
+        self._result_cache = LLMCache(max_size=RESULT_CACHE_SIZE)
+        self.llm_cache = shared_llm_cache
+        # 성능 테스트용 Bedrock 응답 재생 캐시 (INSPECTION_REPLAY=1 일 때만)
+        self._response_cache = ReplayCache() if ReplayCache.is_enabled() else None
         self.is_initialized = False
         
+        # 일괄 검수 시 Bedrock 동시 호출 수 제한
+        self._bedrock_semaphore = threading.Semaphore(BEDROCK_MAX_CONCURRENT_REQUESTS)
+        
         # 프롬프트 설정
         self._setup_prompts()
     
@@ -74,32 +108,63 @@ class TwoStageInspectionService:
         env_prompt_version = os.getenv('PROMPT_VERSION', 'v3.2')
         self.general_inspection_version = env_prompt_version
     
+    @property
+    def strands_agent(self) -> StrandsAgent:
+        """StrandsAgent (첫 접근 시 생성 및 초기화)"""
+        if self._strands_agent is None:
+            with self._agent_lock:
+                if self._strands_agent is None:
+                    agent = StrandsAgent(
+                        aws_region=self.config.aws_region,
+                        model_id=self.config.bedrock_model_id,
+                        aws_access_key_id=self.config.aws_access_key_id,
+                        aws_secret_access_key=self.config.aws_secret_access_key,
+                        temperature=0.0
+                    )
+                    agent.initialize_agent()
+                    self._strands_agent = agent
+        return self._strands_agent
+    
+    @property
+    def dynamodb_service(self) -> DynamoDBService:
+        """DynamoDB 서비스 (첫 접근 시 생성 및 테이블 연결)"""
+        if self._dynamodb_service is None:
+            with self._dynamodb_lock:
+                if self._dynamodb_service is None:
+                    dynamodb_service = DynamoDBService(self.config.aws_region)
+                    dynamodb_service.initialize()
+                    self._dynamodb_service = dynamodb_service
+        return self._dynamodb_service
+    
+    def _preload(self, name: str) -> None:
+        """클라이언트 선행 로드 (실패해도 첫 사용 시 다시 시도)"""
+        try:
+            getattr(self, name)
+            logger.info("%s 선행 로드 완료", name)
+        except Exception as e:
+            logger.warning("%s 선행 로드 실패: %s", name, e)
+    
     async def initialize(self) -> bool:
-        """서비스 초기화"""
+        """
+        서비스 초기화
+        
+        StrandsAgent와 DynamoDB 연결은 백그라운드에서 병렬로 선행 로드하고
+        바로 반환하여 UI가 즉시 응답할 수 있게 합니다.
+        """
         try:
-            # StrandsAgent 초기화
-            self.strands_agent = StrandsAgent(
-                aws_region=self.config.aws_region,
-                model_id=self.config.bedrock_model_id,
-                aws_access_key_id=self.config.aws_access_key_id,
-                aws_secret_access_key=self.config.aws_secret_access_key,
-                temperature=0.0
-            )
-            
-            self.strands_agent.initialize_agent()
-            
             # 프롬프트 매니저 초기화
             self.prompt_manager.set_active_version(self.general_inspection_version)
             
-            # DynamoDB 서비스 초기화
-            self.dynamodb_service.initialize()
+            # StrandsAgent / DynamoDB 서비스 백그라운드 선행 로드
+            self._preload_executor.submit(self._preload, 'strands_agent')
+            self._preload_executor.submit(self._preload, 'dynamodb_service')
             
             self.is_initialized = True
             logger.info("2단계 검수 서비스 초기화 완료")
             return True
             
         except Exception as e:
-            logger.error(f"2단계 검수 서비스 초기화 실패: {str(e)}")
+            logger.error("2단계 검수 서비스 초기화 실패: %s", e)
             return False
     
     def inspect_image(self, image_url: str) -> InspectionResult:
@@ -115,24 +180,62 @@ class TwoStageInspectionService:
         if not self.is_initialized:
             raise RuntimeError("서비스가 초기화되지 않았습니다")
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # 이미지 다운로드 및 처리
-            logger.info(f"2단계 검수 시작: {image_url}")
-            image_data = self.image_handler.fetch_and_process_image(image_url)
+            logger.info("2단계 검수 시작: %s", image_url)
+            image_data = self.image_handler.fetch_raw(image_url, decode_array=True)
+        except Exception as e:
+            return self._build_error_result(image_url, e, start_time)
+        
+        return self._inspect_with_image_data(image_data, image_url, start_time)
+    
+    def _inspect_with_image_data(self, image_data: Dict[str, Any], image_url: str,
+                                 start_time: float) -> InspectionResult:
+        """
+        다운로드된 이미지로 2단계 검수 수행
+        
+        Args:
+            image_data: fetch_raw 결과 (디코딩된 'ndarray' 포함, base64 미포함)
+            image_url: 검수할 이미지 URL
+            start_time: 검수 시작 시각 (time.perf_counter 기준)
+            
+        Returns:
+            InspectionResult: 검수 결과
+        """
+        try:
             original_bytes = image_data['raw_bytes']
+            image_key = image_digest(original_bytes)
+            
+            # temperature=0 검수는 이미지 + 프롬프트에 대해 결정적이므로 이전 결과 재사용
+            # (프롬프트 버전과 본문 해시가 키에 포함되어 프롬프트 변경 시 자동으로 무효화)
+            prompt_key = self.prompt_manager.get_prompt_key(self.general_inspection_version)
+            result_key = f"{image_key}:{prompt_key}"
+            cached_result = self._result_cache.get(result_key)
+            if cached_result is not None:
+                logger.info("✅ 검수 결과 캐시 적중: %s", image_url)
+                return dataclasses.replace(
+                    cached_result,
+                    image_url=image_url,
+                    timestamp=datetime.now(),
+                    processing_time=time.perf_counter() - start_time,
+                    inspection_stage="cache_hit",
+                    stage_details={**cached_result.stage_details,
+                                   "cached_stage": cached_result.inspection_stage}
+                )
             
             # 1단계: 테두리 탐지
-            border_result = self._detect_border(original_bytes, image_url)
+            border_result = self._detect_border(original_bytes, image_url, image_key,
+                                                image_array=image_data.get('ndarray'))
             
             # 디버깅: 1단계 결과 로그
-            logger.info(f"🔍 1단계 테두리 탐지 결과: {border_result.result}")
-            logger.info(f"🔍 1단계 사유: {border_result.reason}")
+            logger.info("🔍 1단계 테두리 탐지 결과: %s", border_result.result)
+            logger.info("🔍 1단계 사유: %s", border_result.reason)
             
             if not border_result.result:
                 # 테두리 발견 → 즉시 false 반환
-                border_result.processing_time = time.time() - start_time
+                border_result.processing_time = time.perf_counter() - start_time
                 border_result.reason = "이미지 경계에 색상 테두리 탐지됨 [1단계 테두리 검수에서 반려]"
                 
                 # 검수 단계 메타데이터 추가
@@ -143,13 +246,14 @@ class TwoStageInspectionService:
                     "detection_method": "resize_comparison"
                 }
                 
-                logger.info(f"✅ 1단계에서 테두리 탐지하여 검수 종료: {image_url}")
+                logger.info("✅ 1단계에서 테두리 탐지하여 검수 종료: %s", image_url)
+                self._result_cache.set(result_key, border_result)
                 return border_result
             
             # 2단계: 일반 검수
-            logger.info(f"➡️ 1단계 통과, 2단계 일반 검수 진행: {image_url}")
-            general_result = self._general_inspection(image_data, image_url)
-            general_result.processing_time = time.time() - start_time
+            logger.info("➡️ 1단계 통과, 2단계 일반 검수 진행: %s", image_url)
+            general_result = self._general_inspection(image_data, image_url, image_key)
+            general_result.processing_time = time.perf_counter() - start_time
             general_result.reason += " [2단계 검수: 테두리 없음, 일반 기준 적용]"
             
             # 검수 단계 메타데이터 추가
@@ -161,29 +265,59 @@ class TwoStageInspectionService:
                 "detection_method": "resize_comparison + general_inspection"
             }
             
-            logger.info(f"2단계 검수 완료: {image_url} -> {general_result.result}")
+            logger.info("2단계 검수 완료: %s -> %s", image_url, general_result.result)
+            self._result_cache.set(result_key, general_result)
             return general_result
             
         except Exception as e:
-            logger.error(f"2단계 검수 실패: {str(e)}")
-            return InspectionResult(
-                image_url=image_url,
-                result=False,
-                reason=f"검수 오류: {str(e)}",
-                timestamp=datetime.now(),
-                processing_time=time.time() - start_time,
-                raw_response="",
-                model_id=self.config.bedrock_model_id,
-                prompt_version="error"
-            )
+            return self._build_error_result(image_url, e, start_time)
     
-    def _detect_border(self, original_bytes: bytes, image_url: str) -> InspectionResult:
-        """1단계: OpenCV 테두리 탐지"""
+    def _build_error_result(self, image_url: str, error: Exception, start_time: float) -> InspectionResult:
+        """검수 오류 결과 생성"""
+        logger.error("2단계 검수 실패: %s", error)
+        return InspectionResult(
+            image_url=image_url,
+            result=False,
+            reason=f"검수 오류: {str(error)}",
+            timestamp=datetime.now(),
+            processing_time=time.perf_counter() - start_time,
+            raw_response="",
+            model_id=self.config.bedrock_model_id,
+            prompt_version="error"
+        )
+    
+    def _timed_fetch(self, image_url: str) -> Tuple[Dict[str, Any], float]:
+        """이미지 다운로드 및 처리 (소요 시간 포함)"""
+        fetch_start = time.perf_counter()
+        image_data = self.image_handler.fetch_raw(image_url, decode_array=True)
+        return image_data, time.perf_counter() - fetch_start
+    
+    def _inspect_prefetched(self, prefetch_future: Future, image_url: str) -> InspectionResult:
+        """선행 다운로드가 끝난 이미지로 검수 (다운로드 시간을 처리 시간에 포함)"""
+        start_time = time.perf_counter()
+        try:
+            image_data, fetch_time = prefetch_future.result()
+        except Exception as e:
+            return self._build_error_result(image_url, e, start_time)
+        
+        return self._inspect_with_image_data(image_data, image_url, start_time - fetch_time)
+    
+    def _detect_border(self, original_bytes: bytes, image_url: str,
+                       image_key: Optional[str] = None, image_array=None) -> InspectionResult:
+        """1단계: OpenCV 테두리 탐지 (같은 이미지 내용은 캐시된 결과 재사용)"""
         try:
             # OpenCV로 테두리 탐지
-            has_opencv_border, opencv_analysis, confidence = self.image_handler.detect_border_opencv(original_bytes)
+            cached = self._border_cache.get(image_key) if image_key else None
+            if cached is not None:
+                has_opencv_border, opencv_analysis, confidence = cached
+            else:
+                has_opencv_border, opencv_analysis, confidence = self.image_handler.detect_border_opencv(
+                    original_bytes, image_array=image_array
+                )
+                if image_key:
+                    self._border_cache.set(image_key, (has_opencv_border, opencv_analysis, confidence))
 
-            logger.info(f"🔬 OpenCV 분석: {opencv_analysis}, 신뢰도: {confidence:.2f}")
+            logger.info("🔬 OpenCV 분석: %s, 신뢰도: %.2f", opencv_analysis, confidence)
 
             # OpenCV가 테두리를 탐지했으면 즉시 false 반환
             if has_opencv_border:
@@ -211,7 +345,7 @@ class TwoStageInspectionService:
             )
 
         except Exception as e:
-            logger.error(f"OpenCV 테두리 탐지 실패: {str(e)}")
+            logger.error("OpenCV 테두리 탐지 실패: %s", e)
             # 오류 시 안전하게 일반 검수로 넘어가기
             return InspectionResult(
                 image_url=image_url,
@@ -224,18 +358,38 @@ class TwoStageInspectionService:
                 prompt_version="border_detection_error"
             )
     
-    def _general_inspection(self, image_data: Dict, image_url: str) -> InspectionResult:
+    def _general_inspection(self, image_data: Dict, image_url: str,
+                            image_key: Optional[str] = None) -> InspectionResult:
         """2단계: 일반 검수"""
         try:
             # 일반 검수 프롬프트 가져오기
-            general_prompt = self.prompt_manager.get_active_prompt()
+            general_prompt = self.prompt_manager.get_prompt(self.general_inspection_version)
+            prompt_key = self.prompt_manager.get_prompt_key(self.general_inspection_version)
             
             # 일반 검수 실행
-            ai_response = self.strands_agent.send_inspection_request(
-                image_base64=image_data['base64'],
-                prompt=general_prompt,
-                media_type=f"image/{image_data['info']['format'].lower()}"
-            )
+            # base64는 실제로 Bedrock을 호출할 때만 인코딩 (1단계 반려/캐시 적중 시 생략)
+            def send_request():
+                image_base64 = self.image_handler.convert_image_to_base64(
+                    image_data['raw_bytes'], verify=False
+                )
+                with self._bedrock_semaphore:
+                    return self.strands_agent.send_inspection_request(
+                        image_base64=image_base64,
+                        prompt=general_prompt,
+                        media_type=f"image/{image_data['info']['format'].lower()}"
+                    )
+            
+            # 재생 모드에서는 디스크에 저장된 응답으로 Bedrock 호출을 건너뜀
+            if self._response_cache is not None:
+                replay_key = image_key or image_digest(image_data['raw_bytes'])
+                replay_key = f"{replay_key}:{prompt_key}"
+                ai_response = self._response_cache.get_or_set(replay_key, send_request)
+            # temperature=0이면 같은 이미지 + 프롬프트 + 모델은 같은 응답이므로 캐시 재사용
+            elif image_key is None or self.strands_agent.temperature > 0:
+                ai_response = send_request()
+            else:
+                cache_key = f"{image_key}:{prompt_key}:{self.config.bedrock_model_id}"
+                ai_response = self.llm_cache.get_or_set(cache_key, send_request)
             
             # 결과 파싱
             result = self.result_parser.parse_ai_response(
@@ -249,15 +403,23 @@ class TwoStageInspectionService:
             return result
             
         except Exception as e:
-            logger.error(f"일반 검수 실패: {str(e)}")
+            logger.error("일반 검수 실패: %s", e)
             raise e
     
-    def inspect_batch(self, image_urls: List[str]) -> List[InspectionResult]:
+    def inspect_batch(self, image_urls: List[str],
+                      max_workers: int = BATCH_INSPECTION_MAX_WORKERS) -> List[InspectionResult]:
         """
         일괄 이미지 검수 (2단계 방식)
         
+        I/O 대기가 대부분이므로 스레드 풀로 동시에 검수하며,
+        이미지는 별도 풀에서 미리 다운로드해 Bedrock 호출 시간과 겹치게 합니다.
+        한 건이 끝날 때마다 다음 URL을 추가해 진행 중인 검수와 다음
+        PREFETCH_LOOKAHEAD개만 메모리에 두고, 끝난 이미지는 바로 해제합니다.
+        결과는 입력 URL 순서를 유지합니다.
+        
         Args:
             image_urls: 검수할 이미지 URL 리스트
+            max_workers: 동시 검수 워커 수
             
         Returns:
             List[InspectionResult]: 검수 결과 리스트
@@ -265,30 +427,50 @@ class TwoStageInspectionService:
         if not self.is_initialized:
             raise RuntimeError("서비스가 초기화되지 않았습니다")
         
-        results = []
+        total = len(image_urls)
+        results: List[Optional[InspectionResult]] = [None] * total
+        
+        window = max_workers + PREFETCH_LOOKAHEAD
         
-        for i, image_url in enumerate(image_urls):
-            try:
-                logger.info(f"일괄 검수 진행: {i+1}/{len(image_urls)} - {image_url}")
-                result = self.inspect_image(image_url)
-                results.append(result)
+        with ThreadPoolExecutor(max_workers=PREFETCH_MAX_WORKERS) as prefetcher, \
+                ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending: Dict[Future, int] = {}
+            next_index = 0
+            done = 0
+            
+            while next_index < total or pending:
+                # 창이 빈 만큼 다음 URL의 선행 다운로드와 검수를 추가
+                # (다운로드 결과는 검수 작업만 참조하므로 검수가 끝나면 해제됨)
+                while next_index < total and len(pending) < window:
+                    image_url = image_urls[next_index]
+                    prefetch_future = prefetcher.submit(self._timed_fetch, image_url)
+                    pending[executor.submit(self._inspect_prefetched, prefetch_future, image_url)] = next_index
+                    next_index += 1
                 
-            except Exception as e:
-                logger.error(f"일괄 검수 중 오류 ({image_url}): {str(e)}")
-                # 오류 발생 시에도 결과 추가 (실패 결과)
-                error_result = InspectionResult(
-                    image_url=image_url,
-                    result=False,
-                    reason=f"검수 오류: {str(e)}",
-                    timestamp=datetime.now(),
-                    processing_time=0,
-                    raw_response="",
-                    model_id=self.config.bedrock_model_id,
-                    prompt_version="error",
-                    inspection_stage="error",
-                    stage_details={"error": str(e)}
-                )
-                results.append(error_result)
+                completed, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in completed:
+                    i = pending.pop(future)
+                    image_url = image_urls[i]
+                    done += 1
+                    try:
+                        results[i] = future.result()
+                        logger.info("일괄 검수 진행: %d/%d - %s", done, total, image_url)
+                        
+                    except Exception as e:
+                        logger.error("일괄 검수 중 오류 (%s): %s", image_url, e)
+                        # 오류 발생 시에도 결과 추가 (실패 결과)
+                        results[i] = InspectionResult(
+                            image_url=image_url,
+                            result=False,
+                            reason=f"검수 오류: {str(e)}",
+                            timestamp=datetime.now(),
+                            processing_time=0,
+                            raw_response="",
+                            model_id=self.config.bedrock_model_id,
+                            prompt_version="error",
+                            inspection_stage="error",
+                            stage_details={"error": str(e)}
+                        )
         
-        logger.info(f"일괄 검수 완료: {len(results)}개 결과")
+        logger.info("일괄 검수 완료: %d개 결과", len(results))
         return results
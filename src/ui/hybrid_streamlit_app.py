@@ -9,14 +9,36 @@ import time
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import sys
 import os
 
 # 경로 설정
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from models.app_config import AppConfig
-from services.hybrid_inspection_service import HybridInspectionService
+from src.models.app_config import AppConfig
+from src.services.hybrid_inspection_service import HybridInspectionService
+
+# 빠른 JSON 직렬화 (선택적)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# 일괄 검수 동시 실행 워커 수
+BATCH_INSPECTION_MAX_WORKERS = 8
+
+# 일괄 검수 진행률 표시 최소 갱신 간격 (초)
+PROGRESS_UPDATE_INTERVAL = 0.25
+
+
+def _dumps_json(data: Any) -> str:
+    """다운로드용 JSON 직렬화 (orjson이 있으면 사용, 없으면 표준 json)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(data, ensure_ascii=False, indent=2)
 
 
 class HybridStreamlitApp:
@@ -28,6 +50,9 @@ class HybridStreamlitApp:
         self.config = None
         self.is_initialized = False
         
+        # 재실행(rerun) 간 유지되는 이벤트 루프
+        self._loop = self._get_event_loop()
+        
         # 페이지 설정
         st.set_page_config(
             page_title="🔍 하이브리드 상품 이미지 검수 서비스",
@@ -39,6 +64,20 @@ class HybridStreamlitApp:
         # CSS 스타일 적용
         self._apply_custom_styles()
     
+    @staticmethod
+    def _get_event_loop() -> asyncio.AbstractEventLoop:
+        """
+        세션별 이벤트 루프 반환
+        
+        asyncio.run처럼 호출마다 루프를 만들고 닫지 않도록
+        st.session_state에 루프를 보관해 재실행 간 재사용합니다.
+        """
+        loop = st.session_state.get('_event_loop')
+        if loop is None or loop.is_closed():
+            loop = asyncio.new_event_loop()
+            st.session_state['_event_loop'] = loop
+        return loop
+    
     def _apply_custom_styles(self):
         """커스텀 CSS 스타일 적용"""
         st.markdown("""
@@ -110,7 +149,7 @@ class HybridStreamlitApp:
         # 서비스 초기화
         if not self.is_initialized:
             with st.spinner("하이브리드 검수 서비스 초기화 중..."):
-                success = asyncio.run(self.initialize_service())
+                success = self._loop.run_until_complete(self.initialize_service())
                 if not success:
                     st.stop()
         
@@ -217,7 +256,7 @@ class HybridStreamlitApp:
                 'hybrid': True
             }
             
-            json_str = json.dumps(result_dict, ensure_ascii=False, indent=2)
+            json_str = _dumps_json(result_dict)
             st.download_button(
                 label="📥 결과 JSON 다운로드",
                 data=json_str,
@@ -265,21 +304,21 @@ class HybridStreamlitApp:
             self.render_batch_results(st.session_state.batch_results)
     
     def execute_batch_inspection(self, image_urls: List[str]):
-        """일괄 검수 실행"""
-        results = []
+        """일괄 검수 실행 (스레드 풀로 동시 검수, 입력 순서 유지)"""
+        total = len(image_urls)
+        results = [None] * total
         
         # 진행 상태 표시
         progress_bar = st.progress(0)
         status_text = st.empty()
+        status_text.text(f"🔄 검수 중... (0/{total})")
         
-        for i, url in enumerate(image_urls):
+        def inspect(url: str) -> Dict[str, Any]:
             try:
-                status_text.text(f"🔄 검수 중... ({i+1}/{len(image_urls)}) {url}")
-                
                 # 하이브리드 검수 실행
                 result = self.inspection_service.inspect_image(url)
                 
-                results.append({
+                return {
                     'url': url,
                     'result': result.result,
                     'reason': result.reason,
@@ -288,10 +327,10 @@ class HybridStreamlitApp:
                     'prompt_version': result.prompt_version,
                     'success': True,
                     'hybrid': True
-                })
+                }
                 
             except Exception as e:
-                results.append({
+                return {
                     'url': url,
                     'result': False,
                     'reason': f"검수 오류: {str(e)}",
@@ -300,20 +339,32 @@ class HybridStreamlitApp:
                     'prompt_version': "error",
                     'success': False,
                     'hybrid': True
-                })
+                }
+        
+        with ThreadPoolExecutor(max_workers=BATCH_INSPECTION_MAX_WORKERS) as executor:
+            futures = {executor.submit(inspect, url): i for i, url in enumerate(image_urls)}
+            
+            # 진행률 업데이트 (Streamlit 호출은 메인 스레드에서만)
+            # 매 건마다 다시 그리지 않도록 전체의 2% 단위 또는 일정 간격으로만 갱신
+            update_step = max(1, total // 50)
+            last_update = time.monotonic()
             
-            # 진행률 업데이트
-            progress_bar.progress((i + 1) / len(image_urls))
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                results[i] = future.result()
+                
+                now = time.monotonic()
+                if done % update_step == 0 or now - last_update >= PROGRESS_UPDATE_INTERVAL:
+                    status_text.text(f"🔄 검수 중... ({done}/{total}) {image_urls[i]}")
+                    progress_bar.progress(done / total)
+                    last_update = now
         
         # 완료 메시지
         progress_bar.progress(1.0)
         status_text.text("✅ 하이브리드 일괄 검수 완료!")
         
-        # 결과를 세션 상태에 저장
+        # 결과를 세션 상태에 저장 (호출한 render_batch_inspection_ui가 바로 이어서 렌더링)
         st.session_state.batch_results = results
-        
-        # 페이지 새로고침으로 결과 표시
-        st.rerun()
     
     def render_batch_results(self, results: List[Dict]):
         """일괄 검수 결과 렌더링"""
@@ -345,7 +396,7 @@ class HybridStreamlitApp:
             col1, col2 = st.columns(2)
             
             with col1:
-                json_str = json.dumps(results, ensure_ascii=False, indent=2)
+                json_str = self._get_results_json(results)
                 st.download_button(
                     label="📥 결과 JSON 다운로드",
                     data=json_str,
@@ -392,6 +443,19 @@ class HybridStreamlitApp:
                             st.markdown(f"**프롬프트 버전:** {result['prompt_version']}")
                         st.markdown("**🔄 하이브리드 검수**")
     
+    def _get_results_json(self, results: List[Dict]) -> str:
+        """
+        일괄 검수 결과 JSON 반환
+        
+        결과 리스트가 바뀌지 않은 재실행에서는 직렬화를 반복하지 않도록
+        같은 리스트 객체에 대한 JSON을 세션에 보관합니다.
+        """
+        cached = st.session_state.get('_batch_results_json')
+        if cached is None or cached[0] is not results:
+            cached = (results, _dumps_json(results))
+            st.session_state['_batch_results_json'] = cached
+        return cached[1]
+    
     def render_inspection_history_ui(self):
         """검수 이력 UI 렌더링"""
         st.markdown("### 📊 검수 이력")
@@ -435,12 +499,6 @@ class HybridStreamlitApp:
                 st.error("❌ DynamoDB 서비스가 초기화되지 않았습니다")
                 return
             
-            # 디버깅: 입력 데이터 확인
-            st.write(f"🔍 **디버깅:** 저장할 결과 개수: {len(results)}")
-            st.write(f"🔍 **디버깅:** 첫 번째 결과 샘플:")
-            if results:
-                st.json(results[0])
-            
             # 진행 상태 표시
             progress_placeholder = st.empty()
             status_placeholder = st.empty()
@@ -452,11 +510,6 @@ class HybridStreamlitApp:
             # 진행 상태 제거
             progress_placeholder.empty()
             
-            # 디버깅: 저장 결과 확인
-            st.write(f"🔍 **디버깅:** 저장된 ID 개수: {len(saved_ids) if saved_ids else 0}")
-            if saved_ids:
-                st.write(f"🔍 **디버깅:** 첫 번째 저장 ID: {saved_ids[0]}")
-            
             # 결과 표시
             if saved_ids:
                 with status_placeholder:
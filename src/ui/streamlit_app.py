@@ -5,29 +5,286 @@ Streamlit UI 애플리케이션 모듈
 
 import streamlit as st
 import logging
+import threading
 import time
-from typing import Optional, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple
 from datetime import datetime
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 import base64
+import gzip
+import hashlib
 from io import BytesIO
+from PIL import Image
 from dotenv import load_dotenv
 import json
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# 환경 변수 로드
-load_dotenv()
-
-# 필요한 모듈들 import
+# 필요한 모듈들 import (모듈을 다시 불러와도 경로는 한 번만 추가)
 import sys
 import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+from src.models.inspection_result import InspectionResult
+from src.models.app_config import AppConfig
 
-from services.inspection_service import InspectionService
-from models.inspection_result import InspectionResult
-from models.app_config import AppConfig
+# boto3를 끌어오는 서비스 모듈은 실제로 사용할 때 import
+if TYPE_CHECKING:
+    from src.services.inspection_service import InspectionService
 
 logger = logging.getLogger(__name__)
 
 
+@st.cache_resource(show_spinner=False)
+def _bootstrap() -> bool:
+    """환경 변수 로드 (모듈 재로드와 관계없이 프로세스당 한 번)"""
+    load_dotenv()
+    return True
+
+
+_bootstrap()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_inspection_service() -> "InspectionService":
+    """
+    기본 InspectionService를 프로세스 전체에서 한 번만 생성/초기화
+    (세션/재실행마다 boto3 클라이언트와 프롬프트 관리자를 다시 만들지 않음)
+    
+    여러 세션과 일괄 검수 스레드가 함께 사용하는 공유 객체입니다.
+    검수 요청은 요청마다 새 Strands Agent를 만들어 대화 기록을 공유하지 않고
+    (StrandsAgent._create_agent), 캐시는 잠금으로 보호되므로 요청 처리 중에
+    그 밖의 서비스 상태를 변경하지 않아야 합니다.
+    
+    Returns:
+        InspectionService: 초기화된 검수 서비스
+    """
+    from src.services.inspection_service import InspectionService
+    
+    service = InspectionService(AppConfig.from_env())
+    service.initialize()
+    return service
+
+
+# 매 실행마다 다시 만들지 않도록 정적 마크다운/CSS는 모듈 상수로 한 번만 생성
+_SERVICE_INTRO_MARKDOWN = """
+        ### 📋 서비스 소개
+        AWS Bedrock Nova Pro/Lite 모델과 OpenCV를 활용하여 상품 이미지를 자동으로 검수합니다.
+        
+        **검수 기준:**
+        - 상품 외 배경의 네모 테두리 강조 여부
+        - 브랜드명 외의 불필요한 텍스트 포함 여부
+        - 기타 상품 이미지 품질 기준
+        
+        **기술 스택:**
+        - 🤖 AI 모델: AWS Bedrock Nova Pro/Lite
+        - 🔍 이미지 처리: OpenCV
+        - 📊 데이터 저장: DynamoDB
+        """
+
+_CUSTOM_CSS = """
+        <style>
+        .main {
+            padding-top: 2rem;
+        }
+        
+        .stButton > button {
+            width: 100%;
+            border-radius: 8px;
+            border: none;
+            padding: 0.5rem 1rem;
+            font-weight: 600;
+            transition: all 0.3s ease;
+        }
+        
+        .stButton > button:hover {
+            transform: translateY(-2px);
+            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
+        }
+        
+        .success-box {
+            padding: 1rem;
+            border-radius: 8px;
+            border-left: 4px solid #28a745;
+            background-color: #d4edda;
+            margin: 1rem 0;
+        }
+        
+        .error-box {
+            padding: 1rem;
+            border-radius: 8px;
+            border-left: 4px solid #dc3545;
+            background-color: #f8d7da;
+            margin: 1rem 0;
+        }
+        
+        .metric-container {
+            background-color: #f8f9fa;
+            padding: 1rem;
+            border-radius: 8px;
+            margin: 0.5rem 0;
+        }
+        
+        .stImage > img {
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        </style>
+        """
+
+# 미리보기 이미지 다운로드 타임아웃 (초)
+PREVIEW_FETCH_TIMEOUT = 5
+
+# 미리보기 다운로드용 공유 세션 (keep-alive로 요청마다 TCP/TLS 연결을 새로 맺지 않음)
+_PREVIEW_SESSION = requests.Session()
+_preview_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+)
+_PREVIEW_SESSION.mount("http://", _preview_adapter)
+_PREVIEW_SESSION.mount("https://", _preview_adapter)
+
+
+@st.cache_data(ttl="10m", max_entries=256, show_spinner=False)
+def _fetch_image_bytes(url: str) -> bytes:
+    """
+    미리보기용 이미지 바이트 다운로드 (재실행마다 다시 받지 않도록 캐시)
+    
+    실패 시 예외를 그대로 올려 캐시에 남지 않도록 합니다.
+    
+    Args:
+        url: 이미지 URL
+        
+    Returns:
+        bytes: 이미지 원본 바이트
+    """
+    response = _PREVIEW_SESSION.get(url, timeout=PREVIEW_FETCH_TIMEOUT)
+    response.raise_for_status()
+    return response.content
+
+
+# 다른 세션이 진행 중인 같은 검수를 기다리는 최대 시간 (초)
+INFLIGHT_WAIT_TIMEOUT = 60
+
+
+class _InflightInspections:
+    """
+    같은 서비스/URL에 대한 동시 단일 검수 요청을 하나의 검수 호출로 합침 (세션 간 공유)
+    
+    먼저 들어온 요청만 실제로 검수를 실행하고, 진행 중에 들어온 요청은
+    그 결과를 함께 받습니다. 완료된 결과 재사용은 서비스의 LLM 캐시가 담당합니다.
+    """
+    
+    def __init__(self):
+        """_InflightInspections 초기화"""
+        self._lock = threading.Lock()
+        self._futures: Dict[tuple, Future] = {}
+    
+    def inspect(self, service, image_url: str) -> InspectionResult:
+        """
+        검수 실행 (같은 검수가 진행 중이면 그 결과를 대기)
+        
+        Args:
+            service: 검수 서비스
+            image_url: 검수할 이미지 URL
+            
+        Returns:
+            InspectionResult: 검수 결과
+        """
+        key = (id(service), image_url)
+        with self._lock:
+            future = self._futures.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._futures[key] = future
+        
+        if not is_owner:
+            logger.info(f"진행 중인 동일 검수 결과 대기: {image_url}")
+            return future.result(timeout=INFLIGHT_WAIT_TIMEOUT)
+        
+        try:
+            result = service.inspect_image(image_url)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._futures.pop(key, None)
+
+
+_inflight_inspections = _InflightInspections()
+
+
+# DynamoDB 일괄 저장 전용 백그라운드 워커 (스크립트 스레드를 막지 않음)
+_dynamodb_save_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="dynamodb-save")
+
+# 백그라운드 저장 진행 상태 확인 주기 (초)
+SAVE_STATUS_POLL_INTERVAL = 1.0
+
+# 목록 미리보기 썸네일 최대 변 길이 (픽셀)
+THUMBNAIL_SIZE = 300
+
+
+@st.cache_data(ttl="1h", max_entries=512, show_spinner=False)
+def _fetch_thumbnail(url: str, size: int = THUMBNAIL_SIZE) -> bytes:
+    """
+    목록 미리보기용 축소 JPEG 생성 (원본 대신 작은 이미지만 브라우저로 전송)
+    
+    검수 자체는 원본 URL을 사용하므로 검수 결과에는 영향이 없습니다.
+    
+    Args:
+        url: 이미지 URL
+        size: 썸네일 최대 변 길이
+        
+    Returns:
+        bytes: JPEG 썸네일 바이트
+    """
+    with Image.open(BytesIO(_fetch_image_bytes(url))) as img:
+        img.draft('RGB', (size, size))  # JPEG는 디코딩 단계에서 미리 축소
+        img.thumbnail((size, size))
+        buffer = BytesIO()
+        img.convert('RGB').save(buffer, 'JPEG', quality=80)
+    return buffer.getvalue()
+
+
+@st.cache_data(ttl="30s", show_spinner=False)
+def _health_snapshot(service_id: int, _service) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    서비스 상태/통계 스냅샷 (재실행마다 상태 점검을 반복하지 않도록 30초 캐시)
+    
+    Args:
+        service_id: 캐시 키로 쓰는 서비스 객체 id
+        _service: 검수 서비스 (해시하지 않음)
+        
+    Returns:
+        Tuple[Dict[str, Any], Dict[str, Any]]: (상태 점검 결과, 서비스 통계)
+    """
+    return _service.validate_service_health(), _service.get_service_stats()
+
+
+# 일괄 검수 동시 실행 워커 수 (이미지 다운로드/Bedrock 대기 시간 중첩)
+BATCH_INSPECTION_MAX_WORKERS = 8
+
+# 일괄 검수 진행률 표시 최소 갱신 간격 (초)
+PROGRESS_UPDATE_INTERVAL = 0.25
+
+# 일괄 검수 상세 결과 페이지당 표시 개수
+RESULTS_PAGE_SIZE = 20
+
+# 일괄 검수 전 이미지 선행 다운로드 워커 수 (다운로드만 하므로 검수 워커보다 많게)
+PREFETCH_MAX_WORKERS = 16
+
+# 진행 중인 검수 외에 미리 다운로드해 둘 다음 URL 수 (메모리에 올라가는 이미지 수 상한)
+PREFETCH_LOOKAHEAD = 16
+
+
 class StreamlitApp:
     """Streamlit 애플리케이션 클래스"""
     
@@ -62,12 +319,9 @@ class StreamlitApp:
                     self.is_initialized = True
                     logger.info("외부 검수 서비스 연결 완료")
                 else:
-                    # 기본 InspectionService 초기화
-                    self.config = AppConfig.from_env()
-                    
-                    # InspectionService 초기화
-                    self.inspection_service = InspectionService(self.config)
-                    self.inspection_service.initialize()
+                    # 기본 InspectionService (전체 세션 공유, 최초 1회만 초기화)
+                    self.inspection_service = _get_inspection_service()
+                    self.config = self.inspection_service.config
                     
                     self.is_initialized = True
                     logger.info("기본 검수 서비스 초기화 완료")
@@ -97,20 +351,7 @@ class StreamlitApp:
         st.markdown("---")
         
         # 서비스 설명
-        st.markdown("""
-        ### 📋 서비스 소개
-        AWS Bedrock Nova Pro/Lite 모델과 OpenCV를 활용하여 상품 이미지를 자동으로 검수합니다.
-        
-        **검수 기준:**
-        - 상품 외 배경의 네모 테두리 강조 여부
-        - 브랜드명 외의 불필요한 텍스트 포함 여부
-        - 기타 상품 이미지 품질 기준
-        
-        **기술 스택:**
-        - 🤖 AI 모델: AWS Bedrock Nova Pro/Lite
-        - 🔍 이미지 처리: OpenCV
-        - 📊 데이터 저장: DynamoDB
-        """)
+        st.markdown(_SERVICE_INTRO_MARKDOWN)
         
         st.markdown("---")
     
@@ -191,7 +432,7 @@ class StreamlitApp:
                 for i, url in enumerate(image_urls[:3]):
                     with cols[i]:
                         try:
-                            st.image(url, caption=f"이미지 {i+1}", width=150)
+                            st.image(_fetch_thumbnail(url), caption=f"이미지 {i+1}", width=150)
                         except:
                             st.error(f"이미지 {i+1} 로드 실패")
         
@@ -232,6 +473,12 @@ class StreamlitApp:
         # 일괄 검수 결과 표시
         if 'batch_results' in st.session_state:
             self.render_batch_results(st.session_state.batch_results)
+        
+        # 백그라운드 DynamoDB 저장 상태 표시
+        if 'batch_save_future' in st.session_state:
+            self._render_batch_save_status()
+        elif 'batch_save_outcome' in st.session_state:
+            self._render_batch_save_outcome(st.session_state.batch_save_outcome)
     
     def execute_batch_inspection(self, image_urls: List[str]) -> None:
         """일괄 검수 실행"""
@@ -250,18 +497,35 @@ class StreamlitApp:
         progress_bar = st.progress(0)
         status_text = st.empty()
         
-        results = []
+        total = len(image_urls)
+        results: List[Optional[Dict]] = [None] * total
         
-        for i, url in enumerate(image_urls):
-            # 진행률 업데이트
-            progress = (i + 1) / len(image_urls)
-            progress_bar.progress(progress)
-            status_text.text(f"검수 중... ({i+1}/{len(image_urls)}) {url[:50]}...")
-            
+        # 기본 InspectionService는 미리 받아 둔 이미지로 검수할 수 있으므로
+        # 다음 URL들의 다운로드를 먼저 시작해 Bedrock 호출과 겹치게 함
+        image_handler = None
+        from src.services.inspection_service import InspectionService
+        
+        if isinstance(self.inspection_service, InspectionService):
+            image_handler = self.inspection_service.image_handler
+        
+        # 창 안에 있는 URL의 선행 다운로드 (같은 URL은 한 번만 받고, 마지막 검수가 끝나면 해제)
+        prefetch_futures: Dict[str, Future] = {}
+        prefetch_refs: Dict[str, int] = {}
+        
+        def inspect(url: str, prefetch_future: Optional[Future]) -> Dict:
+            """작업 스레드에서 검수 실행 (Streamlit 호출 없이 결과만 반환)"""
             try:
+                # 선행 다운로드 결과 사용 (실패 시 inspect_image가 직접 다시 받아 오류 처리)
+                image_data = None
+                if prefetch_future is not None and prefetch_future.exception() is None:
+                    image_data = prefetch_future.result()
+                
                 # 검수 실행
-                result = self.inspection_service.inspect_image(url)
-                results.append({
+                if image_data is not None:
+                    result = self.inspection_service.inspect_image(url, image_data=image_data)
+                else:
+                    result = self.inspection_service.inspect_image(url)
+                return {
                     'url': url,
                     'result': result.result,
                     'reason': result.reason,
@@ -269,39 +533,95 @@ class StreamlitApp:
                     'model_id': result.model_id,
                     'prompt_version': result.prompt_version,  # 프롬프트 버전 추가
                     'success': True
-                })
+                }
                 
             except Exception as e:
-                results.append({
+                return {
                     'url': url,
                     'result': False,
                     'reason': f"검수 실패: {str(e)}",
                     'processing_time': 0,
                     'success': False
-                })
+                }
+        
+        with ThreadPoolExecutor(max_workers=PREFETCH_MAX_WORKERS) as prefetcher, \
+                ThreadPoolExecutor(max_workers=BATCH_INSPECTION_MAX_WORKERS) as executor:
+            # 진행 중인 검수와 다음 PREFETCH_LOOKAHEAD개만 메모리에 두고,
+            # 한 건이 끝날 때마다 다음 URL을 추가
+            window = BATCH_INSPECTION_MAX_WORKERS + PREFETCH_LOOKAHEAD
+            pending: Dict[Future, int] = {}
+            next_index = 0
+            done = 0
+            
+            # 진행률 업데이트 (Streamlit 호출은 메인 스레드에서만)
+            # 매 건마다 다시 그리지 않도록 일정 간격 또는 마지막 건에서만 갱신
+            last_update = time.monotonic()
+            
+            while next_index < total or pending:
+                while next_index < total and len(pending) < window:
+                    url = image_urls[next_index]
+                    prefetch_future = None
+                    if image_handler is not None and image_handler.validate_image_url(url):
+                        prefetch_future = prefetch_futures.get(url)
+                        if prefetch_future is None:
+                            prefetch_future = prefetcher.submit(image_handler.fetch_decode_encode, url)
+                            prefetch_futures[url] = prefetch_future
+                        prefetch_refs[url] = prefetch_refs.get(url, 0) + 1
+                    pending[executor.submit(inspect, url, prefetch_future)] = next_index
+                    next_index += 1
+                
+                completed, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in completed:
+                    i = pending.pop(future)
+                    results[i] = future.result()
+                    done += 1
+                    
+                    # 다 쓴 선행 다운로드 결과 해제
+                    url = image_urls[i]
+                    if url in prefetch_refs:
+                        prefetch_refs[url] -= 1
+                        if not prefetch_refs[url]:
+                            del prefetch_refs[url]
+                            del prefetch_futures[url]
+                
+                now = time.monotonic()
+                if now - last_update >= PROGRESS_UPDATE_INTERVAL or done == total:
+                    progress_bar.progress(done / total)
+                    status_text.text(f"검수 중... ({done}/{total})")
+                    last_update = now
         
         # 완료 메시지
         progress_bar.progress(1.0)
         status_text.text("✅ 일괄 검수 완료!")
         
-        # 결과를 세션 상태에 저장
+        # 결과를 세션 상태에 저장 (호출한 render_batch_inspection_ui가 바로 이어서 렌더링)
         st.session_state.batch_results = results
-        
-        # 페이지 새로고침으로 결과 표시
-        st.rerun()
+        st.session_state.batch_results_ts = datetime.now().strftime('%Y%m%d_%H%M%S')
     
+    @st.fragment
     def render_batch_results(self, results: List[Dict]) -> None:
-        """일괄 검수 결과 렌더링"""
+        """일괄 검수 결과 렌더링 (저장/다운로드 버튼 클릭 시 이 영역만 재실행)"""
         if not results:
             return
         
         st.markdown("### 📈 검수 결과 요약")
         
         # 요약 통계
+        # 결과 묶음당 고정된 타임스탬프 (재실행마다 파일명이 바뀌지 않도록)
+        results_ts = st.session_state.setdefault(
+            'batch_results_ts', datetime.now().strftime('%Y%m%d_%H%M%S')
+        )
+        
+        # 한 번의 순회로 합격/불합격 집계
         total_count = len(results)
-        success_count = sum(1 for r in results if r['success'])
-        pass_count = sum(1 for r in results if r['success'] and r['result'])
-        fail_count = sum(1 for r in results if r['success'] and not r['result'])
+        pass_count = fail_count = 0
+        for r in results:
+            if r['success']:
+                if r['result']:
+                    pass_count += 1
+                else:
+                    fail_count += 1
+        success_count = pass_count + fail_count
         error_count = total_count - success_count
         
         # 통계 표시
@@ -318,19 +638,35 @@ class StreamlitApp:
         # 상세 결과 테이블
         st.markdown("### 📋 상세 결과")
         
-        for i, result in enumerate(results):
-            with st.expander(f"이미지 {i+1}: {'✅ 합격' if result['success'] and result['result'] else '❌ 불합격' if result['success'] else '⚠️ 오류'}"):
+        # 한 화면에 RESULTS_PAGE_SIZE개만 렌더링 (대량 일괄 검수 시 위젯/이미지 수 제한)
+        page_count = (total_count + RESULTS_PAGE_SIZE - 1) // RESULTS_PAGE_SIZE
+        page = 1
+        if page_count > 1:
+            page = st.number_input(
+                f"페이지 (총 {page_count}페이지)",
+                min_value=1,
+                max_value=page_count,
+                value=1,
+                step=1,
+                key="batch_results_page"
+            )
+        page_start = (page - 1) * RESULTS_PAGE_SIZE
+        page_results = results[page_start:page_start + RESULTS_PAGE_SIZE]
+        
+        for i, result in enumerate(page_results, page_start):
+            status_label = '✅ 합격' if result['success'] and result['result'] else '❌ 불합격' if result['success'] else '⚠️ 오류'
+            with st.expander(f"이미지 {i+1}: {status_label}"):
                 col1, col2 = st.columns([1, 2])
                 
                 with col1:
                     try:
-                        st.image(result['url'], caption=f"이미지 {i+1}", width=200)
+                        st.image(_fetch_thumbnail(result['url']), caption=f"이미지 {i+1}", width=200)
                     except:
                         st.error("이미지 로드 실패")
                 
                 with col2:
                     st.markdown(f"**URL:** {result['url']}")
-                    st.markdown(f"**결과:** {'✅ 합격' if result['success'] and result['result'] else '❌ 불합격' if result['success'] else '⚠️ 오류'}")
+                    st.markdown(f"**결과:** {status_label}")
                     st.markdown(f"**사유:** {result['reason']}")
                     if result['success']:
                         st.markdown(f"**처리 시간:** {result['processing_time']:.2f}초")
@@ -344,15 +680,14 @@ class StreamlitApp:
             col1, col2 = st.columns(2)
             
             with col1:
-                json_str = json.dumps(results, ensure_ascii=False, indent=2)
-                import time
-                unique_key = f"download_results_{int(time.time() * 1000000)}"  # 마이크로초 단위 타임스탬프
+                # 내용 기반 고정 키 (재실행마다 위젯을 새로 만들지 않음)
+                json_gz, download_key = self._get_results_json(results)
                 st.download_button(
-                    label="📥 결과 JSON 다운로드",
-                    data=json_str,
-                    file_name=f"batch_inspection_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                    mime="application/json",
-                    key=unique_key
+                    label="📥 결과 JSON 다운로드 (.json.gz)",
+                    data=json_gz,
+                    file_name=f"batch_inspection_results_{results_ts}.json.gz",
+                    mime="application/gzip",
+                    key=download_key
                 )
             
             with col2:
@@ -362,9 +697,26 @@ class StreamlitApp:
                 
                 button_clicked = st.button("💾 DynamoDB에 저장", key=st.session_state.batch_save_key)
                 if button_clicked:
-                    st.write("🔍 **디버깅:** 버튼이 클릭되었습니다!")
                     self._save_batch_to_dynamodb(results)
     
+    def _get_results_json(self, results: List[Dict]) -> Tuple[bytes, str]:
+        """
+        gzip 압축한 일괄 검수 결과 JSON과 다운로드 버튼 키 반환
+        
+        결과 리스트가 바뀌지 않은 재실행에서는 직렬화/압축을 반복하지 않도록
+        같은 리스트 객체에 대한 결과를 세션에 보관합니다.
+        
+        Returns:
+            Tuple[bytes, str]: (gzip 압축 JSON, 내용 해시 기반 위젯 키)
+        """
+        cached = st.session_state.get('_batch_results_json')
+        if cached is None or cached[0] is not results:
+            json_bytes = json.dumps(results, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            digest = hashlib.md5(json_bytes).hexdigest()[:12]
+            cached = (results, gzip.compress(json_bytes, mtime=0), f"download_results_{digest}")
+            st.session_state['_batch_results_json'] = cached
+        return cached[1], cached[2]
+    
     def _test_dynamodb_connection(self) -> None:
         """DynamoDB 연결 상태 테스트"""
         try:
@@ -426,59 +778,102 @@ class StreamlitApp:
                 st.warning("💡 네트워크 연결이나 AWS 설정을 확인해주세요")
     
     def _save_batch_to_dynamodb(self, results: List[Dict]) -> None:
-        """일괄 검수 결과를 DynamoDB에 저장"""
-        try:
-            if not hasattr(self.inspection_service, 'dynamodb_service'):
-                st.error("❌ DynamoDB 서비스가 초기화되지 않았습니다")
-                return
-            
-            # 디버깅: 입력 데이터 확인
-            st.write(f"🔍 **디버깅:** 저장할 결과 개수: {len(results)}")
-            st.write(f"🔍 **디버깅:** 첫 번째 결과 샘플:")
-            if results:
-                st.json(results[0])
-            
-            # 진행 상태 표시
-            progress_placeholder = st.empty()
-            status_placeholder = st.empty()
+        """일괄 검수 결과 DynamoDB 저장 요청 (백그라운드 워커에서 실행하고 즉시 반환)"""
+        if not hasattr(self.inspection_service, 'dynamodb_service'):
+            st.error("❌ DynamoDB 서비스가 초기화되지 않았습니다")
+            return
+        
+        pending = st.session_state.get('batch_save_future')
+        if pending is not None and not pending.done():
+            st.info("⏳ 이전 저장 작업이 아직 진행 중입니다")
+            return
+        
+        # 작업 스레드는 session_state 대신 이 dict에 진행 상황만 기록
+        progress = {'done': 0, 'total': len(results)}
+        st.session_state.batch_save_progress = progress
+        st.session_state.batch_save_future = _dynamodb_save_executor.submit(
+            self._write_batch_chunks, self.inspection_service.dynamodb_service, results, progress
+        )
+        st.session_state.pop('batch_save_outcome', None)
+        
+        # 결과 영역(fragment) 밖의 저장 상태 표시를 띄우기 위해 전체 재실행
+        st.rerun()
+    
+    @staticmethod
+    def _write_batch_chunks(dynamodb_service, results: List[Dict], progress: Dict[str, int]) -> List[str]:
+        """
+        BatchWriteItem 한 번에 들어가는 25개 단위로 나누어 저장 (백그라운드 스레드)
+        
+        Args:
+            dynamodb_service: DynamoDB 서비스
+            results: 저장할 일괄 검수 결과
+            progress: 진행 상황 기록용 dict ('done', 'total')
             
-            with progress_placeholder:
-                with st.spinner(f"DynamoDB에 {len(results)}개 결과 저장 중..."):
-                    saved_ids = self.inspection_service.dynamodb_service.save_batch_results(results)
+        Returns:
+            List[str]: 저장된 항목 ID 리스트
+        """
+        from src.services.dynamodb_service import BATCH_WRITE_SIZE
+        
+        saved_ids = []
+        for start in range(0, len(results), BATCH_WRITE_SIZE):
+            chunk = results[start:start + BATCH_WRITE_SIZE]
+            saved_ids.extend(dynamodb_service.save_batch_results(chunk))
+            progress['done'] = min(start + BATCH_WRITE_SIZE, len(results))
+        return saved_ids
+    
+    @st.fragment(run_every=SAVE_STATUS_POLL_INTERVAL)
+    def _render_batch_save_status(self) -> None:
+        """진행 중인 백그라운드 저장 상태를 주기적으로 확인"""
+        future = st.session_state.get('batch_save_future')
+        if future is None:
+            return
+        
+        if not future.done():
+            progress = st.session_state.batch_save_progress
+            total = max(progress['total'], 1)
+            st.progress(
+                progress['done'] / total,
+                text=f"DynamoDB 저장 중... ({progress['done']}/{progress['total']})"
+            )
+            return
+        
+        # 완료되면 결과를 보관하고 전체 재실행으로 주기적 확인 중단
+        try:
+            outcome = {'saved_ids': future.result(), 'error': None}
+        except Exception as e:
+            outcome = {'saved_ids': [], 'error': str(e)}
+        outcome['total'] = st.session_state.batch_save_progress['total']
+        outcome['finished_at'] = datetime.now()
+        
+        st.session_state.batch_save_outcome = outcome
+        del st.session_state.batch_save_future
+        st.rerun()
+    
+    def _render_batch_save_outcome(self, outcome: Dict[str, Any]) -> None:
+        """백그라운드 저장 결과 표시"""
+        saved_ids = outcome['saved_ids']
+        total = outcome['total']
+        
+        if outcome['error']:
+            st.error("❌ **저장 오류!** DynamoDB 저장 중 오류가 발생했습니다")
+            st.code(f"오류 내용: {outcome['error']}")
+            st.warning("💡 네트워크 연결이나 AWS 설정을 확인해주세요")
+        elif saved_ids:
+            st.success(f"✅ **저장 완료!** {len(saved_ids)}개 결과를 DynamoDB에 저장했습니다")
             
-            # 진행 상태 제거
-            progress_placeholder.empty()
+            # 성공률 표시
+            success_rate = len(saved_ids) / total * 100
+            st.info(f"📊 **성공률:** {success_rate:.1f}% ({len(saved_ids)}/{total})")
             
-            # 디버깅: 저장 결과 확인
-            st.write(f"🔍 **디버깅:** 저장된 ID 개수: {len(saved_ids) if saved_ids else 0}")
-            if saved_ids:
-                st.write(f"🔍 **디버깅:** 첫 번째 저장 ID: {saved_ids[0]}")
+            # 저장된 ID들 표시
+            with st.expander("📋 저장된 항목 ID들 보기"):
+                for i, saved_id in enumerate(saved_ids, 1):
+                    st.code(f"{i:2d}. {saved_id}")
             
-            # 결과 표시
-            if saved_ids:
-                with status_placeholder:
-                    st.success(f"✅ **저장 완료!** {len(saved_ids)}개 결과를 DynamoDB에 저장했습니다")
-                    
-                    # 성공률 표시
-                    success_rate = len(saved_ids) / len(results) * 100
-                    st.info(f"📊 **성공률:** {success_rate:.1f}% ({len(saved_ids)}/{len(results)})")
-                    
-                    # 저장된 ID들 표시
-                    with st.expander("📋 저장된 항목 ID들 보기"):
-                        for i, saved_id in enumerate(saved_ids, 1):
-                            st.code(f"{i:2d}. {saved_id}")
-                    
-                    st.caption(f"⏰ 저장 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            else:
-                with status_placeholder:
-                    st.error("❌ **저장 실패!** DynamoDB 저장에 실패했습니다")
-                    st.warning("💡 AWS 자격 증명이나 권한을 확인해주세요")
-                    
-        except Exception as e:
-            with status_placeholder:
-                st.error("❌ **저장 오류!** DynamoDB 저장 중 오류가 발생했습니다")
-                st.code(f"오류 내용: {str(e)}")
-                st.warning("💡 네트워크 연결이나 AWS 설정을 확인해주세요")
+            st.caption(f"⏰ 저장 시간: {outcome['finished_at'].strftime('%Y-%m-%d %H:%M:%S')}")
+        else:
+            st.error("❌ **저장 실패!** DynamoDB 저장에 실패했습니다")
+            st.warning("💡 AWS 자격 증명이나 권한을 확인해주세요")
     
     def render_image_url_input(self) -> str:
         """이미지 URL 입력 필드 렌더링"""
@@ -505,7 +900,7 @@ class StreamlitApp:
             
             # Streamlit의 이미지 표시 기능 사용
             try:
-                st.image(image_url, caption="검수 대상 이미지", width="stretch")
+                st.image(_fetch_image_bytes(image_url), caption="검수 대상 이미지", width="stretch")
                 st.success("✅ 이미지 로드 성공")
             except Exception as e:
                 st.error(f"❌ 이미지 로드 실패: {str(e)}")
@@ -547,62 +942,18 @@ class StreamlitApp:
             )
         
         # 결과 지우기 버튼 처리
+        # (버튼 클릭으로 이미 재실행 중이고 결과 컬럼은 이 뒤에 그려지므로 추가 재실행 불필요)
         if clear_button:
-            if 'inspection_result' in st.session_state:
-                del st.session_state.inspection_result
-            st.rerun()
+            st.session_state.pop('inspection_result', None)
         
         return inspect_button
     
-    def render_loading_state(self) -> None:
-        """로딩 상태 표시"""
-        with st.spinner("🔄 이미지 검수 중..."):
-            # 진행률 표시
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            
-            steps = [
-                "이미지 다운로드 중...",
-                "AI 모델에 요청 중...",
-                "결과 분석 중...",
-                "검수 완료!"
-            ]
-            
-            for i, step in enumerate(steps):
-                status_text.text(step)
-                progress_bar.progress((i + 1) / len(steps))
-                time.sleep(0.5)  # 시각적 효과를 위한 지연
-            
-            # 정리
-            progress_bar.empty()
-            status_text.empty()
-    
     def execute_inspection(self, image_url: str) -> None:
         """검수 실행"""
         try:
-            # 로딩 상태 표시
+            # 검수가 끝나는 즉시 결과 표시 (인위적인 대기 없음)
             with st.spinner("🔄 이미지 검수 중..."):
-                # 진행률 표시
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                
-                # 단계별 진행
-                status_text.text("🔄 이미지 다운로드 중...")
-                progress_bar.progress(0.25)
-                
-                # 실제 검수 실행
-                result = self.inspection_service.inspect_image(image_url)
-                
-                status_text.text("🔄 AI 분석 중...")
-                progress_bar.progress(0.75)
-                
-                status_text.text("✅ 검수 완료!")
-                progress_bar.progress(1.0)
-                
-                # 잠시 대기 후 정리
-                time.sleep(0.5)
-                progress_bar.empty()
-                status_text.empty()
+                result = _inflight_inspections.inspect(self.inspection_service, image_url)
             
             # 결과를 세션 상태에 저장
             st.session_state.inspection_result = result
@@ -613,15 +964,15 @@ class StreamlitApp:
             else:
                 st.warning("⚠️ 검수 완료: 이미지가 기준에 부합하지 않습니다.")
             
-            # 페이지 새로고침하여 결과 표시
-            st.rerun()
+            # 결과는 render_single_inspection_ui의 결과 컬럼이 같은 실행 안에서 바로 표시
             
         except Exception as e:
             st.error(f"❌ 검수 실행 중 오류가 발생했습니다: {str(e)}")
             logger.error(f"검수 실행 오류: {str(e)}")
     
+    @st.fragment
     def render_inspection_result(self, result: InspectionResult) -> None:
-        """검수 결과 표시"""
+        """검수 결과 표시 (저장/연결 테스트 버튼 클릭 시 이 영역만 재실행)"""
         if not result:
             return
         
@@ -683,7 +1034,7 @@ class StreamlitApp:
             st.download_button(
                 label="📄 JSON으로 다운로드",
                 data=json_data,
-                file_name=f"inspection_result_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                file_name=f"inspection_result_{result.timestamp.strftime('%Y%m%d_%H%M%S')}.json",
                 mime="application/json",
                 help="검수 결과를 JSON 파일로 다운로드합니다"
             )
@@ -702,88 +1053,45 @@ class StreamlitApp:
             return
         
         # 사이드바에 서비스 상태 표시
+        # (fragment 안에서는 st.sidebar를 열 수 없으므로 사이드바 안에서 fragment 호출)
         with st.sidebar:
-            st.markdown("### 🔧 서비스 상태")
+            self._render_service_status_panel()
+    
+    @st.fragment
+    def _render_service_status_panel(self) -> None:
+        """서비스 상태 패널 (다른 영역과 독립적으로 재실행)"""
+        st.markdown("### 🔧 서비스 상태")
+        
+        try:
+            health_status, stats = _health_snapshot(id(self.inspection_service), self.inspection_service)
+            overall_status = health_status.get('overall_status', 'unknown')
             
-            try:
-                health_status = self.inspection_service.validate_service_health()
-                overall_status = health_status.get('overall_status', 'unknown')
-                
-                if overall_status == 'healthy':
-                    st.success("✅ 서비스 정상")
+            if overall_status == 'healthy':
+                st.success("✅ 서비스 정상")
+            else:
+                st.warning("⚠️ 서비스 이상")
+            
+            # 컴포넌트별 상태
+            components = health_status.get('components', {})
+            for component, status in components.items():
+                component_status = status.get('status', 'unknown')
+                if component_status == 'healthy':
+                    st.text(f"✅ {component}")
                 else:
-                    st.warning("⚠️ 서비스 이상")
-                
-                # 컴포넌트별 상태
-                components = health_status.get('components', {})
-                for component, status in components.items():
-                    component_status = status.get('status', 'unknown')
-                    if component_status == 'healthy':
-                        st.text(f"✅ {component}")
-                    else:
-                        st.text(f"❌ {component}")
-                
-                # 서비스 통계
-                st.markdown("### 📊 서비스 정보")
-                stats = self.inspection_service.get_service_stats()
-                
-                st.text(f"버전: {stats.get('version', 'N/A')}")
-                st.text(f"지원 형식: {len(stats.get('supported_formats', []))}개")
-                
-            except Exception as e:
-                st.error(f"상태 확인 실패: {str(e)}")
+                    st.text(f"❌ {component}")
+            
+            # 서비스 통계
+            st.markdown("### 📊 서비스 정보")
+            
+            st.text(f"버전: {stats.get('version', 'N/A')}")
+            st.text(f"지원 형식: {len(stats.get('supported_formats', []))}개")
+            
+        except Exception as e:
+            st.error(f"상태 확인 실패: {str(e)}")
     
     def _apply_custom_styles(self) -> None:
         """커스텀 CSS 스타일 적용"""
-        st.markdown("""
-        <style>
-        .main {
-            padding-top: 2rem;
-        }
-        
-        .stButton > button {
-            width: 100%;
-            border-radius: 8px;
-            border: none;
-            padding: 0.5rem 1rem;
-            font-weight: 600;
-            transition: all 0.3s ease;
-        }
-        
-        .stButton > button:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        }
-        
-        .success-box {
-            padding: 1rem;
-            border-radius: 8px;
-            border-left: 4px solid #28a745;
-            background-color: #d4edda;
-            margin: 1rem 0;
-        }
-        
-        .error-box {
-            padding: 1rem;
-            border-radius: 8px;
-            border-left: 4px solid #dc3545;
-            background-color: #f8d7da;
-            margin: 1rem 0;
-        }
-        
-        .metric-container {
-            background-color: #f8f9fa;
-            padding: 1rem;
-            border-radius: 8px;
-            margin: 0.5rem 0;
-        }
-        
-        .stImage > img {
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        </style>
-        """, unsafe_allow_html=True)
+        st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
 
 
 def main():
@@ -13,8 +13,10 @@ load_dotenv()
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from handlers.image_handler import ImageHandler
+from script_helpers import cached_fetch
 
-def test_single_image(image_url: str, debug: bool = False):
+
+def test_single_image(image_url: str, debug: bool = False, use_cache: bool = True):
     """단일 이미지 테스트"""
     print(f"\n{'='*80}")
     print(f"테스트 이미지: {image_url}")
@@ -26,10 +28,10 @@ def test_single_image(image_url: str, debug: bool = False):
         
         # 이미지 다운로드
         print("📥 이미지 다운로드 중...")
-        image_bytes = handler.fetch_image_from_url(image_url)
+        image_bytes = cached_fetch(handler, image_url, use_cache)
         
         # 이미지 정보 출력
-        image_info = handler.get_image_info(image_bytes)
+        image_info = handler.get_image_size(image_bytes)
         print(f"✅ 다운로드 완료: {len(image_bytes)} bytes")
         print(f"   크기: {image_info['width']}x{image_info['height']}px")
         print(f"   포맷: {image_info['format']}")
@@ -62,12 +64,14 @@ def test_single_image(image_url: str, debug: bool = False):
         
     except Exception as e:
         print(f"❌ 오류 발생: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        # 스택 트레이스는 디버깅 모드에서만 출력 (실패가 많은 일괄 실행 시 출력 비용 절감)
+        if debug:
+            import traceback
+            traceback.print_exc()
         return None, None, None
 
 
-def test_multiple_images():
+def test_multiple_images(use_cache: bool = True):
     """여러 이미지 테스트"""
     test_images = [
         {
@@ -102,7 +106,7 @@ def test_multiple_images():
         print(f"\n[{i}/{len(test_images)}] {test_case['description']}")
         print(f"예상 결과: {test_case['expected']}")
         
-        has_border, analysis, confidence = test_single_image(test_case['url'])
+        has_border, analysis, confidence = test_single_image(test_case['url'], use_cache=use_cache)
         
         if has_border is not None:
             actual = "반려" if has_border else "통과"
@@ -143,16 +147,17 @@ if __name__ == "__main__":
     parser.add_argument('--url', type=str, help='테스트할 이미지 URL')
     parser.add_argument('--batch', action='store_true', help='일괄 테스트 실행')
     parser.add_argument('--debug', action='store_true', help='디버깅 모드')
+    parser.add_argument('--no-cache', action='store_true', help='로컬 이미지 캐시 사용 안 함')
     
     args = parser.parse_args()
     
     if args.batch:
         # 일괄 테스트
-        test_multiple_images()
+        test_multiple_images(use_cache=not args.no_cache)
     elif args.url:
         # 단일 이미지 테스트
-        test_single_image(args.url, debug=args.debug)
+        test_single_image(args.url, debug=args.debug, use_cache=not args.no_cache)
     else:
         # 기본: 바지 3개 이미지 테스트
         print("기본 테스트: 바지 3개 이미지 (화면 꽉 참)")
-        test_single_image("https://shop-phinf.pstatic.net/20250827_216/1756283489529JdvK2_JPEG/10956576108406294_746306671.jpg", debug=args.debug)
+        test_single_image("https://shop-phinf.pstatic.net/20250827_216/1756283489529JdvK2_JPEG/10956576108406294_746306671.jpg", debug=args.debug, use_cache=not args.no_cache)
@@ -4,8 +4,9 @@ test_list.txt 파일에서 URL을 읽어서 테스트
 
 import sys
 import os
+import re
 from dotenv import load_dotenv
-import json
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 # 환경 변수 로드
@@ -15,21 +16,32 @@ load_dotenv()
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from handlers.image_handler import ImageHandler
+from script_helpers import _init_detect_worker, dump_json_bytes, fetch_and_detect
+
+
+# 'http'로 시작하는 줄의 앞뒤 공백을 제거해 추출 (바이너리 모드로 읽어 줄 단위 디코딩 생략)
+URL_RE = re.compile(rb'^\s*(http.*?)\s*$')
 
 
 def read_urls_from_file(filename='test_list.txt'):
     """파일에서 URL 읽기"""
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            urls = [line.strip() for line in f if line.strip() and line.strip().startswith('http')]
+        with open(filename, 'rb') as f:
+            urls = [m.group(1).decode('utf-8') for line in f for m in (URL_RE.match(line),) if m]
         return urls
     except FileNotFoundError:
         print(f"❌ 파일을 찾을 수 없습니다: {filename}")
         return []
 
 
-def test_urls_from_file():
-    """파일에서 읽은 URL 테스트"""
+def test_urls_from_file(pretty=False, use_cache=True):
+    """
+    파일에서 읽은 URL 테스트
+    
+    Args:
+        pretty: True면 결과 JSON을 들여쓰기해서 저장 (기본은 압축 형식)
+        use_cache: 다운로드한 이미지를 로컬 디스크에 캐시해 재실행 시 재사용
+    """
     
     # URL 읽기
     test_urls = read_urls_from_file('test_list.txt')
@@ -38,63 +50,74 @@ def test_urls_from_file():
         print("❌ 테스트할 URL이 없습니다.")
         return
     
+    # 실행 시각은 한 번만 구해 출력/파일명/리포트에 공통 사용
+    run_ts = datetime.now()
+    run_ts_str = run_ts.strftime('%Y-%m-%d %H:%M:%S')
+    run_ts_file = run_ts.strftime('%Y%m%d_%H%M%S')
+    
     print("="*80)
     print("🧪 test_list.txt 파일 기반 테스트")
     print("="*80)
     print(f"파일: test_list.txt")
     print(f"테스트 이미지 수: {len(test_urls)}개")
-    print(f"테스트 시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"테스트 시작 시간: {run_ts_str}")
     print("="*80)
     
     handler = ImageHandler()
     results = []
     
-    for i, url in enumerate(test_urls, 1):
-        print(f"\n[{i}/{len(test_urls)}] 테스트 중...")
-        print(f"URL: {url}")
+    # 이미지 다운로드와 테두리 탐지(여러 프로세스)를 겹쳐 실행하고 결과는 순서대로 출력
+    detect_workers = max(1, min(os.cpu_count() or 1, len(test_urls)))
+    with ProcessPoolExecutor(max_workers=detect_workers, initializer=_init_detect_worker) as executor:
+        pipeline = fetch_and_detect(handler, test_urls, executor, use_cache)
         
-        try:
-            # 이미지 다운로드
-            image_bytes = handler.fetch_image_from_url(url)
-            image_info = handler.get_image_info(image_bytes)
-            
-            print(f"  ✅ 다운로드 완료: {len(image_bytes):,} bytes")
-            print(f"  📐 크기: {image_info['width']}x{image_info['height']}px")
-            
-            # OpenCV 테두리 탐지
-            has_border, analysis, confidence = handler.detect_border_opencv(image_bytes)
-            
-            # 결과 저장
-            result = {
-                "index": i,
-                "url": url,
-                "image_size": f"{image_info['width']}x{image_info['height']}",
-                "image_format": image_info['format'],
-                "file_size_bytes": len(image_bytes),
-                "has_border": has_border,
-                "confidence": round(confidence * 100, 2),
-                "analysis": analysis,
-                "judgment": "반려 (테두리 있음)" if has_border else "통과 (테두리 없음)",
-                "status": "❌ 반려" if has_border else "✅ 통과"
-            }
+        for i, (url, (downloaded, detection)) in enumerate(zip(test_urls, pipeline), 1):
+            print(f"\n[{i}/{len(test_urls)}] 테스트 중...")
+            print(f"URL: {url}")
             
-            results.append(result)
+            try:
+                if isinstance(downloaded, Exception):
+                    raise downloaded
+                image_bytes = downloaded
+                image_info = handler.get_image_size(image_bytes)
+                
+                print(f"  ✅ 다운로드 완료: {len(image_bytes):,} bytes")
+                print(f"  📐 크기: {image_info['width']}x{image_info['height']}px")
+                
+                # OpenCV 테두리 탐지
+                has_border, analysis, confidence = detection.result()
+                
+                # 결과 저장
+                result = {
+                    "index": i,
+                    "url": url,
+                    "image_size": f"{image_info['width']}x{image_info['height']}",
+                    "image_format": image_info['format'],
+                    "file_size_bytes": len(image_bytes),
+                    "has_border": has_border,
+                    "confidence": round(confidence * 100, 2),
+                    "analysis": analysis,
+                    "judgment": "반려 (테두리 있음)" if has_border else "통과 (테두리 없음)",
+                    "status": "❌ 반려" if has_border else "✅ 통과"
+                }
+                
+                results.append(result)
+                
+                # 콘솔 출력
+                print(f"  🔍 테두리 탐지: {result['status']}")
+                print(f"  📊 신뢰도: {result['confidence']}%")
+                print(f"  📝 분석: {analysis}")
+                
+            except Exception as e:
+                print(f"  ❌ 오류: {str(e)}")
+                results.append({
+                    "index": i,
+                    "url": url,
+                    "error": str(e),
+                    "status": "⚠️ 오류"
+                })
             
-            # 콘솔 출력
-            print(f"  🔍 테두리 탐지: {result['status']}")
-            print(f"  📊 신뢰도: {result['confidence']}%")
-            print(f"  📝 분석: {analysis}")
-            
-        except Exception as e:
-            print(f"  ❌ 오류: {str(e)}")
-            results.append({
-                "index": i,
-                "url": url,
-                "error": str(e),
-                "status": "⚠️ 오류"
-            })
-        
-        print("-"*80)
+            print("-"*80)
     
     # 결과 요약
     print("\n" + "="*80)
@@ -107,8 +130,10 @@ def test_urls_from_file():
     error_count = len(results) - len(success_results)
     
     print(f"총 테스트: {len(results)}개")
-    print(f"✅ 통과: {pass_count}개 ({pass_count/len(results)*100:.1f}%)")
-    print(f"❌ 반려: {fail_count}개 ({fail_count/len(results)*100:.1f}%)")
+    pass_rate = pass_count / len(results) * 100
+    fail_rate = fail_count / len(results) * 100
+    print(f"✅ 통과: {pass_count}개 ({pass_rate:.1f}%)")
+    print(f"❌ 반려: {fail_count}개 ({fail_rate:.1f}%)")
     print(f"⚠️  오류: {error_count}개")
     print("="*80)
     
@@ -125,79 +150,90 @@ def test_urls_from_file():
     print("-"*80)
     
     # JSON 파일로 저장
-    output_file = f"test_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump({
+    output_file = f"test_results_{run_ts_file}.json"
+    with open(output_file, 'wb') as f:
+        f.write(dump_json_bytes({
             "source_file": "test_list.txt",
-            "test_date": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            "test_date": run_ts_str,
             "total_count": len(results),
             "pass_count": pass_count,
             "fail_count": fail_count,
             "error_count": error_count,
-            "pass_rate": round(pass_count / len(results) * 100, 2) if results else 0,
+            "pass_rate": round(pass_rate, 2),
             "results": results
-        }, f, ensure_ascii=False, indent=2)
+        }, pretty))
     
     print(f"\n💾 결과 저장 완료: {output_file}")
     
     # 마크다운 리포트 생성
-    markdown_file = f"test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
-    generate_markdown_report(results, pass_count, fail_count, error_count, markdown_file)
+    markdown_file = f"test_report_{run_ts_file}.md"
+    generate_markdown_report(results, pass_count, fail_count, error_count, markdown_file, run_ts_str)
     print(f"📄 리포트 생성 완료: {markdown_file}")
     
     return results
 
 
-def generate_markdown_report(results, pass_count, fail_count, error_count, filename):
-    """마크다운 리포트 생성"""
+def generate_markdown_report(results, pass_count, fail_count, error_count, filename, test_date):
+    """마크다운 리포트 생성 (test_date는 호출자가 구한 실행 시각 문자열, 내부에서 시각을 새로 구하지 않음)"""
     
-    with open(filename, 'w', encoding='utf-8') as f:
-        f.write("# 🔍 OpenCV 테두리 탐지 테스트 리포트\n\n")
-        f.write(f"**소스 파일**: test_list.txt\n\n")
-        f.write(f"**테스트 일시**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+    # 비율은 한 번만 계산해서 재사용 (호출 전에 빈 결과는 걸러짐)
+    pass_rate = pass_count / len(results) * 100
+    fail_rate = fail_count / len(results) * 100
+    
+    # 리포트 조각을 모아 한 번에 기록
+    parts = [
+        "# 🔍 OpenCV 테두리 탐지 테스트 리포트\n\n",
+        "**소스 파일**: test_list.txt\n\n",
+        f"**테스트 일시**: {test_date}\n\n",
         
         # 요약
-        f.write("## 📊 테스트 요약\n\n")
-        f.write(f"- **총 테스트**: {len(results)}개\n")
-        f.write(f"- **✅ 통과**: {pass_count}개 ({pass_count/len(results)*100:.1f}%)\n")
-        f.write(f"- **❌ 반려**: {fail_count}개 ({fail_count/len(results)*100:.1f}%)\n")
-        f.write(f"- **⚠️ 오류**: {error_count}개\n\n")
+        "## 📊 테스트 요약\n\n",
+        f"- **총 테스트**: {len(results)}개\n",
+        f"- **✅ 통과**: {pass_count}개 ({pass_rate:.1f}%)\n",
+        f"- **❌ 반려**: {fail_count}개 ({fail_rate:.1f}%)\n",
+        f"- **⚠️ 오류**: {error_count}개\n\n",
         
         # 통과율
-        if len(results) > 0:
-            pass_rate = (pass_count / len(results)) * 100
-            f.write(f"**통과율**: {pass_rate:.1f}%\n\n")
-        
-        # 상세 결과
-        f.write("## 📋 상세 결과\n\n")
-        
-        for result in results:
-            f.write(f"### {result['index']}. {result['status']}\n\n")
-            
-            if "error" in result:
-                f.write(f"**URL**: {result['url']}\n\n")
-                f.write(f"**오류**: {result['error']}\n\n")
-            else:
-                f.write(f"**URL**: {result['url']}\n\n")
-                f.write(f"**이미지 크기**: {result['image_size']}\n\n")
-                f.write(f"**파일 크기**: {result['file_size_bytes']:,} bytes\n\n")
-                f.write(f"**판정**: {result['judgment']}\n\n")
-                f.write(f"**신뢰도**: {result['confidence']}%\n\n")
-                f.write(f"**분석 내용**:\n```\n{result['analysis']}\n```\n\n")
-            
-            f.write("---\n\n")
-        
-        # 설정 정보
-        f.write("## ⚙️ 테스트 설정\n\n")
-        f.write("- **중앙 마스킹**: 95%\n")
-        f.write("- **가장자리 영역**: 2.5%\n")
-        f.write("- **색상 범위**: 20% ~ 95%\n")
-        f.write("- **엣지 임계값**: 15%\n")
-        f.write("- **신뢰도 임계값**: 15%\n\n")
-        
-        f.write("---\n\n")
-        f.write("*Generated by OpenCV Border Detection Test*\n")
-
+        f"**통과율**: {pass_rate:.1f}%\n\n",
+    ]
+    
+    # 상세 결과 (항목당 문자열 하나)
+    parts.append("## 📋 상세 결과\n\n")
+    
+    for result in results:
+        if "error" in result:
+            parts.append(
+                f"### {result['index']}. {result['status']}\n\n"
+                f"**URL**: {result['url']}\n\n"
+                f"**오류**: {result['error']}\n\n"
+                "---\n\n"
+            )
+        else:
+            parts.append(
+                f"### {result['index']}. {result['status']}\n\n"
+                f"**URL**: {result['url']}\n\n"
+                f"**이미지 크기**: {result['image_size']}\n\n"
+                f"**파일 크기**: {result['file_size_bytes']:,} bytes\n\n"
+                f"**판정**: {result['judgment']}\n\n"
+                f"**신뢰도**: {result['confidence']}%\n\n"
+                f"**분석 내용**:\n```\n{result['analysis']}\n```\n\n"
+                "---\n\n"
+            )
+    
+    # 설정 정보
+    parts.append(
+        "## ⚙️ 테스트 설정\n\n"
+        "- **중앙 마스킹**: 95%\n"
+        "- **가장자리 영역**: 2.5%\n"
+        "- **색상 범위**: 20% ~ 95%\n"
+        "- **엣지 임계값**: 15%\n"
+        "- **신뢰도 임계값**: 15%\n\n"
+        "---\n\n"
+        "*Generated by OpenCV Border Detection Test*\n"
+    )
+    
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.writelines(parts)
 
 if __name__ == "__main__":
-    test_urls_from_file()
+    test_urls_from_file(pretty='--pretty' in sys.argv[1:], use_cache='--no-cache' not in sys.argv[1:])
@@ -0,0 +1,72 @@
+"""
+하이브리드 검수 Claude 재검수 판단 테스트
+"""
+
+import unittest
+from datetime import datetime
+
+from src.models.inspection_result import InspectionResult
+
+try:
+    from src.services.hybrid_inspection_service import (
+        HybridInspectionService, SHORT_REASON_TRUST_LENGTH
+    )
+    _IMPORT_ERROR = None
+except ImportError as e:  # boto3/OpenCV 등 서비스 의존성이 없는 환경
+    _IMPORT_ERROR = e
+
+
+def _nova_result(result: bool, reason: str) -> InspectionResult:
+    """Nova Pro 1차 검수 결과 생성"""
+    return InspectionResult(
+        image_url="https://example.com/image.jpg",
+        result=result,
+        reason=reason,
+        timestamp=datetime.now(),
+        processing_time=0.0,
+        raw_response=""
+    )
+
+
+@unittest.skipIf(_IMPORT_ERROR is not None, f"하이브리드 검수 서비스 의존성 없음: {_IMPORT_ERROR}")
+class NeedsClaudeRecheckTest(unittest.TestCase):
+    """_needs_claude_recheck 판단 규칙"""
+
+    def setUp(self):
+        # 판단 로직은 모델/AWS 연결과 무관하므로 초기화 없이 인스턴스만 생성
+        self.service = HybridInspectionService.__new__(HybridInspectionService)
+
+    def needs_recheck(self, result: bool, reason: str) -> bool:
+        return self.service._needs_claude_recheck(_nova_result(result, reason))
+
+    def test_short_clean_pass_is_trusted(self):
+        self.assertFalse(self.needs_recheck(True, "상품만 깔끔하게 촬영된 이미지입니다."))
+
+    def test_short_pass_mentioning_border_is_rechecked(self):
+        for reason in ("얇은 흰색 테두리가 보이지만 통과", "가장자리에 회색 라인 있음",
+                       "Thin frame around product", "Small border on the left edge"):
+            with self.subTest(reason=reason):
+                self.assertLess(len(reason), SHORT_REASON_TRUST_LENGTH)
+                self.assertTrue(self.needs_recheck(True, reason))
+
+    def test_short_hedged_pass_is_rechecked(self):
+        self.assertTrue(self.needs_recheck(True, "아마 문제 없는 이미지로 보입니다."))
+        self.assertTrue(self.needs_recheck(True, "Looks fine but might be cropped."))
+
+    def test_long_pass_is_rechecked(self):
+        reason = "상품 이미지가 전체적으로 선명하고 배경도 단색입니다. " * 4
+        self.assertGreaterEqual(len(reason), SHORT_REASON_TRUST_LENGTH)
+        self.assertTrue(self.needs_recheck(True, reason))
+
+    def test_explicit_clean_pass_is_trusted(self):
+        self.assertFalse(self.needs_recheck(True, "테두리가 전혀 없는 이미지입니다."))
+
+    def test_fail_with_border_keyword_is_trusted(self):
+        self.assertFalse(self.needs_recheck(False, "이미지 외곽에 빨간색 테두리가 있습니다."))
+
+    def test_fail_without_border_keyword_is_rechecked(self):
+        self.assertTrue(self.needs_recheck(False, "워터마크가 포함되어 있습니다."))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+"""
+이미지 핸들러 테두리 탐지용 디코딩 테스트
+"""
+
+import io
+import unittest
+
+try:
+    import cv2
+    import numpy as np
+    from PIL import Image
+    from src.handlers.image_handler import ImageHandler
+    _IMPORT_ERROR = None
+except ImportError as e:  # OpenCV/PIL 등 이미지 처리 의존성이 없는 환경
+    _IMPORT_ERROR = e
+
+
+def _jpeg_bytes(mode: str, color: tuple) -> bytes:
+    """단색 JPEG 이미지 바이트 생성"""
+    buffer = io.BytesIO()
+    Image.new(mode, (32, 24), color).save(buffer, 'JPEG', quality=95)
+    return buffer.getvalue()
+
+
+def _pil_bgr(image_bytes: bytes):
+    """기존 방식(PIL RGB 변환 → BGR)으로 디코딩"""
+    with Image.open(io.BytesIO(image_bytes)) as img:
+        return cv2.cvtColor(np.asarray(img.convert('RGB')), cv2.COLOR_RGB2BGR)
+
+
+@unittest.skipIf(_IMPORT_ERROR is not None, f"이미지 처리 의존성 없음: {_IMPORT_ERROR}")
+class DecodeBgrTest(unittest.TestCase):
+    """_decode_bgr 디코딩 결과"""
+
+    def test_cmyk_jpeg_matches_pil_conversion(self):
+        image_bytes = _jpeg_bytes('CMYK', (10, 200, 30, 40))
+        self.assertEqual(ImageHandler._jpeg_sof_header(image_bytes), (32, 24, 4))
+        np.testing.assert_array_equal(ImageHandler._decode_bgr(image_bytes), _pil_bgr(image_bytes))
+
+    def test_rgb_jpeg_is_decoded_by_opencv(self):
+        image_bytes = _jpeg_bytes('RGB', (200, 30, 10))
+        self.assertEqual(ImageHandler._jpeg_sof_header(image_bytes), (32, 24, 3))
+        self.assertEqual(ImageHandler._decode_bgr(image_bytes).shape, (24, 32, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,7 @@
 
 import os
 import sys
+from typing import TYPE_CHECKING
 from dotenv import load_dotenv
 
 # 환경 변수를 가장 먼저 로드
@@ -13,9 +14,51 @@ load_dotenv()
 
 import streamlit as st
 import asyncio
-from src.models.app_config import AppConfig
-from src.services.two_stage_inspection_service import TwoStageInspectionService
-from src.ui.streamlit_app import StreamlitApp
+import cv2
+
+if TYPE_CHECKING:
+    from src.services.two_stage_inspection_service import TwoStageInspectionService
+
+# OpenCV 최적화(SIMD) 경로와 내부 스레드 풀을 프로세스 시작 시 한 번 설정
+cv2.setUseOptimized(True)
+cv2.setNumThreads(os.cpu_count() or 1)
+
+
+# 사용 기술 소개 (열마다 마크다운 한 번으로 렌더링)
+_STAGE1_TECH_MARKDOWN = """**1단계 - 테두리 탐지**
+
+- 🔍 OpenCV 컴퓨터 비전
+- 📐 엣지 검출 알고리즘
+- 🎨 색상 분석"""
+
+_STAGE2_TECH_MARKDOWN = """**2단계 - AI 검수**
+
+- 🤖 AWS Bedrock Nova Pro/Lite
+- 💾 DynamoDB 결과 저장
+- 📊 상세 검수 리포트"""
+
+
+@st.cache_resource(show_spinner="2단계 검수 서비스 초기화 중...")
+def _get_inspection_service() -> "TwoStageInspectionService":
+    """
+    2단계 검수 서비스를 프로세스 전체에서 한 번만 생성/초기화
+    (boto3를 끌어오는 서비스 모듈은 첫 호출 때 가져오고, 재실행마다 이벤트 루프를 새로 만들지 않음)
+    
+    초기화에 실패하면 예외를 던져 결과가 캐시되지 않게 하므로 다음 재실행에서 다시 시도합니다.
+    
+    Returns:
+        TwoStageInspectionService: 초기화된 2단계 검수 서비스
+        
+    Raises:
+        RuntimeError: 서비스 초기화 실패 시
+    """
+    from src.models.app_config import AppConfig
+    from src.services.two_stage_inspection_service import TwoStageInspectionService
+    
+    service = TwoStageInspectionService(AppConfig.from_env())
+    if not asyncio.run(service.initialize()):
+        raise RuntimeError("2단계 검수 서비스 초기화에 실패했습니다.")
+    return service
 
 def main():
     """메인 애플리케이션 실행"""
@@ -28,23 +71,13 @@ def main():
             initial_sidebar_state="collapsed"
         )
         
-        # 애플리케이션 설정 로드
-        config = AppConfig.from_env()
-        
-        # 2단계 검수 서비스 초기화
-        inspection_service = TwoStageInspectionService(config)
-        
-        # 비동기 초기화
-        async def init_service():
-            return await inspection_service.initialize()
-        
-        # 초기화 실행
-        with st.spinner("2단계 검수 서비스 초기화 중..."):
-            if not asyncio.run(init_service()):
-                st.error("❌ 2단계 검수 서비스 초기화에 실패했습니다.")
-                st.stop()
-            else:
-                st.success("✅ 2단계 검수 서비스 초기화 완료!")
+        # 2단계 검수 서비스 초기화 (프로세스 전체에서 한 번, 이후 재실행은 캐시 사용)
+        try:
+            inspection_service = _get_inspection_service()
+        except RuntimeError as e:
+            st.error(f"❌ {e}")
+            st.stop()
+        st.success("✅ 2단계 검수 서비스 초기화 완료!")
         
         # 2단계 검수 설명
         st.markdown("### 🔄 2단계 검수 시스템")
@@ -56,18 +89,12 @@ def main():
         # 기술 스택 정보 추가
         st.markdown("#### 🛠️ 사용 기술")
         col1, col2 = st.columns(2)
-        with col1:
-            st.markdown("**1단계 - 테두리 탐지**")
-            st.markdown("- 🔍 OpenCV 컴퓨터 비전")
-            st.markdown("- 📐 엣지 검출 알고리즘")
-            st.markdown("- 🎨 색상 분석")
-        with col2:
-            st.markdown("**2단계 - AI 검수**")
-            st.markdown("- 🤖 AWS Bedrock Nova Pro/Lite")
-            st.markdown("- 💾 DynamoDB 결과 저장")
-            st.markdown("- 📊 상세 검수 리포트")
+        col1.markdown(_STAGE1_TECH_MARKDOWN)
+        col2.markdown(_STAGE2_TECH_MARKDOWN)
         
         # Streamlit 앱 실행 (2단계 서비스 주입)
+        from src.ui.streamlit_app import StreamlitApp
+        
         app = StreamlitApp(inspection_service=inspection_service)
         app.run()
         